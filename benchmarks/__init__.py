@@ -0,0 +1,27 @@
+"""
+Microbenchmarks for the hot paths in the_blood and composer.
+
+Each module can be run on its own from the repository root, e.g.
+
+    python -m benchmarks.pitch_map
+"""
+import timeit
+
+
+#######################################################################
+def run(label, statement, number=10000, repeat=5):
+    """
+    Time a zero-argument callable and print the best microseconds per call.
+    """
+    seconds = min(timeit.repeat(statement, number=number, repeat=repeat))
+    per_call = seconds / number * 1e6
+    print('{label:<50} {per_call:>10.3f} us/call'.format(label=label, per_call=per_call))
+    return per_call
+
+
+#######################################################################
+def compare(label, old, new):
+    """
+    Print how many times faster `new` is than `old`.
+    """
+    print('{label:<50} {speedup:>10.1f}x faster'.format(label=label, speedup=old / new))
@@ -0,0 +1,38 @@
+"""
+Accelerometer translation: translate_batch over a recorded array of samples
+against calling translate() once per sample.
+"""
+from unittest import mock
+
+import numpy
+
+from benchmarks import compare, run
+from composer.translators import accelerometer
+from the_blood.models import *
+
+
+#######################################################################
+def translate_each(acc, x, y, z):
+    notes = []
+    for values in zip(x, y, z):
+        acc.x, acc.y, acc.z = values
+        notes.append(acc.translate())
+    return notes
+
+
+#######################################################################
+def main():
+    acc = accelerometer.MockAccelerometer(accelerometer.AccelerometerStrategy, Key('C'), 120)
+    random = numpy.random.default_rng(0)
+
+    for size in (100, 10000):
+        x, y, z = random.integers(accelerometer.ACC_MIN, accelerometer.ACC_MAX + 1, size=(3, size))
+        lists = x.tolist(), y.tolist(), z.tolist()
+        with mock.patch('builtins.print'):
+            old = run('translate() x {}'.format(size), lambda: translate_each(acc, *lists), number=5)
+        new = run('translate_batch() x {}'.format(size), lambda: acc.translate_batch(x, y, z), number=5)
+        compare('{} samples'.format(size), old, new)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Accelerometer strategy: per-sample latency of the lookup tables against the
+arithmetic they were compiled from.
+"""
+import math
+
+from benchmarks import compare, run
+from composer import midi
+from composer.translators import accelerometer
+from composer.translators.accelerometer import *
+from the_blood.models import *
+
+strategy = accelerometer.AccelerometerStrategy
+
+
+#######################################################################
+def arithmetic_get_pitch(x):
+    # The original _AccelerometerStrategy methods, kept here as the baseline.
+    if x > PITCH_UNIT * 43:
+        return strategy.middle_f_and_higher[-1]
+    elif x <= PITCH_UNIT * 43 * -1:
+        return strategy.pitches_lower_than_middle_f[0]
+
+    index = int(x / PITCH_UNIT)
+    if index < 0:
+        return strategy.pitches_lower_than_middle_f[index]
+    else:
+        return strategy.middle_f_and_higher[index]
+
+
+#######################################################################
+def arithmetic_get_velocity(y):
+    assert ACC_MIN <= y <= ACC_MAX
+    if y == 0:
+        return midi.MAX_VELOCITY
+    elif abs(y) >= ACC_MAX - VELOCITY_UNIT - 1:
+        return 0
+    return abs(abs(int(y / VELOCITY_UNIT)) - 127)
+
+
+#######################################################################
+def arithmetic_get_note_value(z):
+    assert ACC_MIN <= z <= ACC_MAX
+    if abs(z) >= ACC_MAX - NOTE_VALUE_REMAINDER:
+        return WholeNote
+    index = math.floor(abs(z/NOTE_VALUE_UNIT))
+    sorted_by_factor = sorted(NOTE_VALUES.values(), key=lambda nv: nv.factor, reverse=True)
+    return sorted_by_factor[index]
+
+
+#######################################################################
+def main():
+    for value in (-20000, 0, 12345):
+        old = run('arithmetic: get_pitch({})'.format(value), lambda: arithmetic_get_pitch(value))
+        new = run('table: get_pitch({})'.format(value), lambda: strategy.get_pitch(value))
+        compare('get_pitch({})'.format(value), old, new)
+
+        old = run('arithmetic: get_velocity({})'.format(value), lambda: arithmetic_get_velocity(value))
+        new = run('table: get_velocity({})'.format(value), lambda: strategy.get_velocity(value))
+        compare('get_velocity({})'.format(value), old, new)
+
+        old = run('arithmetic: get_note_value({})'.format(value), lambda: arithmetic_get_note_value(value))
+        new = run('table: get_note_value({})'.format(value), lambda: strategy.get_note_value(value))
+        compare('get_note_value({})'.format(value), old, new)
+
+    def arithmetic_sample():
+        return arithmetic_get_pitch(12345), arithmetic_get_velocity(-20000), arithmetic_get_note_value(5000)
+
+    def table_sample():
+        return strategy.get_pitch(12345), strategy.get_velocity(-20000), strategy.get_note_value(5000)
+
+    old = run('arithmetic: one sample', arithmetic_sample)
+    new = run('table: one sample', table_sample)
+    compare('one sample', old, new)
+
+
+if __name__ == '__main__':
+    main()
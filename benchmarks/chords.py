@@ -0,0 +1,43 @@
+"""
+Chord spelling and recognition: the CHORD_SPELLINGS cache and the
+CHORD_TABLE mask lookup against building every chord and comparing notes.
+"""
+from benchmarks import compare, run
+from the_blood.models import *
+
+ROOTS = ('C', 'C#', 'Db', 'D', 'Eb', 'E', 'F', 'F#', 'Gb', 'G', 'Ab', 'A', 'Bb', 'B')
+
+
+#######################################################################
+def brute_force(names):
+    # Spell every chord on every root and compare pitch classes one chord at a time.
+    pitch_classes = {Note(name).pitch_class for name in names}
+    for quality in CHORD_DEGREES:
+        for root in ROOTS:
+            chord = Chord(root + quality)
+            if {note.pitch_class for note in chord.notes} == pitch_classes:
+                return chord.name
+    return None
+
+
+#######################################################################
+def uncached_spelling(name):
+    CHORD_SPELLINGS.clear()
+    root, quality = Note(name[0]), name[1:]
+    return spell_chord(root, quality)
+
+
+#######################################################################
+def main():
+    old = run('spell_chord, uncached: Bm7', lambda: uncached_spelling('Bm7'), number=1000)
+    new = run('spell_chord, cached: Bm7', lambda: spell_chord(B, MINOR + SEVENTH))
+    compare('spelling', old, new)
+
+    for query in (['E', 'G', 'C'], ['F', 'A', 'C', 'Eb', 'G'], ['C', 'D']):
+        old = run('brute force: {}'.format(query), lambda: brute_force(query), number=100)
+        new = run('identify_chord: {}'.format(query), lambda: identify_chord(query))
+        compare('recognition', old, new)
+
+
+if __name__ == '__main__':
+    main()
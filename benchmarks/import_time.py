@@ -0,0 +1,54 @@
+"""
+Import time of the_blood.models, from `python -X importtime` in a fresh
+interpreter each time, against IMPORT_BUDGET_MS.
+
+    python -m benchmarks.import_time [repeat]
+
+Bytecode is cached in a temporary directory and warmed up first, so the
+numbers are the module's own work and not compiling it.
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+MODULE = 'the_blood.models'
+
+# Median cumulative milliseconds on a desktop CPython. It was 21 ms with every table built on import.
+IMPORT_BUDGET_MS = 12.0
+
+
+#######################################################################
+def import_time(module, environment):
+    """
+    The cumulative microseconds `python -X importtime` reports for `module`.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+                            env=environment, capture_output=True, text=True, check=True)
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        timings = line.split('|')
+        if len(timings) == 3 and timings[2].strip() == module:
+            return int(timings[1])
+    raise RuntimeError('{} was already imported by the interpreter.'.format(module))
+
+
+#######################################################################
+def main(repeat=20):
+    with tempfile.TemporaryDirectory() as directory:
+        environment = dict(os.environ, PYTHONPYCACHEPREFIX=directory)
+        environment.pop('PYTHONDONTWRITEBYTECODE', None)
+        import_time(MODULE, environment)
+        timings = sorted(import_time(MODULE, environment) / 1000 for _ in range(repeat))
+
+    median = statistics.median(timings)
+    print('{label:<50} {ms:>10.2f} ms'.format(label='import {}, median of {}'.format(MODULE, repeat), ms=median))
+    print('{label:<50} {ms:>10.2f} ms'.format(label='import {}, fastest'.format(MODULE), ms=timings[0]))
+    verdict = 'within' if median <= IMPORT_BUDGET_MS else 'OVER'
+    print('{label:<50} {ms:>10.2f} ms ({verdict})'.format(label='budget', ms=IMPORT_BUDGET_MS, verdict=verdict))
+    return median
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
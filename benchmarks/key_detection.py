@@ -0,0 +1,75 @@
+"""
+Streaming key detection: KeyEstimator's running correlations against
+rebuilding the decayed histogram and correlating it with every key profile
+after each note.
+"""
+import math
+import random
+
+from benchmarks import compare, run
+from the_blood.key_detection import KeyEstimator, MAJOR_PROFILE, MINOR_PROFILE
+from the_blood.models import *
+
+
+#######################################################################
+def _correlation(xs, ys):
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    dx = [x - x_mean for x in xs]
+    dy = [y - y_mean for y in ys]
+    denominator = math.sqrt(sum(x * x for x in dx) * sum(y * y for y in dy))
+    return sum(x * y for x, y in zip(dx, dy)) / denominator if denominator else 0.0
+
+
+#######################################################################
+def rescan(pitch_classes, decay, keys):
+    # Keep every note heard, and after each one weigh them all again and
+    # correlate the histogram with all 24 rotated profiles.
+    history = []
+    best = None
+    for pitch_class in pitch_classes:
+        history.append(pitch_class)
+        histogram = [0.0] * PITCH_CLASS_COUNT
+        weight = 1.0
+        for heard in reversed(history):
+            histogram[heard] += weight
+            weight *= decay
+        scores = []
+        for i, key in enumerate(keys):
+            profile = MAJOR_PROFILE if i < PITCH_CLASS_COUNT else MINOR_PROFILE
+            tonic = key.tonic.pitch_class
+            rotated = [profile[(pc - tonic) % PITCH_CLASS_COUNT] for pc in range(PITCH_CLASS_COUNT)]
+            scores.append(_correlation(histogram, rotated))
+        best = keys[scores.index(max(scores))]
+    return best
+
+
+#######################################################################
+def stream(pitch_classes, estimator):
+    estimator.reset()
+    for pitch_class in pitch_classes:
+        estimator.add_pitch_class(pitch_class)
+        estimator.key
+    return estimator.key
+
+
+#######################################################################
+def main():
+    random.seed(0)
+    c_major = [note.pitch_class for note in Key('C').notes]
+    pitch_classes = [random.choice(c_major) for _ in range(200)]
+    estimator = KeyEstimator()
+
+    old = run('rescan, 200 notes', lambda: rescan(pitch_classes, estimator.decay, estimator.keys), number=2)
+    new = run('KeyEstimator, 200 notes', lambda: stream(pitch_classes, estimator), number=100)
+    compare('key after every note', old, new)
+
+    per_note = run('KeyEstimator.add_pitch_class', lambda: estimator.add_pitch_class(7), number=100000)
+    print('{label:<50} {rate:>10.0f} notes/s'.format(label='add_pitch_class', rate=1e6 / per_note))
+    print('{label:<50} {rate:>10.0f} notes/s'.format(label='add_pitch_class + key', rate=200e6 / new))
+    per_note = run('KeyEstimator.add(Note)', lambda: estimator.add('F#'), number=100000)
+    print('{label:<50} {rate:>10.0f} notes/s'.format(label='add(Note)', rate=1e6 / per_note))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""
+MIDI numbers: ComposedNote's octave arithmetic against the original
+walk over PianoRange.
+"""
+from benchmarks import compare, run
+from composer import midi
+from composer.compose import ComposedNote
+from the_blood.models import *
+
+
+#######################################################################
+def scanning_midi_number(composed_note):
+    # The original get_midi_number_from_note, kept here as the baseline.
+    for midi_number, pitch in enumerate(PianoRange, start=midi.A0_MIDI_NUMBER):
+        if pitch == composed_note.pitch:
+            return midi_number
+
+
+#######################################################################
+def main():
+    for note in (ComposedNote('A', 0), ComposedNote('F', 4), ComposedNote('C', 8)):
+        old = run('scan: get_midi_number_from_note({})'.format(note), lambda: scanning_midi_number(note))
+        new = run('arithmetic: get_midi_number_from_note({})'.format(note),
+                  lambda: midi.get_midi_number_from_note(note))
+        compare(str(note), old, new)
+
+    run('ComposedNote("F", 4)', lambda: ComposedNote('F', 4))
+    f4 = ComposedNote('F', 4)
+    run('MidiNote(F4, ...)', lambda: midi.MidiNote(f4, 100, duration=0.5))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Note: interned, __slots__ Notes against the original class, which
+parsed every construction and kept its attributes in a __dict__.
+"""
+import sys
+import tracemalloc
+
+from benchmarks import compare, run
+from the_blood.models import *
+
+
+#######################################################################
+class LegacyNote:
+    # The original Note, kept here as the baseline.
+
+    def __init__(self, note):
+        name = note[:1].upper().strip()
+        assert name in NATURAL_NOTES, '"{}" is not a valid note.'.format(name)
+        quality = note[1:].replace("-", "").replace("_", "").lower().strip()
+        if quality:
+            quality = SHARPS_AND_FLATS[quality]
+        self.__name = '{}{}'.format(name, quality)
+        self.__quality = Quality(quality)
+
+    @property
+    def name(self):
+        return self.__name
+
+    @property
+    def quality(self):
+        return self.__quality
+
+    def __eq__(self, other):
+        if not isinstance(other, LegacyNote):
+            raise TypeError('Cannot compare type Note to type "{}"'.format(type(other)))
+        return hash(self) == hash(other)
+
+    def __hash__(self):
+        return hash(tuple((self.name, self.quality)))
+
+
+#######################################################################
+def allocated_bytes(factory, count):
+    tracemalloc.start()
+    notes = [factory('C#') for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del notes
+    return size
+
+
+#######################################################################
+def main():
+    old = run('LegacyNote("C#")', lambda: LegacyNote('C#'))
+    new = run('Note("C#")', lambda: Note('C#'))
+    compare('construction', old, new)
+
+    legacy_c_sharp = LegacyNote('C#')
+    old = run('hash(LegacyNote)', lambda: hash(legacy_c_sharp), number=100000)
+    new = run('hash(Note)', lambda: hash(C_sharp), number=100000)
+    compare('hash', old, new)
+
+    legacy_b_major = tuple(LegacyNote(n) for n in Key('B').note_names)
+    legacy_a_sharp = LegacyNote('A#')
+    b_major = Key('B').notes
+    old = run('LegacyNote("A#") in B major', lambda: legacy_a_sharp in legacy_b_major, number=100000)
+    new = run('Note("A#") in B major', lambda: A_sharp in b_major, number=100000)
+    compare('membership', old, new)
+
+    count = 100000
+    old = allocated_bytes(LegacyNote, count)
+    new = allocated_bytes(Note, count)
+    print('{:<50} {:>10} bytes'.format('{} x LegacyNote("C#")'.format(count), old))
+    print('{:<50} {:>10} bytes'.format('{} x Note("C#")'.format(count), new))
+
+    legacy_size = sys.getsizeof(legacy_c_sharp) + sys.getsizeof(legacy_c_sharp.__dict__)
+    print('{:<50} {:>10} bytes'.format('one LegacyNote instance', legacy_size))
+    print('{:<50} {:>10} bytes'.format('one Note instance', sys.getsizeof(C_sharp)))
+
+
+if __name__ == '__main__':
+    main()
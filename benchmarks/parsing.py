@@ -0,0 +1,77 @@
+"""
+Name parsing: the compiled grammar in the_blood.parsing, with and without
+its caches, against the original replace/lower/strip parsing that built a
+Note for each character it tried.
+"""
+from benchmarks import compare, run
+from the_blood import parsing
+from the_blood.models import *
+
+NOTE_NAMES = ('C', 'c#', 'D flat', 'E double flat', 'F##', 'G sharp', 'Ab', 'B')
+KEY_AND_CHORD_NAMES = ('A', 'Am', 'A minor', 'Bb maj7', 'C#m7', 'F#min', 'Eb9', 'G11')
+
+
+#######################################################################
+def original_note(note):
+    # The original Note parsing, kept here as the baseline.
+    name = note[:1].upper().strip()
+    assert name in NATURAL_NOTES, '"{}" is not a valid note.'.format(name)
+    quality = note[1:].replace("-", "").replace("_", "").lower().strip()
+    if quality:
+        try:
+            quality = SHARPS_AND_FLATS[quality]
+        except KeyError:
+            raise InvalidNoteError('"{}" is not a valid note.'.format(note))
+    return name, quality
+
+
+#######################################################################
+def original_quality(quality):
+    cleaned = quality.lower().strip().replace(' ', '')
+    try:
+        return QUALITIES[cleaned]
+    except KeyError:
+        raise InvalidQualityError('"{}" is not a valid quality.'.format(quality))
+
+
+#######################################################################
+def original_name(element_name):
+    # The original _get_note_and_quality_from_music_element, trying a longer note per character.
+    element_name = element_name.strip()
+    name, accidental = original_note(element_name[0])
+    for char in element_name[1:]:
+        try:
+            name, accidental = original_note(name + accidental + char)
+        except InvalidNoteError:
+            break
+    quality = element_name[len(name + accidental):]
+    return name, accidental, original_quality(quality) if quality else ''
+
+
+#######################################################################
+def parse_all(parse, names):
+    for name in names:
+        parse(name)
+
+
+#######################################################################
+def main():
+    for label, original, parse, cache, names in (
+        ('notes', original_note, parsing.parse_note, parsing.PARSED_NOTES, NOTE_NAMES),
+        ('keys and chords', original_name, parsing.parse_name, parsing.PARSED_NAMES, KEY_AND_CHORD_NAMES),
+    ):
+        old = run('original: {} {}'.format(len(names), label), lambda: parse_all(original, names))
+        maxsize = cache.maxsize
+        cache.resize(0)
+        parsing.PARSED_QUALITIES.resize(0)
+        uncached = run('grammar, uncached: {} {}'.format(len(names), label), lambda: parse_all(parse, names))
+        cache.resize(maxsize)
+        parsing.PARSED_QUALITIES.resize(256)
+        new = run('grammar, cached: {} {}'.format(len(names), label), lambda: parse_all(parse, names))
+        compare(label + ', uncached', old, uncached)
+        compare(label + ', cached', old, new)
+        print('{label:<50} {rate:>10.0f} names/s'.format(label=label + ', cached', rate=len(names) * 1e6 / new))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Pitch: the __slots__ Pitch against the original class, which checked
+isinstance twice in every operator and carried a __dict__.
+"""
+import random
+import sys
+
+from benchmarks import compare, run
+from the_blood.models import *
+
+
+#######################################################################
+class LegacyPitch:
+    # The original Pitch comparison operators, kept here as the baseline.
+
+    def __init__(self, _float):
+        self._value = _float
+        if isinstance(_float, LegacyPitch):
+            _float = _float._value
+        self.value = float(_float)
+
+    def __eq__(self, other):
+        if isinstance(other, (float, int)):
+            return self._value == other
+        elif isinstance(other, LegacyPitch):
+            return self._value == other._value
+        else:
+            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+
+    def __lt__(self, other):
+        if isinstance(other, (float, int)):
+            return self._value < other
+        elif isinstance(other, LegacyPitch):
+            return self._value < other._value
+        else:
+            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+
+    def __le__(self, other):
+        if isinstance(other, (float, int)):
+            return self._value <= other
+        elif isinstance(other, LegacyPitch):
+            return self._value <= other._value
+        else:
+            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+
+    def __ge__(self, other):
+        if isinstance(other, (float, int)):
+            return self._value >= other
+        elif isinstance(other, LegacyPitch):
+            return self._value >= other._value
+        else:
+            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+
+
+#######################################################################
+def main():
+    hz = list(PITCHES.values())
+    random.Random(0).shuffle(hz)
+    legacy_pitches = [LegacyPitch(h) for h in hz]
+    pitches = [Pitch(h) for h in hz]
+
+    old = run('sorted(108 LegacyPitch)', lambda: sorted(legacy_pitches), number=1000)
+    new = run('sorted(108 Pitch)', lambda: sorted(pitches), number=1000)
+    compare('sorting', old, new)
+
+    low, high = LegacyPitch(27.50), LegacyPitch(4186.01)
+    old = run('filter 108 LegacyPitch to the piano', lambda: [p for p in legacy_pitches if low <= p <= high],
+              number=1000)
+    low, high = Pitch(27.50), Pitch(4186.01)
+    new = run('filter 108 Pitch to the piano', lambda: [p for p in pitches if low <= p <= high], number=1000)
+    compare('filtering against Pitches', old, new)
+
+    old = run('filter 108 LegacyPitch against a float', lambda: [p for p in legacy_pitches if p <= 329.63],
+              number=1000)
+    new = run('filter 108 Pitch against a float', lambda: [p for p in pitches if p <= 329.63], number=1000)
+    compare('filtering against a float', old, new)
+
+    legacy_size = sys.getsizeof(legacy_pitches[0]) + sys.getsizeof(legacy_pitches[0].__dict__)
+    print('{:<50} {:>10} bytes'.format('one LegacyPitch instance', legacy_size))
+    print('{:<50} {:>10} bytes'.format('one Pitch instance', sys.getsizeof(pitches[0])))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+Scale comparisons: PitchClassSet masks against the Note tuples they were built from.
+"""
+from benchmarks import compare, run
+from the_blood.models import *
+
+
+#######################################################################
+def main():
+    scales = [Scale(tonic, ScalePattern(name)) for name in SCALE_TO_INTERVALS_MAP
+              for tonic in ('C', 'G', 'D', 'A', 'E', 'B', 'F#', 'Db', 'Ab', 'Eb', 'Bb', 'F')]
+    masks = [scale.pitch_classes for scale in scales]
+    c_major = Key('C')
+    triad = (C, E, G)
+    triad_mask = PitchClassSet.from_notes(triad)
+
+    # Both sides count enharmonic spellings, so E# is in C major.
+    e_sharp = Note('E#')
+    pitch_classes = c_major.pitch_classes
+    old = run('notes: E# in C major', lambda: any(n.pitch_class == e_sharp.pitch_class for n in c_major.notes))
+    new = run('mask: E# in C major', lambda: e_sharp in pitch_classes)
+    compare('membership', old, new)
+
+    old = run('notes: scales sharing C major notes', lambda: [
+        s for s in scales if {n.pitch_class for n in s.notes} == {n.pitch_class for n in c_major.notes}], number=100)
+    new = run('mask: scales sharing C major notes', lambda: [
+        m for m in masks if m.mask == c_major.pitch_classes.mask], number=100)
+    compare('{} scale comparisons'.format(len(scales)), old, new)
+
+    old = run('notes: scales containing C E G', lambda: [
+        s for s in scales if all(any(n.pitch_class == t.pitch_class for n in s.notes) for t in triad)], number=100)
+    new = run('mask: scales containing C E G', lambda: [
+        m for m in masks if m.mask & triad_mask.mask == triad_mask.mask], number=100)
+    compare('{} subset tests'.format(len(scales)), old, new)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+PitchMap: the precomputed pitch index against the original linear scan
+over PITCHES.
+"""
+from benchmarks import compare, run
+from the_blood.models import *
+
+
+#######################################################################
+def linear_pitch_map(item):
+    # The original PitchMap, kept here as the baseline.
+    need_pitch = isinstance(item, tuple) and isinstance(item[0], Note) and isinstance(item[1], Octave)
+    need_note = isinstance(item, Pitch)
+
+    for notes_with_octaves, _pitch in PITCHES.items():
+        if need_note:
+            if _pitch == item:
+                notes = []
+                for note_with_octave in notes_with_octaves.split('/'):
+                    note = Note(note_with_octave[0] + note_with_octave[1:-1])
+                    notes.append((note, Octave(note_with_octave[-1])))
+                return tuple(notes)
+        elif need_pitch:
+            target_note, target_octave = item
+            for note_with_octave in notes_with_octaves.split('/'):
+                octave = Octave(note_with_octave[-1])
+                note = Note(note_with_octave[0] + note_with_octave[1:-1])
+                if target_note == note and target_octave == octave:
+                    return Pitch(_pitch)
+
+
+#######################################################################
+def main():
+    a4 = Pitch(440)
+    b8 = Pitch(7902.13)
+    a4_note = (A, Octave(4))
+
+    old = run('linear scan: pitch -> notes (A4)', lambda: linear_pitch_map(a4), number=2000)
+    new = run('index: pitch -> notes (A4)', lambda: PitchMap(a4))
+    compare('pitch -> notes (A4)', old, new)
+
+    old = run('linear scan: pitch -> notes (B8, worst case)', lambda: linear_pitch_map(b8), number=500)
+    new = run('index: pitch -> notes (B8, worst case)', lambda: PitchMap(b8))
+    compare('pitch -> notes (B8)', old, new)
+
+    old = run('linear scan: (note, octave) -> pitch (A4)', lambda: linear_pitch_map(a4_note), number=200)
+    new = run('index: (note, octave) -> pitch (A4)', lambda: PitchMap(a4_note))
+    compare('(note, octave) -> pitch (A4)', old, new)
+
+
+if __name__ == '__main__':
+    main()
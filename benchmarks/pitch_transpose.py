@@ -0,0 +1,41 @@
+"""
+Pitch.increase: the semitone index against the original scan over PITCHES.
+"""
+from benchmarks import compare, run
+from the_blood.models import *
+
+
+#######################################################################
+def scanning_increase(pitch, semitones):
+    # The original Pitch.increase, kept here as the baseline.
+    increased = 0
+    for hz in PITCHES.values():
+        if hz > pitch.value:
+            increased += 1
+        if increased == semitones:
+            break
+    return Pitch(hz)
+
+
+#######################################################################
+def main():
+    a0 = Pitch(27.50)
+    a4 = Pitch(440)
+
+    for label, pitch in (('A0', a0), ('A4', a4)):
+        old = run('scan: increase({}, 1)'.format(label), lambda: scanning_increase(pitch, 1))
+        new = run('index: increase({}, 1)'.format(label), lambda: pitch.increase(1))
+        compare('increase({}, 1)'.format(label), old, new)
+
+    new = run('index: Scale(C, MajorScale)', lambda: Scale(C, MajorScale), number=1000)
+    original_increase = Pitch.increase
+    Pitch.increase = scanning_increase
+    try:
+        old = run('scan: Scale(C, MajorScale)', lambda: Scale(C, MajorScale), number=1000)
+    finally:
+        Pitch.increase = original_increase
+    compare('Scale(C, MajorScale)', old, new)
+
+
+if __name__ == '__main__':
+    main()
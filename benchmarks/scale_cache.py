@@ -0,0 +1,26 @@
+"""
+Scale, Mode and Key construction with and without SCALE_CACHE.
+"""
+from benchmarks import compare, run
+from the_blood.models import *
+
+
+#######################################################################
+def main():
+    maxsize = SCALE_CACHE.maxsize
+    cases = (
+        ("Key('Bb')", lambda: Key('Bb')),
+        ("Scale(F#, MajorScale)", lambda: Scale(F_sharp, MajorScale)),
+        ("Mode(Eb, DorianScale)", lambda: Mode(E_flat, DorianScale)),
+    )
+    for label, build in cases:
+        SCALE_CACHE.resize(0)
+        old = run('uncached: ' + label, build, number=1000)
+        SCALE_CACHE.resize(maxsize)
+        new = run('cached: ' + label, build, number=1000)
+        compare(label, old, new)
+    print(SCALE_CACHE.info())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Which scales contain these notes: the ScaleIndex against building every
+Key and Mode and checking each one's notes.
+"""
+from benchmarks import compare, run
+from the_blood.models import *
+from the_blood.scale_index import ScaleIndex
+
+
+#######################################################################
+def brute_force(names):
+    # Build every scale on every tonic and test membership note by note.
+    pitch_classes = {Note(name).pitch_class for name in names}
+    found = []
+    for scale_name in SCALE_TO_INTERVALS_MAP:
+        for name in NATURAL_NOTES:
+            for quality in (NATURAL, SHARP, FLAT):
+                try:
+                    scale = Scale(Note(name + quality), ScalePattern(scale_name))
+                except InvalidKeyError:
+                    continue
+                if pitch_classes <= {note.pitch_class for note in scale.notes}:
+                    found.append(scale)
+    return found
+
+
+#######################################################################
+def main():
+    run('ScaleIndex()', lambda: ScaleIndex(), number=10)
+    query = ['C', 'E', 'G']
+
+    old = run('brute force: {}'.format(query), lambda: brute_force(query), number=100)
+    uncached = ScaleIndex(answers_cache_size=0)
+    new = run('index: {}'.format(query), lambda: uncached.containing(query), number=1000)
+    compare('uncached', old, new)
+
+    cached = ScaleIndex()
+    new = run('index, cached: {}'.format(query), lambda: cached.containing(query))
+    compare('cached', old, new)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+Building every Key and Mode from the precomputed scale table against
+calculating them from the pitch tables. SCALE_CACHE is turned off so
+every construction does the work.
+"""
+from benchmarks import compare, run
+from the_blood import models
+from the_blood.generate_scale_table import get_tonics
+from the_blood.models import *
+
+
+#######################################################################
+def build_everything():
+    for name in MAJOR_KEY_NAMES + MINOR_KEY_NAMES:
+        Key(name)
+    for tonic in get_tonics():
+        for mode in MODAL_SCALES:
+            Mode(tonic, mode)
+
+
+#######################################################################
+def main():
+    maxsize = SCALE_CACHE.maxsize
+    SCALE_CACHE.resize(0)
+    table = models.SCALE_NOTES
+    try:
+        models.SCALE_NOTES = {}
+        old = run('calculated: 30 Keys + 147 Modes', build_everything, number=20)
+        models.SCALE_NOTES = table
+        new = run('table: 30 Keys + 147 Modes', build_everything, number=20)
+        compare('30 Keys + 147 Modes', old, new)
+    finally:
+        models.SCALE_NOTES = table
+        SCALE_CACHE.resize(maxsize)
+
+
+if __name__ == '__main__':
+    main()
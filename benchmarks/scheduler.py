@@ -0,0 +1,31 @@
+"""
+Note-offs: one NoteOffScheduler.pop_due against asking every sounding
+MidiNote for its end command, the way the device loop used to poll.
+"""
+from benchmarks import compare, run
+from composer.compose import ComposedNote
+from composer.midi import MidiNote
+from composer.scheduler import NoteOffScheduler
+
+
+#######################################################################
+def poll(midi_notes):
+    # The original loop called get_end_command, and so the clock, on every note.
+    return [command for command in (n.get_end_command() for n in midi_notes) if command]
+
+
+#######################################################################
+def main():
+    for size in (1, 8):
+        midi_notes = [MidiNote(ComposedNote('C', 4), 100, duration=60 + i) for i in range(size)]
+        scheduler = NoteOffScheduler()
+        for midi_note in midi_notes:
+            scheduler.schedule(midi_note)
+
+        old = run('poll {} notes'.format(size), lambda: poll(midi_notes))
+        new = run('pop_due with {} notes'.format(size), lambda: scheduler.pop_due())
+        compare('{} sounding notes'.format(size), old, new)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+Snapping a pitch into the key: reading the translator's snap table against
+retrying ComposedNote.from_pitch a semitone higher after each miss.
+"""
+from benchmarks import compare, run
+from composer.compose import ComposedNote, SNAP_UP, build_snap_table
+from the_blood.models import *
+
+
+#######################################################################
+def retry_up(pitch, key):
+    # The original AccelerometerTranslator.translate loop, kept here as the baseline.
+    composed_note = None
+    while composed_note is None:
+        try:
+            composed_note = ComposedNote.from_pitch(pitch, key.notes)
+        except UnavailableNoteError:
+            pitch = pitch.increase(semitones=1)
+    return composed_note
+
+
+#######################################################################
+def main():
+    key = Key('C')
+    table = build_snap_table(key, SNAP_UP)
+    piano = list(PianoRange)
+
+    for pitch in (Pitch(349.23), Pitch(369.99)):  # F4 is in C major, F#4 is not
+        index = piano.index(pitch)
+        old = run('retry: {}'.format(pitch), lambda: retry_up(pitch, key))
+        new = run('table: {}'.format(pitch), lambda: table[index])
+        compare(str(pitch), old, new)
+
+    run('build_snap_table(Key("C"))', lambda: build_snap_table(key, SNAP_UP), number=100)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+Text translation: CHAR_TO_DEGREE byte tables, and the per-word phrase cache
+in front of them, against looking up each character in string.ascii_lowercase.
+"""
+import string
+
+from benchmarks import compare, run
+from composer.translators import text
+from composer.translators.text import TextTranslator
+
+SENTENCE = 'It was the best of times, it was the worst of times, it was the age of wisdom. '
+
+
+#######################################################################
+def legacy_phrase(translator, word):
+    # The original _calculate_melody and _get_note_from_char, kept here as the baseline.
+    phrase = []
+    for char in word:
+        char = char.lower()
+        if char in string.ascii_lowercase:
+            i = string.ascii_lowercase.index(char)
+            while i > 6:
+                i -= 7
+            phrase.append(translator.key.scale[i])
+    return tuple(phrase)
+
+
+#######################################################################
+def main():
+    translator = TextTranslator('This is', non_letters=text.SKIP)
+    for word in ('a', 'sentence', 'incomprehensibilities'):
+        old = run('per char: {}'.format(word), lambda: legacy_phrase(translator, word))
+        new = run('table: {}'.format(word), lambda: translator._translate_word(word))
+        compare(word, old, new)
+        new = run('cached: {}'.format(word), lambda: translator._get_phrase(word))
+        compare(word, old, new)
+
+    book = SENTENCE * 2000
+    words = book.split()
+    old = run('per char: {} words'.format(len(words)), lambda: [legacy_phrase(translator, w) for w in words], number=5)
+    new = run('table: {} words'.format(len(words)), lambda: [translator._translate_word(w) for w in words], number=5)
+    compare('{} words'.format(len(words)), old, new)
+    new = run('cached: {} words'.format(len(words)), lambda: [translator._get_phrase(w) for w in words], number=5)
+    compare('{} words'.format(len(words)), old, new)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+translate_many: wall time for the same set of documents with 1 to N worker processes.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from composer import translate_many
+
+PARAGRAPH = ('It was the best of times, it was the worst of times, it was the age of wisdom, '
+             'it was the age of foolishness, it was the epoch of belief. ') * 50
+
+
+#######################################################################
+def main(documents=16, max_workers=None):
+    """
+    Doubles the workers from 1 up to max_workers (one per CPU by default,
+    or the first command line argument).
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for i in range(documents):
+            path = os.path.join(directory, 'document{}.txt'.format(i))
+            with open(path, 'w') as f:
+                f.write(PARAGRAPH * (1 + i % 4))
+            paths.append(path)
+
+        baseline = None
+        workers = 1
+        while workers <= max_workers:
+            started = time.perf_counter()
+            translate_many.translate_many(paths, os.path.join(directory, 'out'), workers=workers)
+            seconds = time.perf_counter() - started
+            baseline = baseline or seconds
+            print('{label:<50} {seconds:>10.3f} s {speedup:>6.1f}x'.format(
+                label='{} documents, {} workers'.format(documents, workers), seconds=seconds, speedup=baseline / seconds))
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main(max_workers=int(sys.argv[1]) if len(sys.argv) > 1 else None)
@@ -0,0 +1,76 @@
+"""
+Transpose: one vectorized step over a whole sequence against moving each
+note's pitch and searching PitchMap for a spelling, one note at a time.
+"""
+import random
+
+from benchmarks import compare, run
+from composer.compose import ComposedNote
+from the_blood.models import *
+
+SEQUENCE_LENGTH = 100000
+
+# The speedup asked for over the one-note-at-a-time baseline.
+TARGET_SPEEDUP = 100
+
+
+#######################################################################
+def transpose_one_at_a_time(notes, semitones, quality_to_use=None):
+    # The original Transpose._transpose, kept here as the baseline.
+    transposed = []
+    for note in notes:
+        pitch = Pitch(PitchMap((note, Octave(4))))
+        transposed_pitch = pitch.increase(semitones) if semitones >= 0 else pitch.decrease(-semitones)
+        best_match = None
+        for matching_note, octave in PitchMap(transposed_pitch):
+            if matching_note.is_natural:
+                best_match = matching_note
+                break
+            if quality_to_use and matching_note.quality == quality_to_use:
+                best_match = matching_note
+            elif best_match:
+                if not (best_match.is_standard_flat or best_match.is_standard_sharp):
+                    best_match = matching_note
+            elif not best_match:
+                best_match = matching_note
+        transposed.append(best_match)
+    return transposed
+
+
+#######################################################################
+def main():
+    import numpy as np
+
+    random.seed(0)
+    notes = [random.choice(SHARP_SPELLING) for _ in range(SEQUENCE_LENGTH)]
+    label = '{} notes up a third'.format(SEQUENCE_LENGTH)
+
+    old = run('one at a time: ' + label, lambda: transpose_one_at_a_time(notes, 4), number=1, repeat=1)
+    new = run('Transpose: ' + label, lambda: Transpose(notes).up.third, number=5, repeat=3)
+    compare('Notes', old, new)
+    per_note = run('Transpose per note: ' + label, lambda: [Transpose(note).up.third for note in notes],
+                   number=1, repeat=1)
+    compare('Notes, against Transpose per note', per_note, new)
+    for baseline, seconds in (('one at a time', old), ('Transpose per note', per_note)):
+        verdict = 'met' if seconds / new >= TARGET_SPEEDUP else 'NOT met'
+        print('{label:<50} {verdict:>10}'.format(label='{}x over {}'.format(TARGET_SPEEDUP, baseline),
+                                                 verdict=verdict))
+    assert transpose_one_at_a_time(notes[:1000], 4) == Transpose(notes[:1000]).up.third
+
+    transpose = Transpose(notes)
+    new = run('Transpose, reused: ' + label, lambda: transpose.up.third, number=5, repeat=3)
+    compare('Notes, reused', old, new)
+
+    composed = [ComposedNote(note, random.randint(2, 6)) for note in notes]
+    new = run('Transpose: {} ComposedNotes up a third'.format(SEQUENCE_LENGTH),
+              lambda: Transpose(composed).up.third, number=5, repeat=3)
+    compare('ComposedNotes', old, new)
+
+    semitones = np.array([12 * note.octave + note.pitch_class for note in composed], dtype=np.int16)
+    new = run('Transpose: {} semitone indexes up a third'.format(SEQUENCE_LENGTH),
+              lambda: Transpose(semitones).up.third, number=100, repeat=3)
+    compare('NumPy array', old, new)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,19 @@
+import bisect
+
+from composer.midi_data import MIDI_TO_PITCH_MAP
 from the_blood.models import *
 
+LOWEST_MIDI_NUMBER = 0  # C-1
+HIGHEST_MIDI_NUMBER = 127  # G9
+C0_MIDI_NUMBER = 12
+C0_SEMITONE = 0
+
+# Which way build_snap_table moves a pitch that has no note in the key
+SNAP_UP = 'up'
+SNAP_DOWN = 'down'
+SNAP_NEAREST = 'nearest'
+SNAP_DIRECTIONS = (SNAP_UP, SNAP_DOWN, SNAP_NEAREST)
+
 
 class ComposedNote(Note):
 
@@ -7,7 +21,23 @@ class ComposedNote(Note):
         self.note = Note(note)
         self.octave = Octave(octave)
         super().__init__(note=self.note)
-        self.pitch = Pitch(PitchMap((self.note, self.octave)))
+
+        # PITCHES counts B#, Dbb and the like in the same octave as C (B#4 is C4)
+        # and Cb in the same octave as B (Cb4 is B4), so a note is always its
+        # pitch class above the C of its octave.
+        semitone = C0_SEMITONE + 12 * self.octave + self.note.pitch_class
+        self.midi_number = C0_MIDI_NUMBER + semitone
+        if not LOWEST_MIDI_NUMBER <= self.midi_number <= HIGHEST_MIDI_NUMBER:
+            error = '{note}{octave} is outside of the MIDI range of C-1 to G9.'
+            raise InvalidNoteError(error.format(note=self.note, octave=self.octave))
+
+        if 0 <= semitone < len(SEMITONE_PITCHES):
+            self.pitch = Pitch.from_semitone(semitone)
+        else:
+            self.pitch = Pitch(MIDI_TO_PITCH_MAP[self.midi_number])
+
+    def __reduce__(self):
+        return ComposedNote, (self.note, self.octave)
 
     def __str__(self):
         return '{name}{octave}'.format(name=self.name, octave=self.octave)
@@ -23,3 +53,46 @@ class ComposedNote(Note):
                 return ComposedNote(note, octave)
         error = 'Failed to compose note for pitch {pitch} with available notes {available_notes}.'
         raise UnavailableNoteError(error.format(pitch=pitch, available_notes=available_notes))
+
+
+def build_snap_table(key, direction=SNAP_UP):
+    """
+    Map every pitch of PianoRange to a ComposedNote in the key, as a tuple
+    indexed like PianoRange. A pitch with no note in the key moves to the
+    closest one above it (SNAP_UP), below it (SNAP_DOWN) or either way
+    (SNAP_NEAREST, going up on a tie). Notes just off either end of the piano
+    count, and past the ends of the pitch table it moves the other way instead.
+    """
+    if direction not in SNAP_DIRECTIONS:
+        error = 'Invalid snap direction {direction}. Must be one of {directions}.'
+        raise ValueError(error.format(direction=direction, directions=SNAP_DIRECTIONS))
+
+    in_key = []
+    for semitone in range(len(SEMITONE_PITCHES)):
+        try:
+            in_key.append(ComposedNote.from_pitch(Pitch.from_semitone(semitone), key.notes))
+        except UnavailableNoteError:
+            in_key.append(None)
+    semitones = [semitone for semitone, composed_note in enumerate(in_key) if composed_note is not None]
+    if not semitones:
+        raise UnavailableNoteError('No pitch has a note in {key}.'.format(key=key))
+
+    table = []
+    for pitch in PianoRange:
+        above = bisect.bisect_left(semitones, pitch.semitone)
+        below = bisect.bisect_right(semitones, pitch.semitone) - 1
+        above = semitones[above] if above < len(semitones) else None
+        below = semitones[below] if below >= 0 else None
+
+        if above is None:
+            semitone = below
+        elif below is None:
+            semitone = above
+        elif direction == SNAP_UP:
+            semitone = above
+        elif direction == SNAP_DOWN:
+            semitone = below
+        else:
+            semitone = above if above - pitch.semitone <= pitch.semitone - below else below
+        table.append(in_key[semitone])
+    return tuple(table)
@@ -0,0 +1,313 @@
+"""
+Opt-in call counters and timers for the hot paths of the_blood and composer,
+to find where the device loop's time goes.
+
+    instrumentation = Instrumentation()
+    instrumentation.enable()
+    instrumentation.instrument(midi_controller, 'send', 'MIDI.send')
+    ...
+    print(instrumentation.report())
+    instrumentation.export('timings.json')
+    instrumentation.disable()
+
+Nothing is wrapped until enable(), and disable() puts every original
+function back, so there's no cost at all while it's off.
+"""
+import json
+import sys
+import time
+
+# 'module:attribute path' of every function timed by default.
+DEFAULT_TARGETS = (
+    'the_blood.models:PitchMap',
+    'the_blood.models:Note.from_pitch',
+    'the_blood.models:CachedConstruction.__call__',
+    'the_blood.models:Scale.__init__',
+    'the_blood.models:Key.__init__',
+    'the_blood.models:Chord.__init__',
+    'the_blood.models:identify_chord',
+    'the_blood.models:Transpose.__init__',
+    'the_blood.parsing:parse_note',
+    'the_blood.parsing:parse_name',
+    'composer.compose:ComposedNote.__init__',
+    'composer.compose:ComposedNote.from_pitch',
+    'composer.compose:build_snap_table',
+    'composer.midi:get_midi_number_from_note',
+    'composer.midi:get_duration_seconds',
+    'composer.midi:MidiNote.__init__',
+    'composer.midi:MidiNote.get_start_command',
+    'composer.midi:MidiNote.get_end_command',
+    'composer.translators.accelerometer:_AccelerometerStrategy.get_piano_index',
+    'composer.translators.accelerometer:_AccelerometerStrategy.get_velocity',
+    'composer.translators.accelerometer:_AccelerometerStrategy.get_note_value',
+    'composer.translators.accelerometer:AccelerometerTranslator.receive',
+    'composer.translators.accelerometer:AccelerometerTranslator.translate',
+    'composer.translators.text:TextTranslator.__init__',
+    'composer.translators.text:TextTranslator._get_phrase',
+)
+
+# 'module:attribute' of every LRUCache whose hit rate is reported by default.
+DEFAULT_CACHES = (
+    'the_blood.models:SCALE_CACHE',
+    'the_blood.parsing:PARSED_NOTES',
+    'the_blood.parsing:PARSED_NAMES',
+    'the_blood.parsing:PARSED_QUALITIES',
+)
+
+PERCENTILES = (50, 90, 99)
+
+_INHERITED = object()
+
+# CircuitPython has no perf_counter.
+_clock = getattr(time, 'perf_counter', time.monotonic)
+
+
+def _resolve(target):
+    module_name, _, path = target.partition(':')
+    __import__(module_name)
+    owner = sys.modules[module_name]
+    names = path.split('.')
+    for name in names[:-1]:
+        owner = getattr(owner, name)
+    return owner, names[-1]
+
+
+class CallStats:
+    """
+    Call count and latencies of one instrumented function. Percentiles are
+    over the latest `samples` calls, the count and totals over all of them.
+    """
+    def __init__(self, name, samples=1024):
+        self.name = name
+        self.samples = samples
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._latencies = []
+
+    def add(self, latency):
+        if len(self._latencies) < self.samples:
+            self._latencies.append(latency)
+        else:
+            self._latencies[self.calls % self.samples] = latency
+        self.calls += 1
+        self.total += latency
+        if latency > self.max:
+            self.max = latency
+
+    @property
+    def mean(self):
+        if self.calls:
+            return self.total / self.calls
+        return 0.0
+
+    def percentile(self, percent):
+        """
+        The latency that `percent` of the sampled calls took no longer than (nearest rank).
+        """
+        if not self._latencies:
+            return 0.0
+        latencies = sorted(self._latencies)
+        rank = max(1, -(-percent * len(latencies) // 100))
+        return latencies[int(rank) - 1]
+
+    def as_dict(self):
+        stats = {'calls': self.calls, 'total': self.total, 'mean': self.mean, 'max': self.max}
+        for percent in PERCENTILES:
+            stats['p{}'.format(percent)] = self.percentile(percent)
+        return stats
+
+    def __repr__(self):
+        r = 'CallStats({name}, calls={calls}, total={total:.6f}s, mean={mean:.6f}s, max={max:.6f}s)'
+        return r.format(name=self.name, calls=self.calls, total=self.total, mean=self.mean, max=self.max)
+
+
+class Instrumentation:
+    """
+    Wraps each of `targets` ('module:Class.method' or 'module:function') in a
+    timer while enabled. Module level functions are replaced everywhere they
+    were imported to, so `from the_blood.models import *` callers are counted too.
+
+    Cache hit rates are the hits and misses of `caches` since enable() or reset().
+    """
+    def __init__(self, targets=DEFAULT_TARGETS, caches=DEFAULT_CACHES, samples=1024, clock=_clock):
+        self.targets = tuple(targets)
+        self.samples = samples
+        self.clock = clock
+        self.stats = {}
+        self.caches = {}
+        self._cache_baselines = {}
+        self._patches = []  # (owner, attribute, original, wrapper)
+        self.enabled = False
+        for target in caches:
+            owner, name = _resolve(target)
+            self.watch_cache(name, getattr(owner, name))
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.disable()
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.reset()
+        for target in self.targets:
+            owner, attribute = _resolve(target)
+            self._patch(owner, attribute, target.partition(':')[2])
+
+    def disable(self):
+        if not self.enabled:
+            return
+        for owner, attribute, original, wrapper in reversed(self._patches):
+            self._restore(owner, attribute, original, wrapper)
+        self._patches = []
+        self.enabled = False
+
+    def reset(self):
+        for stats in self.stats.values():
+            stats.reset()
+        self._cache_baselines = {name: (cache.hits, cache.misses) for name, cache in self.caches.items()}
+
+    def watch_cache(self, name, cache):
+        """
+        Report the hit rate of another LRUCache.
+        """
+        self.caches[name] = cache
+        self._cache_baselines[name] = (cache.hits, cache.misses)
+
+    def instrument(self, owner, attribute, name=None):
+        """
+        Time owner.attribute until disable(), e.g. a MIDI object's send.
+        """
+        if not self.enabled:
+            raise RuntimeError('Instrumentation must be enabled before instrumenting {}.'.format(attribute))
+        self._patch(owner, attribute, name or attribute)
+
+    def wrap(self, function, name):
+        """
+        A copy of `function` that counts and times its calls under `name`.
+        """
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = CallStats(name, self.samples)
+        clock = self.clock
+        add = stats.add
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                add(clock() - start)
+
+        timed.__wrapped__ = function
+        for attribute in ('__name__', '__qualname__', '__doc__'):
+            try:
+                setattr(timed, attribute, getattr(function, attribute))
+            except AttributeError:
+                pass
+        return timed
+
+    def _patch(self, owner, attribute, name):
+        # Look in the class's own __dict__ so staticmethods and classmethods stay what they are.
+        original = vars(owner).get(attribute, None) if isinstance(owner, type) else None
+        if isinstance(original, (staticmethod, classmethod)):
+            wrapper = type(original)(self.wrap(original.__func__, name))
+        else:
+            original = getattr(owner, attribute)
+            wrapper = self.wrap(original, name)
+
+        if attribute not in vars(owner):
+            # Inherited or looked up through the class: deleting the wrapper puts it back.
+            original = _INHERITED
+        setattr(owner, attribute, wrapper)
+        self._patches.append((owner, attribute, original, wrapper))
+        if type(owner) is type(sys):
+            for module in list(sys.modules.values()):
+                for other, value in list(getattr(module, '__dict__', {}).items()):
+                    if value is original and module is not owner:
+                        setattr(module, other, wrapper)
+                        self._patches.append((module, other, original, wrapper))
+
+    @staticmethod
+    def _restore(owner, attribute, original, wrapper):
+        if vars(owner).get(attribute) is wrapper:
+            if original is _INHERITED:
+                delattr(owner, attribute)
+            else:
+                setattr(owner, attribute, original)
+        if type(owner) is type(sys):
+            # Modules imported while enabled copied the wrapper.
+            for module in list(sys.modules.values()):
+                for other, value in list(getattr(module, '__dict__', {}).items()):
+                    if value is wrapper:
+                        setattr(module, other, original)
+
+    def cache_stats(self):
+        stats = {}
+        for name, cache in self.caches.items():
+            hits, misses = self._cache_baselines.get(name, (0, 0))
+            hits, misses = cache.hits - hits, cache.misses - misses
+            lookups = hits + misses
+            stats[name] = {
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'size': len(cache),
+                'maxsize': cache.maxsize,
+            }
+        return stats
+
+    def as_dict(self):
+        """
+        Every function that has been called and every cache, as plain dicts.
+        Times are in seconds.
+        """
+        called = sorted((s for s in self.stats.values() if s.calls), key=lambda s: s.total, reverse=True)
+        return {
+            'calls': {stats.name: stats.as_dict() for stats in called},
+            'caches': self.cache_stats(),
+        }
+
+    def to_json(self, indent=2):
+        return json.dumps(self.as_dict(), indent=indent)
+
+    def export(self, path):
+        with open(path, 'w') as f:
+            f.write(self.to_json())
+
+    def report(self):
+        """
+        A plain text table of the functions that were called, most total time
+        first, then the caches' hit rates. Times are in microseconds.
+        """
+        data = self.as_dict()
+        percentiles = ['p{}'.format(percent) for percent in PERCENTILES]
+        headers = ['function', 'calls', 'total', 'mean'] + percentiles + ['max']
+        rows = []
+        for name, stats in data['calls'].items():
+            times = [stats[column] * 1e6 for column in ['total', 'mean'] + percentiles + ['max']]
+            rows.append([name, str(stats['calls'])] + ['{:.1f}'.format(t) for t in times])
+        lines = self._table(headers, rows)
+
+        headers = ['cache', 'hits', 'misses', 'hit rate', 'size']
+        rows = [[name, str(stats['hits']), str(stats['misses']), '{:.1%}'.format(stats['hit_rate']),
+                 '{}/{}'.format(stats['size'], stats['maxsize'])]
+                for name, stats in data['caches'].items()]
+        return '\n'.join(lines + [''] + self._table(headers, rows))
+
+    @staticmethod
+    def _table(headers, rows):
+        widths = [max(len(row[i]) for row in [headers] + rows) for i in range(len(headers))]
+        lines = []
+        for row in [headers] + rows:
+            cells = [row[0].ljust(widths[0])] + [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])]
+            lines.append('  '.join(cells).rstrip())
+        return lines
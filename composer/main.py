@@ -6,6 +6,7 @@ def __run():
     import adafruit_msa301
     import adafruit_midi
     import usb_midi
+    from composer.scheduler import NoteOffScheduler
     from composer.translators.accelerometer import AccelerometerTranslator, AccelerometerStrategy
     from the_blood.models import Key
 
@@ -16,17 +17,21 @@ def __run():
     translator = AccelerometerTranslator(AccelerometerStrategy, Key('Bb'), bpm=120)
     midi_controller = adafruit_midi.MIDI(midi_out=usb_midi.ports[1], out_channel=0)
 
-    midi_note = None
+    scheduler = NoteOffScheduler()
+
+    next_start = scheduler.clock()
     while True:
-        translator.receive(msa)
-        if not midi_note:
+        for end_command in scheduler.pop_due():
+            midi_controller.send(end_command)
+            print(end_command)
+
+        if scheduler.clock() >= next_start:
+            translator.receive(msa)
             midi_note = translator.translate()
             start_command = midi_note.get_start_command()
             midi_controller.send(start_command)
             print(start_command)
-        else:
-            end_command = midi_note.get_end_command()
-            if end_command:
-                midi_controller.send(end_command)
-                print(end_command)
-                midi_note = None
+            scheduler.schedule(midi_note)
+            next_start = midi_note.end
+
+        scheduler.wait(until=next_start)
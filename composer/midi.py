@@ -17,13 +17,9 @@ A0_MIDI_NUMBER = 21  # LOWEST KEY ON A PIANO
 
 
 def get_midi_number_from_note(composed_note):
-    error = 'Expected a ComposedNote. Got {}.'.format(type(composed_note))
-    assert isinstance(composed_note, compose.ComposedNote), error
-    for midi_number, pitch in enumerate(PianoRange, start=A0_MIDI_NUMBER):
-        if pitch == composed_note.pitch:
-            return midi_number
-
-    raise Exception('Could not find pitch for ComposedNote {}.'.format(composed_note))
+    assert isinstance(composed_note, compose.ComposedNote), \
+        'Expected a ComposedNote. Got {}.'.format(type(composed_note))
+    return composed_note.midi_number
 
 
 class MidiNote:
@@ -31,7 +27,7 @@ class MidiNote:
         self.note = composed_note
         self.velocity = int(velocity)
         self.duration = float(duration)
-        self.start = start or self.now()
+        self.start = self.now() if start is None else start
         self.end = self.start + self.duration
         self.number = get_midi_number_from_note(self.note)
         self.channel = 1
@@ -41,7 +37,8 @@ class MidiNote:
 
     @staticmethod
     def now():
-        return time.time()
+        # Monotonic so note ends can't jump when the board's clock is set.
+        return time.monotonic()
 
     def get_end_command(self, force=False):
         if force or self.now() >= self.end:
@@ -0,0 +1,152 @@
+import asyncio
+import time
+
+from composer.scheduler import NoteOffScheduler
+
+# What a stage does when the queue it writes to is full
+BLOCK = 'block'  # Wait for the next stage to make room.
+DROP_OLDEST = 'drop_oldest'  # Throw away the oldest item in the queue.
+COALESCE = 'coalesce'  # Throw away everything in the queue; only the newest item matters.
+BACKPRESSURE_POLICIES = (BLOCK, DROP_OLDEST, COALESCE)
+
+_STOP = object()
+
+
+class StageStats:
+    """
+    Latency counters for one stage of a TranslatorPipeline. Latency is measured
+    from when an item was put on the stage's queue to when the stage finished with it.
+    """
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.dropped = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def add(self, latency):
+        self.count += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    @property
+    def mean_latency(self):
+        if self.count:
+            return self.total_latency / self.count
+        return 0.0
+
+    def __repr__(self):
+        r = 'StageStats({name}, count={count}, dropped={dropped}, mean={mean:.6f}s, max={max:.6f}s)'
+        return r.format(name=self.name, count=self.count, dropped=self.dropped,
+                        mean=self.mean_latency, max=self.max_latency)
+
+
+class TranslatorPipeline:
+    """
+    Runs the device loop as three asyncio stages joined by bounded queues,
+    so a slow sensor read, translation or MIDI send doesn't stall the others:
+
+        read:      accelerometer -> translator.receive -> samples queue
+        translate: samples queue -> translator.translate -> notes queue,
+                   then waits for the note to finish before taking the next sample
+        send:      notes queue -> NoteOn, with the NoteOff sent when the note ends
+
+    `backpressure` says what the read and translate stages do when their
+    queue is full (BLOCK, DROP_OLDEST or COALESCE).
+    """
+    def __init__(self, translator, accelerometer, midi_controller, *,
+                 maxsize=8, backpressure=DROP_OLDEST, sample_interval=0.0, clock=time.monotonic):
+        if backpressure not in BACKPRESSURE_POLICIES:
+            error = 'Invalid backpressure policy {policy}. Must be one of {policies}.'
+            raise ValueError(error.format(policy=backpressure, policies=BACKPRESSURE_POLICIES))
+
+        self.translator = translator
+        self.accelerometer = accelerometer
+        self.midi_controller = midi_controller
+        self.maxsize = maxsize
+        self.backpressure = backpressure
+        self.sample_interval = sample_interval
+        self.clock = clock
+        self.scheduler = NoteOffScheduler(clock=clock)
+        self.stats = {name: StageStats(name) for name in ('read', 'translate', 'send')}
+
+    async def _put(self, queue, item, stats):
+        entry = (self.clock(), item)
+        if self.backpressure == BLOCK:
+            await queue.put(entry)
+            return
+
+        if self.backpressure == COALESCE:
+            while not queue.empty():
+                queue.get_nowait()
+                stats.dropped += 1
+        elif queue.full():
+            queue.get_nowait()
+            stats.dropped += 1
+        queue.put_nowait(entry)
+
+    async def read(self, samples_queue, samples):
+        count = 0
+        while samples is None or count < samples:
+            started = self.clock()
+            self.translator.receive(self.accelerometer)
+            sample = self.translator.x, self.translator.y, self.translator.z
+            self.stats['read'].add(self.clock() - started)
+            await self._put(samples_queue, sample, self.stats['translate'])
+            count += 1
+            await asyncio.sleep(self.sample_interval)
+        await samples_queue.put((self.clock(), _STOP))
+
+    async def translate(self, samples_queue, notes_queue):
+        while True:
+            queued, sample = await samples_queue.get()
+            if sample is _STOP:
+                await notes_queue.put((self.clock(), _STOP))
+                return
+
+            self.translator.x, self.translator.y, self.translator.z = sample
+            midi_note = self.translator.translate()
+            self.stats['translate'].add(self.clock() - queued)
+            await self._put(notes_queue, midi_note, self.stats['send'])
+
+            # Notes play one after another, like the synchronous device loop.
+            await asyncio.sleep(max(0.0, midi_note.end - self.clock()))
+
+    async def send(self, notes_queue):
+        stopping = False
+        while not stopping or len(self.scheduler):
+            for end_command in self.scheduler.pop_due():
+                self.midi_controller.send(end_command)
+
+            timeout = None
+            if self.scheduler.next_deadline is not None:
+                timeout = max(0.0, self.scheduler.next_deadline - self.clock())
+            if stopping:
+                await asyncio.sleep(timeout)
+                continue
+
+            try:
+                queued, midi_note = await asyncio.wait_for(notes_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                continue
+            if midi_note is _STOP:
+                stopping = True
+                continue
+
+            self.midi_controller.send(midi_note.get_start_command())
+            self.scheduler.schedule(midi_note)
+            self.stats['send'].add(self.clock() - queued)
+
+    async def run(self, samples=None):
+        """
+        Run until `samples` samples have been read and every note has ended,
+        or forever if `samples` is None.
+        """
+        samples_queue = asyncio.Queue(maxsize=self.maxsize)
+        notes_queue = asyncio.Queue(maxsize=self.maxsize)
+        await asyncio.gather(
+            self.read(samples_queue, samples),
+            self.translate(samples_queue, notes_queue),
+            self.send(notes_queue),
+        )
+        return self.stats
@@ -0,0 +1,61 @@
+import heapq
+import time
+
+
+class NoteOffScheduler:
+    """
+    Keeps the MidiNotes that are still sounding in a heap ordered by when they end,
+    so any number of them can overlap and the device loop can sleep until the
+    next one is due instead of polling each note.
+
+    The clock must be the one the MidiNotes were timed with (MidiNote.now).
+    """
+    def __init__(self, clock=time.monotonic, sleep=time.sleep):
+        self.clock = clock
+        self.sleep = sleep
+        self._heap = []
+        self._count = 0  # Breaks ties between notes that end at the same time, in the order they were added.
+
+    def __len__(self):
+        return len(self._heap)
+
+    def schedule(self, midi_note):
+        heapq.heappush(self._heap, (midi_note.end, self._count, midi_note))
+        self._count += 1
+
+    @property
+    def next_deadline(self):
+        if self._heap:
+            return self._heap[0][0]
+
+    def pop_due(self, now=None):
+        """
+        Return the NoteOff commands of every note that has ended, earliest first.
+        """
+        if now is None:
+            now = self.clock()
+        commands = []
+        while self._heap and self._heap[0][0] <= now:
+            end, count, midi_note = heapq.heappop(self._heap)
+            commands.append(midi_note.get_end_command(force=True))
+        return commands
+
+    def pop_all(self):
+        """
+        Return the NoteOff commands of every note still sounding, earliest first.
+        """
+        commands = [midi_note.get_end_command(force=True) for end, count, midi_note in sorted(self._heap)]
+        self._heap.clear()
+        return commands
+
+    def wait(self, until=None):
+        """
+        Sleep until the next note is due to end, or until `until` if that's sooner.
+        Returns straight away if neither is in the future.
+        """
+        deadlines = [d for d in (self.next_deadline, until) if d is not None]
+        if not deadlines:
+            return
+        seconds = min(deadlines) - self.clock()
+        if seconds > 0:
+            self.sleep(seconds)
@@ -0,0 +1,219 @@
+"""
+Standard MIDI File (SMF) writer for translator output.
+
+https://www.music.mcgill.ca/~ich/classes/mumt306/StandardMIDIfileformat.html
+"""
+import heapq
+import os
+import struct
+
+from composer import midi
+from composer.compose import ComposedNote
+from the_blood.models import *
+
+HEADER_CHUNK = b'MThd'
+TRACK_CHUNK = b'MTrk'
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
+META_EVENT = 0xFF
+META_TEMPO = 0x51
+META_END_OF_TRACK = 0x2F
+SINGLE_TRACK = 0  # SMF type 0: one track with everything in it
+MULTI_TRACK = 1  # SMF type 1: a tempo track, then the notes on a track of their own
+DEFAULT_TICKS_PER_BEAT = 480
+DEFAULT_BUFFER_SIZE = 4096
+
+
+#######################################################################
+def encode_variable_length(value):
+    """
+    Encode a delta time or length as a MIDI variable-length quantity:
+    7 bits per byte, most significant first, with the top bit set on every byte but the last.
+    """
+    if not 0 <= value <= 0x0FFFFFFF:
+        raise ValueError('{} does not fit in a variable-length quantity.'.format(value))
+    encoded = bytearray([value & 0x7F])
+    value >>= 7
+    while value:
+        encoded.insert(0, (value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(encoded)
+
+
+#######################################################################
+class MidiFileWriter:
+    """
+    Streams MidiNotes into a Standard MIDI File as they are added.
+
+    Notes must be added in the order they start. Each one's NoteOn is written
+    straight away and its NoteOff is held until a later note starts after it
+    ends (or the file is closed), so memory only grows with how many notes
+    are sounding at once. Encoded events collect in a buffer that is written
+    to the file every `buffer_size` bytes, and the track's length is patched
+    into its header on close, so the file must be seekable.
+
+    Channel messages use running status: the status byte is left out when it
+    is the same as the previous event's.
+    """
+    def __init__(self, file, *, bpm=120, ticks_per_beat=DEFAULT_TICKS_PER_BEAT,
+                 format=SINGLE_TRACK, buffer_size=DEFAULT_BUFFER_SIZE):
+        if format not in (SINGLE_TRACK, MULTI_TRACK):
+            raise ValueError('Invalid SMF format {}. Must be 0 or 1.'.format(format))
+
+        self.bpm = bpm
+        self.ticks_per_beat = ticks_per_beat
+        self.format = format
+        self.buffer_size = buffer_size
+
+        self._owns_file = isinstance(file, (str, bytes, os.PathLike))
+        self._file = open(file, 'wb') if self._owns_file else file
+        self._buffer = bytearray()
+        self._note_offs = []  # Heap of (tick, count, status, number, velocity)
+        self._count = 0
+        self._origin = None  # Start of the first note, in seconds. Tick 0.
+        self._tick = 0  # Tick of the last event written
+        self._status = None  # Status byte of the last event written, for running status
+        self._track_length = 0
+        self._closed = False
+
+        self._write_header()
+
+    ####################################################################
+    def __enter__(self):
+        return self
+
+    ####################################################################
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    ####################################################################
+    def _write_header(self):
+        tracks = 1 if self.format == SINGLE_TRACK else 2
+        self._file.write(HEADER_CHUNK + struct.pack('>IHHH', 6, self.format, tracks, self.ticks_per_beat))
+
+        microseconds_per_beat = round(60000000 / self.bpm)
+        tempo = bytes([META_EVENT, META_TEMPO, 3]) + struct.pack('>I', microseconds_per_beat)[1:]
+        end_of_track = bytes([META_EVENT, META_END_OF_TRACK, 0])
+        if self.format == MULTI_TRACK:
+            tempo_track = b'\x00' + tempo + b'\x00' + end_of_track
+            self._file.write(TRACK_CHUNK + struct.pack('>I', len(tempo_track)) + tempo_track)
+
+        self._track_length_offset = self._file.tell() + len(TRACK_CHUNK)
+        self._file.write(TRACK_CHUNK + struct.pack('>I', 0))
+        if self.format == SINGLE_TRACK:
+            self._write(b'\x00' + tempo)
+
+    ####################################################################
+    def _ticks(self, seconds):
+        return round((seconds - self._origin) * self.ticks_per_beat * self.bpm / 60)
+
+    ####################################################################
+    def _write(self, data):
+        self._buffer += data
+        self._track_length += len(data)
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    ####################################################################
+    def _write_event(self, tick, status, *data):
+        event = bytearray(encode_variable_length(tick - self._tick))
+        if status != self._status:
+            event.append(status)
+            self._status = status
+        event += bytes(data)
+        self._tick = tick
+        self._write(event)
+
+    ####################################################################
+    def _write_note_offs(self, until=None):
+        while self._note_offs and (until is None or self._note_offs[0][0] <= until):
+            tick, count, status, number, velocity = heapq.heappop(self._note_offs)
+            self._write_event(tick, status, number, velocity)
+
+    ####################################################################
+    def add(self, midi_note):
+        if self._closed:
+            raise ValueError('Cannot add notes to a closed MidiFileWriter.')
+        if self._origin is None:
+            self._origin = midi_note.start
+
+        start = self._ticks(midi_note.start)
+        if start < self._tick:
+            raise ValueError('MidiNotes must be added in the order they start. Got {} after tick {}.'.format(
+                midi_note.note, self._tick))
+
+        # A note that ends when this one starts is released first.
+        self._write_note_offs(until=start)
+        self._write_event(start, NOTE_ON | midi_note.channel, midi_note.number, midi_note.velocity)
+
+        end = max(start, self._ticks(midi_note.end))
+        note_off = (end, self._count, NOTE_OFF | midi_note.channel, midi_note.number, midi_note.velocity)
+        heapq.heappush(self._note_offs, note_off)
+        self._count += 1
+
+    ####################################################################
+    def extend(self, midi_notes):
+        for midi_note in midi_notes:
+            self.add(midi_note)
+
+    ####################################################################
+    def flush(self):
+        self._file.write(self._buffer)
+        self._buffer.clear()
+
+    ####################################################################
+    def close(self):
+        if self._closed:
+            return
+        self._write_note_offs()
+        self._write(bytes([0, META_EVENT, META_END_OF_TRACK, 0]))
+        self.flush()
+
+        end = self._file.tell()
+        self._file.seek(self._track_length_offset)
+        self._file.write(struct.pack('>I', self._track_length))
+        self._file.seek(end)
+        if self._owns_file:
+            self._file.close()
+        self._closed = True
+
+
+#######################################################################
+def write_midi_file(file, midi_notes, **kwargs):
+    with MidiFileWriter(file, **kwargs) as writer:
+        writer.extend(midi_notes)
+
+
+#######################################################################
+def accelerometer_notes(translator, accelerometer, samples):
+    """
+    Translate `samples` readings into MidiNotes played back to back from 0 seconds,
+    the way the device loop plays them, without waiting for each one to finish.
+    """
+    start = 0.0
+    for _ in range(samples):
+        translator.receive(accelerometer)
+        translated = translator.translate()
+        midi_note = midi.MidiNote(translated.note, translated.velocity, duration=translated.duration, start=start)
+        start = midi_note.end
+        yield midi_note
+
+
+#######################################################################
+def text_notes(translator, *, bpm=120, octave=4, note_value=QuarterNote, velocity=midi.MAX_VELOCITY):
+    """
+    The TextTranslator's phrases as MidiNotes played back to back from 0 seconds.
+    A rest (None) in a phrase leaves a gap of one note value.
+    """
+    duration = midi.get_duration_seconds(note_value, bpm)
+    composed_notes = {}
+    start = 0.0
+    for phrase in translator.phrases():
+        for note in phrase:
+            if note is not None:
+                try:
+                    composed_note = composed_notes[note]
+                except KeyError:
+                    composed_note = composed_notes[note] = ComposedNote(note, octave)
+                yield midi.MidiNote(composed_note, velocity, duration=duration, start=start)
+            start += duration
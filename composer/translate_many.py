@@ -0,0 +1,145 @@
+"""
+Translate many text files at once, one process per CPU.
+
+    python -m composer.translate_many book1.txt book2.txt --output out/ --format midi
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from composer import smf
+from composer.translators import text
+from composer.translators.text import StreamingTextTranslator
+from the_blood.models import *
+
+MIDI = 'midi'
+JSON = 'json'
+OUTPUT_FORMATS = (MIDI, JSON)
+EXTENSIONS = {MIDI: '.mid', JSON: '.json'}
+INDEX_FILE = 'index.json'
+
+# Every key TextTranslator can choose.
+TEXT_KEYS = ('C', 'Am', 'A')
+
+
+#######################################################################
+def warm_up(key_names=TEXT_KEYS):
+    """
+    Build the keys, their scales and their scale degree tables once, so each
+    worker process starts with them cached instead of deriving them per file.
+    """
+    for name in key_names:
+        text.get_degree_notes(Key(name))
+
+
+#######################################################################
+def translate_file(path, output, output_format=MIDI, non_letters=text.SKIP, bpm=120):
+    """
+    Translate one text file into a MIDI or JSON file. Returns a summary of it.
+    """
+    with open(path, encoding='utf-8', errors='replace') as source:
+        translator = StreamingTextTranslator(source, non_letters=non_letters)
+        if output_format == MIDI:
+            notes = 0
+
+            def counted(midi_notes):
+                nonlocal notes
+                for midi_note in midi_notes:
+                    notes += 1
+                    yield midi_note
+
+            smf.write_midi_file(output, counted(smf.text_notes(translator, bpm=bpm)), bpm=bpm)
+        else:
+            notes = 0
+            with open(output, 'w') as f:
+                # Written a phrase at a time, so the melody is never all in memory.
+                header = json.dumps({'source': path, 'key': translator.key.name,
+                                     'time_signature': translator.time_signature})
+                f.write(header[:-1] + ', "melody": [')  # The header without its closing brace.
+                for i, phrase in enumerate(translator.phrases()):
+                    names = [None if note is None else note.name for note in phrase]
+                    notes += len(names) - names.count(None)
+                    f.write(', ' * bool(i) + json.dumps(names))
+                f.write(']}')
+
+    return {
+        'source': path,
+        'output': output,
+        'key': translator.key.name,
+        'time_signature': translator.time_signature,
+        'notes': notes,
+    }
+
+
+#######################################################################
+def _translate_file(args):
+    # One file that can't be translated mustn't lose the rest of the batch.
+    path, output = args[:2]
+    try:
+        return translate_file(*args)
+    except (NotImplementedError, ValueError) as e:
+        if os.path.exists(output):
+            os.remove(output)
+        return {'source': path, 'error': str(e)}
+
+
+#######################################################################
+def translate_many(paths, output_dir, *, output_format=MIDI, workers=None, non_letters=text.SKIP, bpm=120):
+    """
+    Translate every file in `paths` into `output_dir`, sharing the files out
+    across `workers` processes (one per CPU by default, or in this process
+    if workers is 1). Each output is named after its source file.
+
+    Returns the summaries in the same order as `paths`, and writes them to
+    index.json in `output_dir`. A file that can't be translated has no output,
+    and its summary is just its source and the error.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        error = 'Invalid output format {output_format}. Must be one of {formats}.'
+        raise ValueError(error.format(output_format=output_format, formats=OUTPUT_FORMATS))
+
+    outputs = []
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0] + EXTENSIONS[output_format]
+        outputs.append(os.path.join(output_dir, name))
+    if len(set(outputs)) != len(outputs):
+        raise ValueError('Input files must have different names.')
+
+    os.makedirs(output_dir, exist_ok=True)
+    jobs = [(path, output, output_format, non_letters, bpm) for path, output in zip(paths, outputs)]
+    if workers == 1:
+        warm_up()
+        summaries = [_translate_file(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=warm_up) as executor:
+            # map yields results in the order of `jobs`, however the work was scheduled.
+            summaries = list(executor.map(_translate_file, jobs))
+
+    with open(os.path.join(output_dir, INDEX_FILE), 'w') as f:
+        json.dump(summaries, f, indent=2)
+    return summaries
+
+
+#######################################################################
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Translate text files into melodies.')
+    parser.add_argument('paths', nargs='+', help='Text files to translate.')
+    parser.add_argument('-o', '--output', required=True, help='Directory to write the translations to.')
+    parser.add_argument('-f', '--format', choices=OUTPUT_FORMATS, default=MIDI)
+    parser.add_argument('-w', '--workers', type=int, default=None, help='Worker processes. Defaults to one per CPU.')
+    parser.add_argument('--non-letters', choices=text.NON_LETTER_POLICIES, default=text.SKIP)
+    parser.add_argument('--bpm', type=int, default=120)
+    args = parser.parse_args(argv)
+
+    summaries = translate_many(args.paths, args.output, output_format=args.format, workers=args.workers,
+                               non_letters=args.non_letters, bpm=args.bpm)
+    for summary in summaries:
+        if 'error' in summary:
+            print('{source}: {error}'.format(**summary))
+        else:
+            print('{source} -> {output}: {key}, {time_signature}, {notes} notes'.format(**summary))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,9 @@
 
 
 class Strategy:
+    def get_piano_index(self, *args, **kwargs):
+        raise NotImplementedError()
+
     def get_pitch(self, *args, **kwargs):
         raise NotImplementedError()
 
@@ -1,7 +1,5 @@
-import math
-
 from composer import midi
-from composer.compose import ComposedNote
+from composer.compose import ComposedNote, SNAP_UP, build_snap_table
 from composer.midi import MAX_VELOCITY
 from composer.translators._translator import Translator, Strategy
 from the_blood.models import *
@@ -14,24 +12,62 @@ PITCH_UNIT = int(ACC_MAX / (len(PianoRange) / 2))
 NOTE_VALUE_UNIT = int(ACC_MAX / len(NOTE_VALUES))
 NOTE_VALUE_REMAINDER = int(ACC_MAX % len(NOTE_VALUES))
 
+# NumPy dtype of the events returned by AccelerometerTranslator.translate_batch
+MIDI_EVENT_DTYPE = [
+    ('start', 'f8'),
+    ('duration', 'f8'),
+    ('number', 'u1'),
+    ('velocity', 'u1'),
+    ('note_value', 'u1'),
+]
+
 
 class _AccelerometerStrategy(Strategy):
+    """
+    Each axis maps to its output by which bucket of the axis the value falls in,
+    so the mappings are compiled into small tables here, indexed by
+    abs(value) // unit. Translating a sample is then three table reads.
+    """
     def __init__(self):
         middle_e = 329.63
         self.pitches_lower_than_middle_f = [p for p in PianoRange if p <= middle_e]
         self.middle_f_and_higher = [p for p in PianoRange if p > middle_e]
 
-    def get_pitch(self, x):
-        if x > PITCH_UNIT * 43:
-            return self.middle_f_and_higher[-1]
-        elif x <= PITCH_UNIT * 43 * -1:
-            return self.pitches_lower_than_middle_f[0]
+        # Indexes into PianoRange for x >= 0 and x < 0. Counting back from
+        # middle F, the bucket at 43 units below it and beyond is the lowest key.
+        middle_f = len(self.pitches_lower_than_middle_f)
+        highest = middle_f + len(self.middle_f_and_higher) - 1
+        buckets = range(-ACC_MIN // PITCH_UNIT + 1)
+        self.piano_indexes_above = tuple(min(middle_f + k, highest) for k in buckets)
+        self.piano_indexes_below = tuple(0 if k >= 43 else middle_f - k for k in buckets)
+
+        piano = list(PianoRange)
+        self._pitches_above = tuple(piano[i] for i in self.piano_indexes_above)
+        self._pitches_below = tuple(piano[i] for i in self.piano_indexes_below)
+
+        # Velocity falls by 1 with every VELOCITY_UNIT away from zero,
+        # down to 0 for the last buckets at either end.
+        buckets = range(-ACC_MIN // VELOCITY_UNIT + 1)
+        silent = ACC_MAX - VELOCITY_UNIT - 1
+        self.velocities = tuple(0 if k * VELOCITY_UNIT >= silent else midi.MAX_VELOCITY - k for k in buckets)
+
+        # Shortest note values nearest zero, whole notes at either end.
+        sorted_by_factor = sorted(NOTE_VALUES.values(), key=lambda nv: nv.factor, reverse=True)
+        buckets = range(-ACC_MIN // NOTE_VALUE_UNIT + 1)
+        whole = ACC_MAX - NOTE_VALUE_REMAINDER
+        self.note_values = tuple(WholeNote if k * NOTE_VALUE_UNIT >= whole else sorted_by_factor[k] for k in buckets)
 
-        index = int(x / PITCH_UNIT)
-        if index < 0:
-            return self.pitches_lower_than_middle_f[index]
-        else:
-            return self.middle_f_and_higher[index]
+    def get_piano_index(self, x):
+        assert ACC_MIN <= x <= ACC_MAX
+        if x < 0:
+            return self.piano_indexes_below[-x // PITCH_UNIT]
+        return self.piano_indexes_above[x // PITCH_UNIT]
+
+    def get_pitch(self, x):
+        assert ACC_MIN <= x <= ACC_MAX
+        if x < 0:
+            return self._pitches_below[-x // PITCH_UNIT]
+        return self._pitches_above[x // PITCH_UNIT]
 
     def get_velocity(self, y):
         """
@@ -42,31 +78,54 @@ class _AccelerometerStrategy(Strategy):
 
         """
         assert ACC_MIN <= y <= ACC_MAX
-        if y == 0:
-            return midi.MAX_VELOCITY
-        elif abs(y) >= ACC_MAX - VELOCITY_UNIT - 1:
-            return 0
-
         # range unit = max acceleration number / max velocity
         # 258 = 32768/127
-        raw = y / VELOCITY_UNIT
-        int_y = int(raw)
-        abs_y = abs(int_y)
-        reverse_y = abs_y - 127
-        velocity = abs(reverse_y)
-        return velocity
+        return self.velocities[abs(y) // VELOCITY_UNIT]
 
     def get_note_value(self, z):
         assert ACC_MIN <= z <= ACC_MAX
-        if z >= ACC_MAX - NOTE_VALUE_REMAINDER:
-            return WholeNote
-
         # NOTE_VALUE_UNIT = 5461
-        index = math.floor(abs(z/NOTE_VALUE_UNIT))
-        sorted_by_factor = sorted(NOTE_VALUES.values(), key=lambda nv: nv.factor, reverse=True)
+        return self.note_values[abs(z) // NOTE_VALUE_UNIT]
+
+    def get_piano_indexes(self, x):
+        """
+        Vectorized get_pitch. Takes an array of x values and returns the index
+        of each one's pitch in PianoRange.
+        """
+        import numpy as np
+
+        x = np.asarray(x, dtype=np.int64)
+        assert ((ACC_MIN <= x) & (x <= ACC_MAX)).all()
+
+        above = np.array(self.piano_indexes_above, dtype=np.int64)
+        below = np.array(self.piano_indexes_below, dtype=np.int64)
+        buckets = np.abs(x) // PITCH_UNIT
+        return np.where(x < 0, below[buckets], above[buckets])
 
-        note_value = sorted_by_factor[index]
-        return note_value
+    def get_velocities(self, y):
+        """
+        Vectorized get_velocity.
+        """
+        import numpy as np
+
+        y = np.asarray(y, dtype=np.int64)
+        assert ((ACC_MIN <= y) & (y <= ACC_MAX)).all()
+
+        velocities = np.array(self.velocities, dtype=np.int64)
+        return velocities[np.abs(y) // VELOCITY_UNIT]
+
+    def get_note_value_factors(self, z):
+        """
+        Vectorized get_note_value. Returns each NoteValue's factor
+        (4 for a quarter note, 8 for an eighth note, ...).
+        """
+        import numpy as np
+
+        z = np.asarray(z, dtype=np.int64)
+        assert ((ACC_MIN <= z) & (z <= ACC_MAX)).all()
+
+        factors = np.array([nv.factor for nv in self.note_values], dtype=np.int64)
+        return factors[np.abs(z) // NOTE_VALUE_UNIT]
 
 
 AccelerometerStrategy = _AccelerometerStrategy()
@@ -74,10 +133,12 @@ AccelerometerStrategy = _AccelerometerStrategy()
 
 class AccelerometerTranslator(Translator):
 
-    def __init__(self, strategy, key, bpm):
+    def __init__(self, strategy, key, bpm, snap=SNAP_UP):
         self.strategy = strategy
         self.key = key
         self.bpm = bpm
+        self.snap = snap
+        self.snap_table = build_snap_table(key, snap)
         self.x = None
         self.y = None
         self.z = None
@@ -86,19 +147,8 @@ class AccelerometerTranslator(Translator):
         self.x, self.y, self.z = accelerometer.acceleration
 
     def translate(self):
-        pitch = self.strategy.get_pitch(self.x)
-        composed_note = None
-
-        while pitch in PITCHES.values():
-            try:
-                composed_note = ComposedNote.from_pitch(pitch, self.key.notes)
-                print('COMPOSED NOTE FROM {x}: {composed_note}'.format(x=self.x, composed_note=composed_note))
-                break
-            except UnavailableNoteError:
-                pitch = pitch.increase(semitones=1)
-
-        if composed_note is None:
-            raise Exception('Failed to translate x value to a ComposedNote: x={x}'.format(x=self.x))
+        composed_note = self.snap_table[self.strategy.get_piano_index(self.x)]
+        print('COMPOSED NOTE FROM {x}: {composed_note}'.format(x=self.x, composed_note=composed_note))
 
         velocity = self.strategy.get_velocity(self.y)
         note_value = self.strategy.get_note_value(self.z)
@@ -106,6 +156,39 @@ class AccelerometerTranslator(Translator):
         midi_note = midi.MidiNote(composed_note, velocity, duration=duration)
         return midi_note
 
+    def translate_batch(self, x, y, z, start=0.0):
+        """
+        Translate whole arrays of recorded x, y and z values at once.
+        Notes are played one after another, like translate() in a loop,
+        with the first one starting at `start` seconds.
+
+        Returns a NumPy structured array with one MIDI event per sample:
+            start, duration: seconds
+            number: MIDI note number
+            velocity: 0 to 127
+            note_value: the NoteValue's factor (4 for a quarter note, ...)
+        """
+        import numpy as np
+
+        piano_indexes = self.strategy.get_piano_indexes(x)
+        velocities = self.strategy.get_velocities(y)
+        factors = self.strategy.get_note_value_factors(z)
+
+        midi_numbers = np.array([composed_note.midi_number for composed_note in self.snap_table], dtype=np.int64)
+
+        # Same arithmetic as midi.get_duration_seconds, one array at a time.
+        rhythm_factors = midi.STANDARD_BEAT_VALUE / factors
+        note_values_per_minute = self.bpm / rhythm_factors
+        durations = 60 / note_values_per_minute
+
+        events = np.zeros(len(piano_indexes), dtype=MIDI_EVENT_DTYPE)
+        events['start'] = start + np.concatenate(([0.0], np.cumsum(durations)[:-1]))
+        events['duration'] = durations
+        events['number'] = midi_numbers[piano_indexes]
+        events['velocity'] = velocities
+        events['note_value'] = factors
+        return events
+
 
 class MockAccelerometer(AccelerometerTranslator):
     _x = []
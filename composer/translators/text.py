@@ -2,6 +2,79 @@ import string
 
 from the_blood.models import Key
 
+# What to do with characters that aren't letters
+RAISE = 'raise'  # Raise NotImplementedError.
+SKIP = 'skip'  # Leave them out of the phrase.
+REST = 'rest'  # Put a rest (None) in the phrase.
+NON_LETTER_POLICIES = (RAISE, SKIP, REST)
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Every byte's scale degree: a and h are the tonic, b and i the second, and so on
+# through the alphabet in either case. Anything that isn't a letter is NON_LETTER.
+NON_LETTER = 7
+CHAR_TO_DEGREE = bytes(
+    string.ascii_lowercase.index(chr(b).lower()) % 7 if chr(b) in string.ascii_letters else NON_LETTER
+    for b in range(256)
+)
+
+PHRASE_CACHE_SIZE = 1 << 16
+
+_degree_notes = {}
+
+
+#######################################################################
+def get_degree_notes(key):
+    """
+    The notes of the key's scale by degree, indexed by CHAR_TO_DEGREE's values.
+    NON_LETTER gives None, a rest. Cached per key.
+    """
+    try:
+        return _degree_notes[key.name]
+    except KeyError:
+        notes = tuple(key.scale[i] for i in range(7)) + (None,)
+        _degree_notes[key.name] = notes
+        return notes
+
+
+#######################################################################
+def iter_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Text from a string, a text file (anything with a read method) or an
+    iterable of strings, `chunk_size` characters at a time. A file opened in
+    binary mode raises TypeError.
+    """
+    if isinstance(source, str):
+        for i in range(0, len(source), chunk_size):
+            yield source[i:i + chunk_size]
+    elif hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            if not isinstance(chunk, str):
+                raise TypeError('Cannot translate {}, open the file in text mode.'.format(type(chunk).__name__))
+            yield chunk
+    else:
+        yield from source
+
+
+#######################################################################
+def iter_words(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    The whitespace separated words of the source, read one chunk at a time.
+    A word cut in two by the end of a chunk is held back until the next one.
+    """
+    partial = ''
+    for chunk in iter_chunks(source, chunk_size):
+        if not chunk:
+            continue
+        words = (partial + chunk).split()
+        partial = words.pop() if words and not chunk[-1].isspace() else ''
+        yield from words
+    if partial:
+        yield partial
+
 
 #######################################################################
 def divisible_by(word, i):
@@ -12,17 +85,28 @@ def divisible_by(word, i):
 class TextTranslator:
 
     ####################################################################
-    def __init__(self, text):
+    def __init__(self, text, non_letters=RAISE):
         self.text = text
-        self.words = self.text.split(' ')
+        self.non_letters = non_letters
+        # Split the same way as iter_words, so both translators hear the same words.
+        self.words = self.text.split()
+        if not self.words:
+            raise ValueError('Cannot translate empty text.')
+        self.first_word = self.words[0]
         self.key = self._calculate_key()
+        self._degree_notes = get_degree_notes(self.key)
+        self._phrases = {}
         # self.chords = self._calculate_chords()
         self.melody = self._calculate_melody()
         self.time_signature = self._calculate_time_signature()
 
     ####################################################################
     def _calculate_key(self):
-        first_word = self.words[0]
+        if self.non_letters not in NON_LETTER_POLICIES:
+            error = 'Invalid non-letter policy {policy}. Must be one of {policies}.'
+            raise ValueError(error.format(policy=self.non_letters, policies=NON_LETTER_POLICIES))
+
+        first_word = self.first_word
         if divisible_by(first_word, 4):
             return Key('C')
         elif divisible_by(first_word, 2):
@@ -31,17 +115,17 @@ class TextTranslator:
             # Update this with logic for number of sharps/flats
             return Key('A')
         else:
-            raise NotImplementedError()
+            raise NotImplementedError(f"Don't know the key of a {len(first_word)} letter first word yet.")
 
     ####################################################################
     def _calculate_time_signature(self):
-        first_word = self.words[0]
+        first_word = self.first_word
         if divisible_by(first_word, 2):
             return '4/4'
         elif divisible_by(first_word, 3):
             return '3/4'
         else:
-            raise NotImplementedError()
+            raise NotImplementedError(f"Don't know the time signature of a {len(first_word)} letter first word yet.")
 
     ####################################################################
     # def _calculate_chords(self):
@@ -57,23 +141,69 @@ class TextTranslator:
 
     ####################################################################
     def _calculate_melody(self):
-        melody = []
+        return list(self.phrases())
+
+    ####################################################################
+    def phrases(self):
         for word in self.words:
-            phrase = []
-            for char in word:
-                note = self._get_note_from_char(char)
-                if note:
-                    phrase.append(note)
-            melody.append(tuple(phrase))
-        return melody
+            yield self._get_phrase(word)
+
+    ####################################################################
+    def _get_phrase(self, word):
+        # Words repeat a lot in real text, so each one is only translated once.
+        try:
+            return self._phrases[word]
+        except KeyError:
+            pass
+        phrase = self._translate_word(word)
+        if len(self._phrases) >= PHRASE_CACHE_SIZE:
+            self._phrases.clear()
+        self._phrases[word] = phrase
+        return phrase
+
+    ####################################################################
+    def _translate_word(self, word):
+        # One byte per character, so positions in `degrees` are positions in `word`.
+        degrees = word.encode('ascii', 'replace').translate(CHAR_TO_DEGREE)
+        if NON_LETTER in degrees:
+            if self.non_letters == RAISE:
+                char = word[degrees.index(NON_LETTER)]
+                raise NotImplementedError(f"Don't know how to convert {char} yet.")
+            elif self.non_letters == SKIP:
+                degrees = degrees.replace(bytes([NON_LETTER]), b'')
+        return tuple(map(self._degree_notes.__getitem__, degrees))
 
     ####################################################################
     def _get_note_from_char(self, char):
-        char = char.lower()
-        if char in string.ascii_lowercase:
-            i = string.ascii_lowercase.index(char)
-            while i > 6:
-                i -= 7
-            note = self.key.scale[i]
-            return note
-        raise NotImplementedError(f"Don't know how to convert {char} yet.")
+        note = self._degree_notes[CHAR_TO_DEGREE[ord(char)] if ord(char) < 256 else NON_LETTER]
+        if note is None:
+            raise NotImplementedError(f"Don't know how to convert {char} yet.")
+        return note
+
+
+#######################################################################
+class StreamingTextTranslator(TextTranslator):
+    """
+    A TextTranslator for text too big to hold in memory. The source is a
+    string, a text file or an iterable of strings, and is read `chunk_size`
+    characters at a time as phrases() is iterated. Only the first word is read
+    up front, for the key and time signature. phrases() can be iterated once.
+    """
+
+    ####################################################################
+    def __init__(self, source, non_letters=SKIP, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.non_letters = non_letters
+        self._words = iter_words(source, chunk_size)
+        self.first_word = next(self._words, None)
+        if self.first_word is None:
+            raise ValueError('Cannot translate empty text.')
+        self.key = self._calculate_key()
+        self._degree_notes = get_degree_notes(self.key)
+        self._phrases = {}
+        self.time_signature = self._calculate_time_signature()
+
+    ####################################################################
+    def phrases(self):
+        yield self._get_phrase(self.first_word)
+        for word in self._words:
+            yield self._get_phrase(word)
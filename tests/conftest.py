@@ -0,0 +1,123 @@
+"""
+Options for the performance tests in test_performance.py, which only run
+with --performance:
+
+    python -m pytest tests/test_performance.py --performance
+    python -m pytest tests/test_performance.py --performance --save-baselines
+
+Each benchmark's median is compared with its baseline in
+performance_baselines.json, and the test fails if it is more than the
+regression threshold slower. A benchmark listed under "thresholds" there
+uses its own threshold instead of the default one. Baselines depend on the machine, so record
+them again with --save-baselines when moving to a different one.
+"""
+import json
+import os
+import platform
+
+import pytest
+
+BASELINES_FILE = os.path.join(os.path.dirname(__file__), 'performance_baselines.json')
+DEFAULT_REGRESSION_THRESHOLD = 0.5
+
+
+#######################################################################
+def pytest_addoption(parser):
+    group = parser.getgroup('performance')
+    group.addoption('--performance', action='store_true', help='Run the performance tests.')
+    group.addoption('--save-baselines', action='store_true',
+                    help='Record the performance tests\' medians as their new baselines.')
+    group.addoption('--regression-threshold', type=float, default=None,
+                    help='How much slower than its baseline a benchmark may be, as a fraction. '
+                         'Overrides the thresholds in {}.'.format(os.path.basename(BASELINES_FILE)))
+
+
+#######################################################################
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'performance: a benchmark compared against a stored baseline')
+
+
+#######################################################################
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--performance'):
+        return
+    skip = pytest.mark.skip(reason='performance tests only run with --performance')
+    for item in items:
+        if 'performance' in item.keywords:
+            item.add_marker(skip)
+
+
+#######################################################################
+def _load_baselines():
+    try:
+        with open(BASELINES_FILE) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {'threshold': DEFAULT_REGRESSION_THRESHOLD, 'thresholds': {}, 'machine': None, 'medians': {}}
+
+
+#######################################################################
+@pytest.fixture(scope='session')
+def baselines(request):
+    baselines = _load_baselines()
+    yield baselines
+    if request.config.getoption('--save-baselines'):
+        baselines['machine'] = '{} {}, Python {}'.format(platform.system(), platform.machine(),
+                                                         platform.python_version())
+        with open(BASELINES_FILE, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+
+#######################################################################
+class CheckedBenchmark:
+    """
+    pytest-benchmark's benchmark fixture, failing the test when the median
+    is further above its baseline than the threshold allows.
+    """
+
+    ####################################################################
+    def __init__(self, benchmark, name, baselines, threshold, save):
+        self.benchmark = benchmark
+        self.name = name
+        self.baselines = baselines
+        if threshold is None:
+            threshold = baselines.get('thresholds', {}).get(name, baselines['threshold'])
+        self.threshold = threshold
+        self.save = save
+
+    ####################################################################
+    def __call__(self, function, *args, **kwargs):
+        result = self.benchmark(function, *args, **kwargs)
+        self._check()
+        return result
+
+    ####################################################################
+    def pedantic(self, function, **kwargs):
+        result = self.benchmark.pedantic(function, **kwargs)
+        self._check()
+        return result
+
+    ####################################################################
+    def _check(self):
+        if self.benchmark.disabled:
+            return
+        median = self.benchmark.stats.stats.median
+        medians = self.baselines['medians']
+        if self.save:
+            medians[self.name] = median
+            return
+
+        baseline = medians.get(self.name)
+        if baseline is not None and median > baseline * (1 + self.threshold):
+            error = '{name} took {median:.3g}s, {slower:.0%} slower than its baseline of {baseline:.3g}s.'
+            pytest.fail(error.format(name=self.name, median=median, baseline=baseline,
+                                     slower=median / baseline - 1))
+
+
+#######################################################################
+@pytest.fixture
+def checked_benchmark(benchmark, baselines, request):
+    config = request.config
+    return CheckedBenchmark(benchmark, request.node.name, baselines,
+                            config.getoption('--regression-threshold'), config.getoption('--save-baselines'))
@@ -2,11 +2,12 @@ import time
 from unittest import TestCase, mock
 
 import adafruit_midi
+import numpy
 from adafruit_midi.note_off import NoteOff
 from adafruit_midi.note_on import NoteOn
 
 from composer import midi
-from composer.compose import ComposedNote
+from composer.compose import ComposedNote, SNAP_DOWN
 from composer.translators import accelerometer
 from composer.translators.accelerometer import NOTE_VALUE_UNIT, NOTE_VALUE_REMAINDER
 from the_blood.models import *
@@ -122,6 +123,46 @@ class TestAccelerometer(TestCase):
         for z in range(NOTE_VALUE_UNIT*5, NOTE_VALUE_UNIT*6 + NOTE_VALUE_REMAINDER):
             self.assertEqual(WholeNote, self.acc.strategy.get_note_value(z))
 
+    def test_lookup_tables_match_arithmetic(self):
+        # The arithmetic the strategy used before compiling it into tables.
+        def get_pitch(x):
+            if x > accelerometer.PITCH_UNIT * 43:
+                return self.acc.strategy.middle_f_and_higher[-1]
+            elif x <= accelerometer.PITCH_UNIT * 43 * -1:
+                return self.acc.strategy.pitches_lower_than_middle_f[0]
+            index = int(x / accelerometer.PITCH_UNIT)
+            if index < 0:
+                return self.acc.strategy.pitches_lower_than_middle_f[index]
+            return self.acc.strategy.middle_f_and_higher[index]
+
+        def get_velocity(y):
+            if y == 0:
+                return midi.MAX_VELOCITY
+            elif abs(y) >= accelerometer.ACC_MAX - accelerometer.VELOCITY_UNIT - 1:
+                return 0
+            return abs(abs(int(y / accelerometer.VELOCITY_UNIT)) - 127)
+
+        def get_note_value(z):
+            if abs(z) >= accelerometer.ACC_MAX - NOTE_VALUE_REMAINDER:
+                return WholeNote
+            sorted_by_factor = sorted(NOTE_VALUES.values(), key=lambda nv: nv.factor, reverse=True)
+            return sorted_by_factor[int(abs(z / NOTE_VALUE_UNIT))]
+
+        for value in range(accelerometer.ACC_MIN, accelerometer.ACC_MAX + 1):
+            self.assertIs(get_pitch(value), self.acc.strategy.get_pitch(value), msg=f'x: {value}')
+            self.assertEqual(get_velocity(value), self.acc.strategy.get_velocity(value), msg=f'y: {value}')
+            self.assertIs(get_note_value(value), self.acc.strategy.get_note_value(value), msg=f'z: {value}')
+
+    def test_translate_snaps_into_key(self):
+        # x = PITCH_UNIT is F#4, which isn't in C major.
+        self.acc.x, self.acc.y, self.acc.z = accelerometer.PITCH_UNIT, 0, 0
+        with mock.patch('builtins.print'):
+            self.assertEqual('G4', str(self.acc.translate().note))
+
+            acc = accelerometer.MockAccelerometer(accelerometer.AccelerometerStrategy, Key('C'), 120, snap=SNAP_DOWN)
+            acc.x, acc.y, acc.z = accelerometer.PITCH_UNIT, 0, 0
+            self.assertEqual('F4', str(acc.translate().note))
+
     def assert_midi_command(self, expected, actual):
         if expected is None:
             self.assertEqual(None, actual)
@@ -195,3 +236,61 @@ class TestAccelerometer(TestCase):
                     print(end_command)
                     midi_controller.send(end_command)
                     midi_note = None
+
+
+class TestAccelerometerBatch(TestCase):
+
+    def setUp(self):
+        bpm = 120
+        key = Key('C')
+        self.acc = accelerometer.MockAccelerometer(accelerometer.AccelerometerStrategy, key, bpm)
+        self.every_value = numpy.arange(accelerometer.ACC_MIN, accelerometer.ACC_MAX + 1)
+
+    def test_get_piano_indexes(self):
+        piano = list(PianoRange)
+        indexes = self.acc.strategy.get_piano_indexes(self.every_value)
+        for x, index in zip(self.every_value.tolist(), indexes.tolist()):
+            self.assertEqual(self.acc.strategy.get_pitch(x), piano[index], msg=f'x: {x}')
+
+    def test_get_velocities(self):
+        velocities = self.acc.strategy.get_velocities(self.every_value)
+        for y, velocity in zip(self.every_value.tolist(), velocities.tolist()):
+            self.assertEqual(self.acc.strategy.get_velocity(y), velocity, msg=f'y: {y}')
+
+        with self.assertRaises(AssertionError):
+            self.acc.strategy.get_velocities([accelerometer.ACC_MAX + 1])
+
+    def test_get_note_value_factors(self):
+        factors = self.acc.strategy.get_note_value_factors(self.every_value)
+        for z, factor in zip(self.every_value.tolist(), factors.tolist()):
+            self.assertEqual(self.acc.strategy.get_note_value(z).factor, factor, msg=f'z: {z}')
+
+        with self.assertRaises(AssertionError):
+            self.acc.strategy.get_note_value_factors([accelerometer.ACC_MIN - 1])
+
+    def test_get_note_value_at_minimum(self):
+        self.assertEqual(WholeNote, self.acc.strategy.get_note_value(accelerometer.ACC_MIN))
+
+    def test_translate_batch(self):
+        x = numpy.arange(accelerometer.ACC_MIN, accelerometer.ACC_MAX + 1, 97)
+        y = numpy.roll(x, 11)
+        z = numpy.roll(x, 23)
+        events = self.acc.translate_batch(x, y, z, start=2.0)
+        self.assertEqual(len(x), len(events))
+
+        start = 2.0
+        with mock.patch('builtins.print'):
+            for event, values in zip(events, zip(x.tolist(), y.tolist(), z.tolist())):
+                self.acc.x, self.acc.y, self.acc.z = values
+                midi_note = self.acc.translate()
+                self.assertEqual(midi_note.number, event['number'], msg=f'values: {values}')
+                self.assertEqual(midi_note.velocity, event['velocity'], msg=f'values: {values}')
+                self.assertAlmostEqual(midi_note.duration, event['duration'])
+                self.assertAlmostEqual(start, event['start'])
+                start += midi_note.duration
+
+    def test_translate_batch_moves_pitches_into_key(self):
+        c_major_pitch_classes = {0, 2, 4, 5, 7, 9, 11}
+        events = self.acc.translate_batch(self.every_value, self.every_value, self.every_value)
+        for number in set(events['number'].tolist()):
+            self.assertIn(number % 12, c_major_pitch_classes, msg=f'number: {number}')
@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from composer import compose
 from composer.compose import ComposedNote
 from the_blood.models import *
 
@@ -17,3 +18,56 @@ class TestComposedNote(TestCase):
         self.assertEqual(A, composed_note.note)
         self.assertEqual(pitch440, composed_note.pitch)
         self.assertEqual(a4, composed_note)
+
+
+class TestSnapTable(TestCase):
+
+    def retry_up(self, pitch, key):
+        # How the accelerometer translator found a note in the key before snap tables.
+        while True:
+            try:
+                return ComposedNote.from_pitch(pitch, key.notes)
+            except UnavailableNoteError:
+                pitch = pitch.increase(semitones=1)
+
+    def test_snap_up(self):
+        for key in (Key('C'), Key('Bb'), Key('F#'), Key('Ebm')):
+            table = compose.build_snap_table(key, compose.SNAP_UP)
+            self.assertEqual(len(list(PianoRange)), len(table))
+            for pitch, composed_note in zip(PianoRange, table):
+                expected = self.retry_up(pitch, key)
+                self.assertEqual(expected.name, composed_note.name, msg=f'{key}: {pitch}')
+                self.assertEqual(expected.midi_number, composed_note.midi_number, msg=f'{key}: {pitch}')
+
+    def test_snap_down(self):
+        c_major = {note.name for note in Key('C').notes}
+        table = compose.build_snap_table(Key('C'), compose.SNAP_DOWN)
+        for pitch, composed_note in zip(PianoRange, table):
+            self.assertIn(composed_note.name, c_major)
+            self.assertLessEqual(composed_note.pitch, pitch)
+            self.assertGreater(composed_note.pitch.increase(2), pitch)
+
+        piano = list(PianoRange)
+        self.assertEqual('A0', str(table[piano.index(Pitch(29.14))]))
+        self.assertEqual('C4', str(table[piano.index(Pitch(277.18))]))
+
+    def test_snap_nearest(self):
+        # Notes of a major key are at most a whole step apart, so every pitch
+        # outside the key is a tie and goes up.
+        up = compose.build_snap_table(Key('D'), compose.SNAP_UP)
+        nearest = compose.build_snap_table(Key('D'), compose.SNAP_NEAREST)
+        self.assertEqual([n.midi_number for n in up], [n.midi_number for n in nearest])
+
+    def test_snap_past_the_ends_of_the_piano(self):
+        # C8 is not in F# major, so it moves up off the piano to C#8.
+        table = compose.build_snap_table(Key('F#'), compose.SNAP_UP)
+        self.assertEqual('C#8', str(table[-1]))
+        self.assertEqual(109, table[-1].midi_number)
+
+        # A0 is not in Ab major, so it moves down off the piano to Ab0.
+        table = compose.build_snap_table(Key('Ab'), compose.SNAP_DOWN)
+        self.assertEqual('Ab0', str(table[0]))
+
+    def test_invalid_direction(self):
+        with self.assertRaises(ValueError):
+            compose.build_snap_table(Key('C'), 'sideways')
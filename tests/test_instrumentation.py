@@ -0,0 +1,158 @@
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from composer import compose, instrumentation, midi
+from composer.translators import accelerometer
+from the_blood import models
+from the_blood.models import *
+
+
+class FakeClock:
+    """
+    Every call is one tick (1 second) later than the last.
+    """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+class FakeMidi:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, command):
+        self.sent.append(command)
+
+
+class TestCallStats(TestCase):
+
+    def test_percentiles(self):
+        stats = instrumentation.CallStats('f')
+        for latency in range(1, 101):
+            stats.add(latency / 1000)
+        self.assertEqual(100, stats.calls)
+        self.assertAlmostEqual(5.05, stats.total)
+        self.assertAlmostEqual(0.0505, stats.mean)
+        self.assertEqual(0.1, stats.max)
+        self.assertEqual(0.05, stats.percentile(50))
+        self.assertEqual(0.09, stats.percentile(90))
+        self.assertEqual(0.099, stats.percentile(99))
+        self.assertEqual(0.0, instrumentation.CallStats('g').percentile(50))
+
+    def test_percentiles_are_over_the_latest_samples(self):
+        stats = instrumentation.CallStats('f', samples=4)
+        for latency in (9, 9, 9, 9, 1, 2, 3, 4):
+            stats.add(latency)
+        self.assertEqual(8, stats.calls)
+        self.assertEqual(4, stats.percentile(100))
+        self.assertEqual(9, stats.max)
+
+
+class TestInstrumentation(TestCase):
+
+    def test_wraps_only_while_enabled(self):
+        pitch_map = models.PitchMap
+        from_pitch = vars(compose.ComposedNote)['from_pitch']
+        start_command = midi.MidiNote.get_start_command
+
+        with instrumentation.Instrumentation() as instruments:
+            self.assertTrue(instruments.enabled)
+            # Replaced where it's defined and everywhere it was imported to.
+            self.assertIsNot(pitch_map, models.PitchMap)
+            self.assertIs(models.PitchMap, compose.PitchMap)
+            self.assertIsInstance(vars(compose.ComposedNote)['from_pitch'], classmethod)
+            self.assertIsNot(start_command, midi.MidiNote.get_start_command)
+
+        self.assertFalse(instruments.enabled)
+        self.assertIs(pitch_map, models.PitchMap)
+        self.assertIs(pitch_map, compose.PitchMap)
+        self.assertIs(from_pitch, vars(compose.ComposedNote)['from_pitch'])
+        self.assertIs(start_command, midi.MidiNote.get_start_command)
+
+    def test_counts_and_times_calls(self):
+        targets = ('composer.compose:ComposedNote.from_pitch', 'the_blood.models:PitchMap')
+        instruments = instrumentation.Instrumentation(targets, caches=(), clock=FakeClock())
+        with instruments:
+            note = compose.ComposedNote.from_pitch(Pitch(440), Key('C').notes)
+        self.assertEqual(compose.ComposedNote('A', 4), note)
+
+        data = instruments.as_dict()
+        self.assertEqual(['ComposedNote.from_pitch', 'PitchMap'], list(data['calls']))
+        # from_pitch's two clock reads are either side of PitchMap's four (it's called twice).
+        self.assertEqual({'calls': 1, 'total': 5.0, 'mean': 5.0, 'max': 5.0, 'p50': 5.0, 'p90': 5.0, 'p99': 5.0},
+                         data['calls']['ComposedNote.from_pitch'])
+        self.assertEqual(2, data['calls']['PitchMap']['calls'])
+        self.assertEqual(2.0, data['calls']['PitchMap']['total'])
+
+        # Calls after disable() aren't counted.
+        compose.ComposedNote.from_pitch(Pitch(440), Key('C').notes)
+        self.assertEqual(1, instruments.stats['ComposedNote.from_pitch'].calls)
+
+    def test_device_loop(self):
+        instruments = instrumentation.Instrumentation()
+        midi_out = FakeMidi()
+        with instruments:
+            instruments.instrument(midi_out, 'send', 'MIDI.send')
+            translator = accelerometer.MockAccelerometer(accelerometer.AccelerometerStrategy, Key('Bb'), 120)
+            with mock.patch('builtins.print'):
+                for _ in range(10):
+                    translator.receive(None)
+                    midi_out.send(translator.translate().get_start_command())
+        self.assertNotIn('send', vars(midi_out))
+        self.assertEqual(10, len(midi_out.sent))
+
+        calls = instruments.as_dict()['calls']
+        for name in ('MIDI.send', 'AccelerometerTranslator.translate', 'MidiNote.get_start_command',
+                     'get_duration_seconds', '_AccelerometerStrategy.get_velocity'):
+            self.assertEqual(10, calls[name]['calls'], msg=name)
+        # Most total time first.
+        totals = [stats['total'] for stats in calls.values()]
+        self.assertEqual(sorted(totals, reverse=True), totals)
+
+    def test_instrument_needs_enable(self):
+        with self.assertRaises(RuntimeError):
+            instrumentation.Instrumentation(targets=()).instrument(FakeMidi(), 'send')
+
+    def test_cache_hit_rates(self):
+        Key('E')
+        instruments = instrumentation.Instrumentation(targets=())
+        with instruments:
+            Key('E')
+            Key('E')
+        caches = instruments.cache_stats()
+        self.assertEqual(2, caches['SCALE_CACHE']['hits'])
+        self.assertEqual(0, caches['SCALE_CACHE']['misses'])
+        self.assertEqual(1.0, caches['SCALE_CACHE']['hit_rate'])
+
+        instruments.reset()
+        self.assertEqual(0.0, instruments.cache_stats()['SCALE_CACHE']['hit_rate'])
+
+        cache = LRUCache()
+        instruments.watch_cache('mine', cache)
+        cache.put(1, 1)
+        cache.get(1)
+        with self.assertRaises(KeyError):
+            cache.get(2)
+        self.assertEqual(0.5, instruments.cache_stats()['mine']['hit_rate'])
+
+    def test_report_and_export(self):
+        targets = ('the_blood.models:PitchMap',)
+        instruments = instrumentation.Instrumentation(targets, clock=FakeClock())
+        with instruments:
+            PitchMap(440)
+
+        lines = instruments.report().splitlines()
+        self.assertEqual(['function', 'calls', 'total', 'mean', 'p50', 'p90', 'p99', 'max'], lines[0].split())
+        self.assertEqual(['PitchMap', '1'] + ['1000000.0'] * 6, lines[1].split())
+        self.assertIn('SCALE_CACHE', instruments.report())
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'timings.json')
+            instruments.export(path)
+            with open(path) as f:
+                self.assertEqual(instruments.as_dict(), json.load(f))
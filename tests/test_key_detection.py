@@ -0,0 +1,113 @@
+import math
+from unittest import TestCase
+
+from composer.compose import ComposedNote
+from the_blood.key_detection import KeyEstimator, MAJOR_PROFILE, get_detectable_keys
+from the_blood.models import *
+
+
+#######################################################################
+def correlation(xs, ys):
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    dx = [x - x_mean for x in xs]
+    dy = [y - y_mean for y in ys]
+    return sum(x * y for x, y in zip(dx, dy)) / math.sqrt(sum(x * x for x in dx) * sum(y * y for y in dy))
+
+
+#######################################################################
+class TestKeyEstimator(TestCase):
+
+    ####################################################################
+    def test_detectable_keys(self):
+        keys = get_detectable_keys()
+        self.assertEqual(24, len(keys))
+        self.assertEqual(['C', 'Db', 'D', 'Eb', 'E', 'F', 'F#', 'G', 'Ab', 'A', 'Bb', 'B'],
+                         [key.name for key in keys[:12]])
+        self.assertEqual(['Cm', 'C#m', 'Dm', 'D#m', 'Em', 'Fm', 'F#m', 'Gm', 'G#m', 'Am', 'Bbm', 'Bm'],
+                         [key.name for key in keys[12:]])
+
+    ####################################################################
+    def test_no_notes(self):
+        estimator = KeyEstimator()
+        self.assertIsNone(estimator.key)
+        self.assertEqual(0, estimator.confidence)
+
+    ####################################################################
+    def test_major_and_minor(self):
+        estimator = KeyEstimator()
+        for name in 'C D E F G A B C G E C'.split():
+            estimator.add(name)
+        self.assertEqual('C', estimator.key.name)
+        self.assertGreater(estimator.confidence, 0.9)
+
+        for name in 'A B C D E F G# A E C B G# A'.split():
+            estimator.add(name)
+        self.assertEqual('Am', estimator.key.name)
+        ranked = estimator.ranked()
+        self.assertEqual(estimator.key, ranked[0][0])
+        self.assertEqual(estimator.confidence, ranked[0][1])
+
+    ####################################################################
+    def test_follows_a_modulation(self):
+        estimator = KeyEstimator(decay=0.8)
+        for name in 'C D E F G A B C G E C'.split() * 3:
+            estimator.add(name)
+        self.assertEqual('C', estimator.key.name)
+        for name in 'E F# G# A B C# D# E B G# E'.split() * 3:
+            estimator.add(name)
+        self.assertEqual('E', estimator.key.name)
+
+    ####################################################################
+    def test_matches_a_full_rescan(self):
+        decay = 0.7
+        estimator = KeyEstimator(decay=decay)
+        heard = [0, 4, 7, 11, 2, 5, 9, 0, 7, 4, 6, 1, 3, 8, 10] * 40
+        for i, pitch_class in enumerate(heard, 1):
+            estimator.add_pitch_class(pitch_class)
+
+        histogram = [0.0] * 12
+        weight = 1.0
+        for pitch_class in reversed(heard):
+            histogram[pitch_class] += weight
+            weight *= decay
+        for expected, actual in zip(histogram, estimator.histogram):
+            self.assertAlmostEqual(expected, actual)
+
+        c_major = [MAJOR_PROFILE[pitch_class] for pitch_class in range(12)]
+        self.assertAlmostEqual(correlation(histogram, c_major), estimator.correlations()[0])
+
+    ####################################################################
+    def test_rescales_weights(self):
+        estimator = KeyEstimator(decay=0.5)
+        for _ in range(2000):
+            estimator.add_pitch_class(0)
+            estimator.add_pitch_class(7)
+        self.assertLess(estimator._weight, 1e100)
+        self.assertAlmostEqual(2, sum(estimator.histogram))
+        self.assertTrue(all(math.isfinite(value) for value in estimator.correlations()))
+
+    ####################################################################
+    def test_one_pitch_class(self):
+        estimator = KeyEstimator()
+        estimator.add('C')
+        self.assertEqual(0, estimator.key.tonic.pitch_class)
+        self.assertEqual(24, len(estimator.ranked()))
+
+    ####################################################################
+    def test_note_types(self):
+        estimator = KeyEstimator()
+        estimator.add(Note('Gb'))
+        estimator.add(ComposedNote('F#', 4))
+        estimator.add_midi_number(66)
+        self.assertEqual((0,) * 6 + (3,) + (0,) * 5, tuple(round(value) for value in estimator.histogram))
+
+        estimator.reset()
+        self.assertEqual(0, estimator.count)
+        self.assertIsNone(estimator.key)
+
+    ####################################################################
+    def test_invalid_decay(self):
+        for decay in (0, -0.5, 1.5):
+            with self.assertRaises(ValueError):
+                KeyEstimator(decay=decay)
@@ -32,6 +32,20 @@ class TestMajorKey(TestCase):
         with self.assertRaises(InvalidQualityError):
             Key('A 4000')
 
+    ####################################################################
+    def test_cached_by_whole_quality(self):
+        for names in (('Abm7', 'Ab'), ('Ab', 'Abm7'), ('Eb9', 'Eb'), ('Eb', 'Eb9')):
+            SCALE_CACHE.clear()
+            first, second = (Key(name) for name in names)
+            self.assertIsNot(first, second)
+            self.assertEqual(names, (first.name, second.name))
+
+            major = Key(names[0][:2])
+            self.assertTrue(major.is_major())
+            self.assertEqual('Key({})'.format(major.name), repr(major))
+            self.assertIs(major, Key(major.name + ' major'))
+        self.assertFalse(Key('Abm7').is_major())
+
     ####################################################################
     def test_notes__natural(self):
         key_notes = Key('C').scale.notes
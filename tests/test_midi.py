@@ -4,8 +4,9 @@ from unittest import TestCase
 from adafruit_midi.note_on import NoteOn
 
 from composer.compose import ComposedNote
-from composer.midi import NOTE_CHANNEL_1_ON, MidiNote, get_duration_seconds
+from composer.midi import NOTE_CHANNEL_1_ON, MidiNote, get_duration_seconds, get_midi_number_from_note
 from composer.midi_data import MIDI_TO_PITCH_MAP
+from the_blood.models import *
 
 
 class TestMidi(TestCase):
@@ -25,6 +26,33 @@ class TestMidi(TestCase):
         send_note_off = bytes([NOTE_CHANNEL_1_ON, midi_note.number, 0])
         self.assertEqual(bytes([0x90, expected_midi_number, 0]), send_note_off)
 
+    def test_get_midi_number_from_note(self):
+        self.assertEqual(21, get_midi_number_from_note(ComposedNote('A', octave=0)))
+        self.assertEqual(60, get_midi_number_from_note(ComposedNote('C', octave=4)))
+        self.assertEqual(60, get_midi_number_from_note(ComposedNote('B#', octave=4)))
+        self.assertEqual(71, get_midi_number_from_note(ComposedNote('Cb', octave=4)))
+        self.assertEqual(108, get_midi_number_from_note(ComposedNote('C', octave=8)))
+
+        for midi_number, pitch in enumerate(PianoRange, start=21):
+            for note, octave in PitchMap(pitch):
+                if midi_number == 36 and (note, octave) == (Dbb, Octave(1)):
+                    continue  # PITCHES also lists C2 as Dbb1
+                self.assertEqual(midi_number, ComposedNote(note, octave).midi_number)
+
+    def test_midi_number__full_range(self):
+        lowest = ComposedNote('C', octave=-1)
+        self.assertEqual(0, lowest.midi_number)
+        self.assertEqual(MIDI_TO_PITCH_MAP[0], lowest.pitch)
+
+        highest = ComposedNote('G', octave=9)
+        self.assertEqual(127, highest.midi_number)
+        self.assertEqual(MIDI_TO_PITCH_MAP[127], highest.pitch)
+
+        with self.assertRaises(InvalidNoteError):
+            ComposedNote('G#', octave=9)
+        with self.assertRaises(InvalidNoteError):
+            ComposedNote('B', octave=-2)
+
     def test_get_duration_seconds(self):
         bpm = 120
 
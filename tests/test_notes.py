@@ -1,3 +1,4 @@
+import pickle
 from unittest import TestCase
 
 from the_blood.models import *
@@ -128,3 +129,34 @@ class TestNote(TestCase):
         self.assertNotEqual(C_sharp, B)
         self.assertNotEqual(C_sharp, B_sharp)
         self.assertNotEqual(C_sharp, C)
+
+    ####################################################################
+    def test_pitch_class(self):
+        self.assertEqual(0, C.pitch_class)
+        self.assertEqual(0, B_sharp.pitch_class)
+        self.assertEqual(0, D_double_flat.pitch_class)
+        self.assertEqual(11, C_flat.pitch_class)
+        self.assertEqual(A_sharp.pitch_class, B_flat.pitch_class)
+        self.assertEqual(9, G_double_sharp.pitch_class)
+
+    ####################################################################
+    def test_interned(self):
+        self.assertIs(C_sharp, Note('C#'))
+        self.assertIs(C_sharp, Note('c sharp'))
+        self.assertIs(C_sharp, Note(C_sharp))
+        self.assertIsNot(C_sharp, D_flat)
+
+    ####################################################################
+    def test_interned_by_name_only(self):
+        # Other spellings don't grow the table, however many arrive.
+        interned = Note._Note__interned
+        size = len(interned)
+        for spelling in (' C', 'c ', 'E flat', 'c  sharp', 'C-sharp', 'd_flat'):
+            Note(spelling)
+        self.assertEqual(size, len(interned))
+        self.assertTrue(all(key == note.name for key, note in interned.items()))
+        self.assertIs(C_sharp, Note('c  sharp'))
+
+    ####################################################################
+    def test_pickle(self):
+        self.assertIs(C_sharp, pickle.loads(pickle.dumps(C_sharp)))
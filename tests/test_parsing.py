@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+from the_blood import parsing
+from the_blood.models import *
+from the_blood.parsing import ParsedName, parse_name, parse_note, parse_quality
+
+
+#######################################################################
+class TestParseNote(TestCase):
+
+    ####################################################################
+    def test_spellings(self):
+        self.assertEqual(ParsedName('C', NATURAL, MAJOR, None), parse_note('C'))
+        for text in ('C#', 'c#', 'C sharp', 'c-sharp', 'C_sharp', ' C# '):
+            self.assertEqual(ParsedName('C', SHARP, MAJOR, None), parse_note(text), msg=text)
+        for text in ('Ebb', 'E double flat', 'e-double-flat', 'E doubleflat'):
+            self.assertEqual(ParsedName('E', DOUBLE_FLAT, MAJOR, None), parse_note(text), msg=text)
+        self.assertEqual(ParsedName('B', FLAT, MAJOR, None), parse_note('B flat'))
+        self.assertEqual(ParsedName('F', DOUBLE_SHARP, MAJOR, None), parse_note('F##'))
+
+    ####################################################################
+    def test_octaves(self):
+        self.assertEqual(ParsedName('F', SHARP, MAJOR, 4), parse_note('F#4'))
+        self.assertEqual(ParsedName('B', NATURAL, MAJOR, -1), parse_note('B-1'))
+        self.assertEqual(ParsedName('C', SHARP, MAJOR, -1), parse_note('C#-1'))
+        self.assertEqual(ParsedName('A', FLAT, MAJOR, 10), parse_note('Ab 10'))
+
+    ####################################################################
+    def test_invalid(self):
+        for text in ('', 'H', '#', 'A#foo', 'Am', 'A###', 'C4#'):
+            self.assertIsNone(parse_note(text), msg=text)
+        with self.assertRaises(InvalidNoteError):
+            Note('H')
+        with self.assertRaises(InvalidNoteError):
+            Note('C4')
+
+    ####################################################################
+    def test_cached(self):
+        parsing.PARSED_NOTES.clear()
+        first = parse_note('G flat')
+        self.assertIs(first, parse_note('G flat'))
+        info = parsing.PARSED_NOTES.info()
+        self.assertEqual(1, info['hits'])
+        self.assertEqual(1, info['misses'])
+
+
+#######################################################################
+class TestParseName(TestCase):
+
+    ####################################################################
+    def test_keys(self):
+        self.assertEqual(ParsedName('A', NATURAL, MAJOR, None), parse_name('A'))
+        self.assertEqual(ParsedName('A', NATURAL, MINOR, None), parse_name('A minor'))
+        self.assertEqual(ParsedName('A', FLAT, MINOR, None), parse_name('Abm'))
+        self.assertEqual(ParsedName('F', SHARP, MINOR, None), parse_name('F sharp min'))
+        self.assertEqual(ParsedName('B', DOUBLE_FLAT, MAJOR, None), parse_name('Bbb'))
+        self.assertEqual('Ab', Key('A flat').name)
+
+    ####################################################################
+    def test_chords(self):
+        self.assertEqual(ParsedName('B', FLAT, MAJOR_ABBREVIATION + SEVENTH, None), parse_name('Bb maj7'))
+        self.assertEqual(ParsedName('C', SHARP, MINOR + ELEVENTH, None), parse_name('C# minor 11'))
+        self.assertEqual(ParsedName('G', NATURAL, NINTH, None), parse_name('G9'))
+
+    ####################################################################
+    def test_invalid(self):
+        self.assertIsNone(parse_name(''))
+        self.assertIsNone(parse_name('Hm'))
+        self.assertEqual(ParsedName('A', NATURAL, None, None), parse_name('A foo'))
+        with self.assertRaises(InvalidNoteError):
+            Key('H')
+        with self.assertRaises(InvalidQualityError):
+            Key('A 4000')
+
+    ####################################################################
+    def test_quality(self):
+        self.assertEqual(MINOR, parse_quality(' Min '))
+        self.assertEqual(MINOR + SEVENTH, parse_quality('minor 7'))
+        self.assertEqual(MINOR, parse_quality(Quality('minor')))
+        self.assertIsNone(parse_quality('sus4'))
+
+
+#######################################################################
+class TestImport(TestCase):
+
+    ####################################################################
+    def test_import_builds_nothing_it_does_not_need(self):
+        check = ('from the_blood import models, parsing; '
+                 'assert parsing._patterns is None; '
+                 'assert models._pitch_index is None; '
+                 'assert models._chord_table is None')
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, '-c', check], cwd=root, check=True)
+
+    ####################################################################
+    def test_patterns(self):
+        self.assertIs(parsing.SPELLED_NOTES['F#'], parse_note('F#'))
+        self.assertTrue(parsing.NOTE_PATTERN.match('c sharp 4'))
+        self.assertTrue(parsing.NAME_PATTERN.match('Bb maj7'))
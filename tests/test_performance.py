@@ -0,0 +1,117 @@
+"""
+Benchmarks of the hot paths in the_blood and composer, checked against
+performance_baselines.json. They only run with --performance (see conftest.py).
+"""
+import random
+from unittest import mock
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from composer.compose import ComposedNote
+from composer.midi import get_midi_number_from_note
+from composer.translators import accelerometer
+from composer.translators import text
+from composer.translators.text import TextTranslator
+from the_blood.models import *
+
+pytestmark = pytest.mark.performance
+
+# Calls per timed round for the sub-microsecond benchmarks, so each round
+# takes tens of microseconds and timer noise doesn't decide the median.
+BATCH = 100
+
+TONICS = tuple(Note(name + quality) for name in NATURAL_NOTES for quality in (NATURAL, SHARP, FLAT))
+NOTE_NAMES = ('C', 'C#', 'Db', 'D', 'D#', 'Eb', 'E', 'F', 'F#', 'Gb', 'G', 'G#', 'Ab', 'A', 'A#', 'Bb', 'B')
+
+
+#######################################################################
+def batched(function, *args):
+    # The result of calling function(*args) BATCH times.
+    for _ in range(BATCH - 1):
+        function(*args)
+    return function(*args)
+
+
+#######################################################################
+def build_every_tonic(build):
+    for tonic in TONICS:
+        try:
+            build(tonic)
+        except InvalidKeyError:
+            # This tonic would need triple sharps or flats.
+            pass
+
+
+#######################################################################
+def large_text(words=20000):
+    random.seed(0)
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    vocabulary = [''.join(random.choice(letters) for _ in range(random.randint(1, 10))) for _ in range(2000)]
+    # 'This' has four letters, which puts the text in C major.
+    return ' '.join(['This'] + [random.choice(vocabulary) for _ in range(words - 1)])
+
+
+#######################################################################
+def test_pitch_map__pitch_to_notes(checked_benchmark):
+    pitch = Pitch(440.0)
+    assert checked_benchmark(batched, PitchMap, pitch)
+
+
+#######################################################################
+def test_pitch_map__note_to_pitch(checked_benchmark):
+    assert checked_benchmark(batched, PitchMap, (A, Octave(4))) == Pitch(440.0)
+
+
+#######################################################################
+def test_pitch_increase(checked_benchmark):
+    assert checked_benchmark(batched, Pitch(440.0).increase, 3) == Pitch(523.25)
+
+
+#######################################################################
+def test_note_construction(checked_benchmark):
+    notes = checked_benchmark(lambda: [Note(name) for name in NOTE_NAMES])
+    assert len(notes) == len(NOTE_NAMES)
+
+
+#######################################################################
+@pytest.mark.parametrize('build', (
+    lambda tonic: Scale(tonic, MajorScale),
+    lambda tonic: Key(tonic.name + MINOR),
+    lambda tonic: Mode(tonic, DorianScale),
+), ids=('scale', 'key', 'mode'))
+def test_scale_construction__every_tonic(checked_benchmark, build):
+    # Clear the cache before each round, so every scale is built rather than looked up.
+    checked_benchmark.pedantic(build_every_tonic, args=(build,), setup=SCALE_CACHE.clear, rounds=20)
+
+
+#######################################################################
+def test_composed_note_from_pitch(checked_benchmark):
+    notes = Key('Eb').notes
+    assert checked_benchmark(batched, ComposedNote.from_pitch, Pitch(311.13), notes).name == 'Eb'
+
+
+#######################################################################
+def test_get_midi_number_from_note(checked_benchmark):
+    assert checked_benchmark(batched, get_midi_number_from_note, ComposedNote('A', 4)) == 69
+
+
+#######################################################################
+def test_accelerometer_translate(checked_benchmark):
+    translator = accelerometer.MockAccelerometer(accelerometer.AccelerometerStrategy, Key('C'), 120)
+
+    def translate():
+        translator.receive('<mock_accelerometer>')
+        return translator.translate()
+
+    with mock.patch('builtins.print'):
+        assert checked_benchmark(translate).note in Key('C').notes
+
+
+#######################################################################
+def test_text_translator__large_text(checked_benchmark):
+    words = large_text()
+    translator = checked_benchmark.pedantic(TextTranslator, args=(words,), kwargs={'non_letters': text.SKIP},
+                                            rounds=5)
+    assert len(translator.melody) == 20000
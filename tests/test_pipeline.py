@@ -0,0 +1,73 @@
+import asyncio
+from unittest import TestCase, mock
+
+from adafruit_midi.note_off import NoteOff
+from adafruit_midi.note_on import NoteOn
+
+from composer import pipeline
+from composer.translators import accelerometer
+from the_blood.models import *
+
+
+class FakeMidi:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, command):
+        self.sent.append(command)
+
+
+class TestTranslatorPipeline(TestCase):
+
+    def run_pipeline(self, samples, bpm=60000, **kwargs):
+        acc = accelerometer.MockAccelerometer(accelerometer.AccelerometerStrategy, Key('C'), bpm)
+        midi_out = FakeMidi()
+        translator_pipeline = pipeline.TranslatorPipeline(acc, '<mock_accelerometer>', midi_out, **kwargs)
+        with mock.patch('builtins.print'):
+            stats = asyncio.run(translator_pipeline.run(samples=samples))
+        return stats, midi_out.sent
+
+    def assert_every_note_ended(self, sent):
+        sounding = []
+        for command in sent:
+            if isinstance(command, NoteOn):
+                sounding.append(command.note)
+            else:
+                self.assertIsInstance(command, NoteOff)
+                sounding.remove(command.note)
+        self.assertEqual([], sounding)
+
+    def test_block(self):
+        stats, sent = self.run_pipeline(20, maxsize=2, backpressure=pipeline.BLOCK)
+        self.assertEqual(20, stats['read'].count)
+        self.assertEqual(20, stats['translate'].count)
+        self.assertEqual(20, stats['send'].count)
+        self.assertEqual(0, stats['translate'].dropped)
+        self.assertEqual(40, len(sent))
+        self.assert_every_note_ended(sent)
+
+    def test_drop_oldest(self):
+        stats, sent = self.run_pipeline(50, bpm=600, maxsize=2, backpressure=pipeline.DROP_OLDEST)
+        self.assertEqual(50, stats['read'].count)
+        self.assertGreater(stats['translate'].dropped, 0)
+        self.assertEqual(50, stats['translate'].count + stats['translate'].dropped)
+        self.assertEqual(stats['translate'].count, stats['send'].count)
+        self.assert_every_note_ended(sent)
+
+    def test_coalesce(self):
+        stats, sent = self.run_pipeline(50, bpm=600, maxsize=4, backpressure=pipeline.COALESCE)
+        self.assertGreater(stats['translate'].dropped, 0)
+        self.assertEqual(50, stats['translate'].count + stats['translate'].dropped)
+        self.assert_every_note_ended(sent)
+
+    def test_latency_counters(self):
+        stats, sent = self.run_pipeline(5, backpressure=pipeline.BLOCK)
+        for stage in stats.values():
+            self.assertEqual(5, stage.count)
+            self.assertGreaterEqual(stage.max_latency, stage.mean_latency)
+            self.assertGreaterEqual(stage.mean_latency, 0.0)
+
+    def test_invalid_backpressure(self):
+        acc = accelerometer.MockAccelerometer(accelerometer.AccelerometerStrategy, Key('C'), 120)
+        with self.assertRaises(ValueError):
+            pipeline.TranslatorPipeline(acc, None, FakeMidi(), backpressure='ignore')
@@ -1,5 +1,6 @@
 from unittest import TestCase
 
+from the_blood import models
 from the_blood.models import *
 
 
@@ -16,6 +17,44 @@ class TestPitchMap(TestCase):
         self.assertEqual(Pitch(16.35), PitchMap((C, Octave(0))))
         self.assertEqual(Pitch(16.35), PitchMap((B_sharp, Octave(0))))
 
+    ###################################################################
+    def test_pitch_map__unknown(self):
+        self.assertEqual(None, PitchMap(Pitch(16.36)))
+        self.assertEqual(None, PitchMap((C, Octave(9))))
+
+    ###################################################################
+    def test_pitch_map__round_trip(self):
+        for hz in PITCHES.values():
+            for note, octave in PitchMap(Pitch(hz)):
+                # Dbb1 is listed under both C1 and C2. The lowest pitch wins.
+                if (note, octave) == (D_double_flat, Octave(1)):
+                    continue
+                self.assertEqual(Pitch(hz), PitchMap((note, octave)))
+        self.assertEqual(Pitch(32.70), PitchMap((D_double_flat, Octave(1))))
+
+    ###################################################################
+    def test_semitone_pitches(self):
+        self.assertEqual(tuple(PITCHES.values()), SEMITONE_PITCHES)
+        self.assertEqual(440.00, SEMITONE_PITCHES[57])
+
+    ###################################################################
+    def test_piano_range(self):
+        pitches = list(PianoRange)
+        self.assertEqual(88, len(PianoRange))
+        self.assertEqual(Pitch(27.50), pitches[0])
+        self.assertEqual(Pitch(4186.01), pitches[-1])
+        self.assertEqual(list(SEMITONE_PITCHES[9:97]), [pitch.value for pitch in pitches])
+
+    ###################################################################
+    def test_lazy_tables(self):
+        # Built on first use, and the same tables PitchMap answers from.
+        self.assertEqual(len(PITCHES), len(models.PITCH_TO_NOTES))
+        self.assertEqual(PitchMap(Pitch(16.35)), models.PITCH_TO_NOTES[16.35])
+        self.assertEqual(Pitch(16.35), models.NOTE_TO_PITCH[(C, Octave(0))])
+        self.assertEqual(1 << PITCH_CLASS_COUNT, len(models.CHORD_TABLE))
+        with self.assertRaises(AttributeError):
+            models.NOT_A_TABLE
+
 
 #######################################################################
 class TestPitch(TestCase):
@@ -50,6 +89,57 @@ class TestPitch(TestCase):
     def test_less_than(self):
         self.assertTrue(Pitch(220) < Pitch(440))
 
+    ###################################################################
+    def test_compare_with_numbers(self):
+        self.assertEqual(Pitch(440), 440)
+        self.assertEqual(440.0, Pitch(440))
+        self.assertTrue(Pitch(440) <= 440.0 < Pitch(466.16))
+        self.assertEqual([Pitch(220), Pitch(440)], sorted([Pitch(440), Pitch(220)]))
+        with self.assertRaises(TypeError):
+            Pitch(440) < '440'
+
+    ###################################################################
+    def test_pitch_from_pitch(self):
+        pitch = Pitch(Pitch(Pitch(440)))
+        self.assertEqual(440.0, pitch.value)
+        self.assertEqual(57, pitch.semitone)
+        self.assertEqual('Pitch(440.0)', repr(pitch))
+
+    ###################################################################
+    def test_semitone(self):
+        self.assertEqual(0, Pitch(16.35).semitone)
+        self.assertEqual(57, Pitch(440).semitone)
+        self.assertEqual(57, Pitch(441).semitone)
+        self.assertEqual(107, Pitch(7902.13).semitone)
+
+    ###################################################################
+    def test_increase(self):
+        self.assertEqual(Pitch(466.16), Pitch(440).increase(1))
+        self.assertEqual(Pitch(880), Pitch(440).increase(12))
+        self.assertEqual(Pitch(440), Pitch(440).increase(0))
+
+        # Pitches between semitones count from the next pitch up.
+        self.assertEqual(Pitch(466.16), Pitch(441).increase(1))
+        self.assertEqual(Pitch(493.88), Pitch(441).increase(2))
+
+    ###################################################################
+    def test_decrease(self):
+        self.assertEqual(Pitch(415.30), Pitch(440).decrease(1))
+        self.assertEqual(Pitch(220), Pitch(440).decrease(12))
+
+        # Pitches between semitones count from the next pitch down.
+        self.assertEqual(Pitch(440), Pitch(441).decrease(1))
+        self.assertEqual(Pitch(415.30), Pitch(441).decrease(2))
+
+    ###################################################################
+    def test_increase_decrease__outside_of_pitch_table(self):
+        with self.assertRaises(InvalidPitchError):
+            Pitch(7902.13).increase(1)
+        with self.assertRaises(InvalidPitchError):
+            Pitch(16.35).decrease(1)
+        with self.assertRaises(InvalidPitchError):
+            Pitch(440).increase(100)
+
     ####################################################################
     # def test_in_tune(self):
     #     pitch_2 = Pitch(440)
@@ -89,3 +89,111 @@ class TestScale(TestCase):
         c_major = Scale(C, MajorScale)
         c_major_copy = c_major[:]
         self.assertEqual('C Major', c_major_copy.name)
+
+
+#######################################################################
+class TestScaleCache(TestCase):
+
+    ####################################################################
+    def setUp(self):
+        self.maxsize = SCALE_CACHE.maxsize
+        SCALE_CACHE.clear()
+
+    ####################################################################
+    def tearDown(self):
+        SCALE_CACHE.resize(self.maxsize)
+        SCALE_CACHE.clear()
+
+    ####################################################################
+    def test_shared_instances(self):
+        self.assertIs(Scale(C, MajorScale), Scale(Note('C'), MajorScale))
+        self.assertIs(Mode(D, DorianScale), Mode('D', DorianScale))
+        self.assertIs(Key('Bb'), Key('Bb major'))
+        self.assertIs(Key('Am'), Key('A minor'))
+
+        self.assertIsNot(Scale(C, IonianScale), Mode(C, IonianScale))
+        self.assertIsNot(Key('A'), Key('Am'))
+
+    ####################################################################
+    def test_info(self):
+        Key('C')
+        Key('C')
+        info = SCALE_CACHE.info()
+        self.assertEqual(1, info['hits'])
+        self.assertEqual(2, info['misses'])  # one for the Key, one for its Scale
+        self.assertEqual(2, info['size'])
+
+    ####################################################################
+    def test_eviction(self):
+        SCALE_CACHE.resize(2)
+        c_major = Scale(C, MajorScale)
+        Scale(D, MajorScale)
+        Scale(C, MajorScale)  # C is now the most recently used
+        Scale(E, MajorScale)  # so D is the one evicted
+        self.assertEqual(2, len(SCALE_CACHE))
+        self.assertIs(c_major, Scale(C, MajorScale))
+        self.assertNotIn((Scale, 'D', MAJOR_SCALE_NAME, MAJOR_INTERVALS), SCALE_CACHE)
+
+    ####################################################################
+    def test_disabled(self):
+        SCALE_CACHE.resize(0)
+        self.assertIsNot(Scale(C, MajorScale), Scale(C, MajorScale))
+        self.assertEqual(Scale(C, MajorScale), Scale(C, MajorScale))
+
+
+#######################################################################
+class TestPitchClassSet(TestCase):
+
+    ####################################################################
+    def test_mask(self):
+        c_major = Key('C').pitch_classes
+        self.assertEqual(0b101010110101, c_major.mask)
+        self.assertEqual((C, D, E, F, G, A, B), c_major.spelling)
+        self.assertEqual(7, len(c_major))
+        self.assertEqual([0, 2, 4, 5, 7, 9, 11], list(c_major))
+
+    ####################################################################
+    def test_matches_notes(self):
+        for scale_name in SCALE_TO_INTERVALS_MAP:
+            for tonic in ('C', 'F#', 'Bb', 'Ab', 'E'):
+                scale = Scale(tonic, ScalePattern(scale_name))
+                pitch_classes = scale.pitch_classes
+                self.assertEqual(scale.notes, pitch_classes.spelling)
+                self.assertEqual({n.pitch_class for n in scale.notes}, set(pitch_classes))
+                for name in ('C', 'C#', 'Db', 'D', 'E', 'Fb', 'F', 'B#', 'G', 'Ab', 'A', 'Bb', 'B', 'Cb'):
+                    expected = any(n.pitch_class == Note(name).pitch_class for n in scale.notes)
+                    self.assertEqual(expected, Note(name) in pitch_classes, msg=f'{name} in {scale}')
+
+    ####################################################################
+    def test_enharmonic_membership(self):
+        self.assertIn(Note('E#'), Key('C').pitch_classes)
+        self.assertIn(5, Key('C').pitch_classes)
+        self.assertNotIn(Note('F#'), Key('C').pitch_classes)
+        self.assertEqual(F, Key('C').pitch_classes.spell(Note('E#').pitch_class))
+        self.assertIsNone(Key('C').pitch_classes.spell(6))
+
+    ####################################################################
+    def test_transpose(self):
+        c_major = Key('C').pitch_classes
+        for semitones, name in enumerate(('C', 'Db', 'D', 'Eb', 'E', 'F', 'F#', 'G', 'Ab', 'A', 'Bb', 'B')):
+            self.assertEqual(Key(name).pitch_classes, c_major.transpose(semitones))
+            self.assertEqual(Key(name).pitch_classes, c_major.transpose(semitones - 12))
+        self.assertEqual((), c_major.transpose(2).spelling)
+
+    ####################################################################
+    def test_compare(self):
+        c_major = Key('C').pitch_classes
+        self.assertEqual(c_major, Key('Am').pitch_classes)
+        self.assertEqual(c_major, Mode('D', DorianScale).pitch_classes)
+        self.assertNotEqual(c_major, Key('G').pitch_classes)
+        self.assertEqual(hash(c_major), hash(Key('Am').pitch_classes))
+
+        c_major_triad = PitchClassSet.from_notes((C, E, G))
+        self.assertTrue(c_major_triad.issubset(c_major))
+        self.assertTrue(c_major.issuperset(c_major_triad))
+        self.assertFalse(PitchClassSet.from_notes(('C', 'Eb', 'G')).issubset(c_major))
+
+        g_major = Key('G').pitch_classes
+        self.assertEqual(6, len(c_major & g_major))
+        self.assertEqual(8, len(c_major | g_major))
+        self.assertEqual([5], list(c_major - g_major))
@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from the_blood.models import *
+from the_blood.scale_index import ScaleIndex, get_scale_index
+
+
+#######################################################################
+class TestScaleIndex(TestCase):
+
+    ####################################################################
+    def setUp(self):
+        self.index = get_scale_index()
+
+    ####################################################################
+    def test_every_scale_and_tonic(self):
+        self.assertEqual(189, len(self.index))
+        self.assertEqual(12, len(self.index.masks))
+        self.assertIs(self.index, get_scale_index())
+
+    ####################################################################
+    def test_containing_matches_brute_force(self):
+        queries = (['C', 'E', 'G'], ['F#'], ['Bb', 'D', 'F', 'Ab'], ['C', 'C#'], ['E#', 'B#'], ['C', 'C#', 'D'])
+        for query in queries:
+            pitch_classes = {Note(name).pitch_class for name in query}
+            expected = {entry.scale.name for entry in self.index.entries
+                        if pitch_classes <= {note.pitch_class for note in entry.scale.notes}}
+            actual = [match.scale.name for match in self.index.containing(query)]
+            self.assertEqual(len(expected), len(actual), msg=query)
+            self.assertEqual(expected, set(actual), msg=query)
+
+        self.assertEqual([], self.index.containing(['C', 'C#', 'D']))
+        self.assertEqual([], self.index.containing([]))
+
+    ####################################################################
+    def test_ranking(self):
+        matches = self.index.containing(['C', 'E', 'G'])
+        self.assertEqual(Key('C'), matches[0].scale)
+        self.assertEqual(Mode('C', IonianScale), matches[1].scale)
+        self.assertTrue(all(match.coverage == 1 for match in matches))
+
+        # Spelled as sharps, a sharp key comes first.
+        self.assertEqual(Key('B'), self.index.containing(['B', 'D#', 'F#'])[0].scale)
+        self.assertEqual('Cb', self.index.containing(['Cb', 'Eb', 'Gb'])[0].scale.tonic.name)
+
+        # Keys rank above their modes, and fewer accidentals above more.
+        matches = self.index.containing(['A', 'C', 'E', 'A'])
+        self.assertEqual(Key('Am'), matches[0].scale)
+
+    ####################################################################
+    def test_rank_partial_matches(self):
+        matches = self.index.rank(['C', 'D', 'E', 'F#'], limit=3)
+        self.assertEqual(3, len(matches))
+        self.assertEqual(Mode('C', LydianScale), matches[0].scale)
+        self.assertEqual(1, matches[0].coverage)
+        self.assertIn(Key('G').name, [match.scale.name for match in self.index.rank(['C', 'D', 'E', 'F#'])])
+
+        matches = self.index.rank(['C', 'C#', 'D'])
+        self.assertAlmostEqual(2 / 3, matches[0].coverage)
+
+    ####################################################################
+    def test_analyze(self):
+        # The opening of a melody in A minor, leaning on A and E.
+        melody = 'A B C D E C B A E A C B A'.split()
+        self.assertEqual(Key('Am'), self.index.analyze(melody))
+
+        melody = 'C D E F G A B C G E C'.split()
+        self.assertEqual(Key('C'), self.index.analyze(melody))
+
+        self.assertIsNone(self.index.analyze([]))
+
+    ####################################################################
+    def test_cached_answers_are_copies(self):
+        index = ScaleIndex(scale_names=(MAJOR_SCALE_NAME,))
+        expected = [match.scale for match in index.containing(['C', 'G'])]
+        index.containing(['C', 'G']).clear()
+        self.assertEqual(expected, [match.scale for match in index.containing(['C', 'G'])])
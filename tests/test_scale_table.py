@@ -0,0 +1,56 @@
+import os
+from unittest import TestCase
+
+from the_blood import generate_scale_table
+from the_blood.models import *
+from the_blood.scale_table import SCALE_NOTES, RELATIVE_KEYS, PARALLEL_KEYS
+
+
+#######################################################################
+class TestScaleTable(TestCase):
+
+    ####################################################################
+    def test_matches_calculated_notes(self):
+        for (tonic, scale_name), names in SCALE_NOTES.items():
+            scale = Scale(tonic, ScalePattern(scale_name))
+            calculated = tuple(note.name for note in scale._calculate_notes())
+            self.assertEqual(calculated, names, msg='{} {}'.format(tonic, scale_name))
+            self.assertEqual(names, scale.note_names)
+
+    ####################################################################
+    def test_every_mode_and_key(self):
+        for tonic in generate_scale_table.get_tonics():
+            for mode_name in MODE_NAMES:
+                self.assertIn((tonic.name, mode_name), SCALE_NOTES)
+        for name in MAJOR_KEY_NAMES:
+            self.assertIn((name, MAJOR_SCALE_NAME), SCALE_NOTES)
+        for name in MINOR_KEY_NAMES:
+            self.assertIn((name[:-1], MINOR_SCALE_NAME), SCALE_NOTES)
+
+    ####################################################################
+    def test_file_is_up_to_date(self):
+        path = os.path.join(os.path.dirname(generate_scale_table.__file__), 'scale_table.py')
+        with open(path) as f:
+            self.assertEqual(generate_scale_table.render(), f.read(),
+                             msg='Run `python -m the_blood.generate_scale_table` to regenerate it.')
+
+    ####################################################################
+    def test_relative_keys(self):
+        self.assertEqual(Key('Am'), Key('C').relative)
+        self.assertEqual(Key('C'), Key('Am').relative)
+        self.assertEqual(Key('Gm'), Key('Bb').relative)
+        self.assertEqual(Key('D#m'), Key('F#').relative)
+        for name, relative_name in RELATIVE_KEYS.items():
+            self.assertEqual(set(Key(name).notes), set(Key(relative_name).notes))
+
+    ####################################################################
+    def test_parallel_keys(self):
+        self.assertEqual(Key('Cm'), Key('C').parallel)
+        self.assertEqual(Key('Eb'), Key('Ebm').parallel)
+        for name, parallel_name in PARALLEL_KEYS.items():
+            self.assertEqual(Key(name).tonic, Key(parallel_name).tonic)
+
+    ####################################################################
+    def test_related_keys__not_in_table(self):
+        self.assertEqual(Key('E#m'), Key('G#').relative)
+        self.assertEqual(Key('G#m'), Key('G#').parallel)
@@ -0,0 +1,82 @@
+from unittest import TestCase
+
+from composer.compose import ComposedNote
+from composer.midi import MidiNote
+from composer.scheduler import NoteOffScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestNoteOffScheduler(TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.scheduler = NoteOffScheduler(clock=self.clock, sleep=self.clock.sleep)
+
+    def midi_note(self, name, octave, start, duration):
+        return MidiNote(ComposedNote(name, octave), 100, duration=duration, start=start)
+
+    def test_overlapping_notes_end_in_order(self):
+        c4 = self.midi_note('C', 4, start=1.0, duration=2.0)
+        e4 = self.midi_note('E', 4, start=1.5, duration=0.5)
+        g4 = self.midi_note('G', 4, start=1.5, duration=1.0)
+        for midi_note in (c4, e4, g4):
+            self.scheduler.schedule(midi_note)
+        self.assertEqual(3, len(self.scheduler))
+        self.assertEqual(2.0, self.scheduler.next_deadline)
+
+        self.assertEqual([], self.scheduler.pop_due(now=1.9))
+
+        commands = self.scheduler.pop_due(now=2.5)
+        self.assertEqual([e4.number, g4.number], [command.note for command in commands])
+        self.assertEqual(3.0, self.scheduler.next_deadline)
+
+        commands = self.scheduler.pop_due(now=3.0)
+        self.assertEqual([c4.number], [command.note for command in commands])
+        self.assertEqual(0, len(self.scheduler))
+        self.assertIsNone(self.scheduler.next_deadline)
+
+    def test_same_end_keeps_schedule_order(self):
+        notes = [self.midi_note(name, 4, start=0.0, duration=1.0) for name in ('D', 'C', 'B')]
+        for midi_note in notes:
+            self.scheduler.schedule(midi_note)
+        commands = self.scheduler.pop_due(now=1.0)
+        self.assertEqual([n.number for n in notes], [command.note for command in commands])
+
+    def test_pop_due_uses_clock(self):
+        self.scheduler.schedule(self.midi_note('A', 4, start=0.0, duration=0.25))
+        self.assertEqual([], self.scheduler.pop_due())
+        self.clock.now = 0.25
+        self.assertEqual(1, len(self.scheduler.pop_due()))
+
+    def test_pop_all(self):
+        self.scheduler.schedule(self.midi_note('C', 4, start=0.0, duration=4.0))
+        self.scheduler.schedule(self.midi_note('E', 4, start=0.0, duration=1.0))
+        commands = self.scheduler.pop_all()
+        self.assertEqual([64, 60], [command.note for command in commands])
+        self.assertEqual(0, len(self.scheduler))
+
+    def test_wait_sleeps_until_next_deadline(self):
+        self.scheduler.schedule(self.midi_note('C', 4, start=0.0, duration=0.5))
+        self.scheduler.wait(until=2.0)
+        self.assertEqual([0.5], self.clock.slept)
+
+        self.scheduler.pop_due()
+        self.scheduler.wait(until=2.0)
+        self.assertEqual([0.5, 1.5], self.clock.slept)
+
+    def test_wait_without_deadlines(self):
+        self.scheduler.wait()
+        self.scheduler.wait(until=-1.0)
+        self.assertEqual([], self.clock.slept)
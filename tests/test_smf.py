@@ -0,0 +1,206 @@
+import io
+import os
+import struct
+import tempfile
+from unittest import TestCase, mock
+
+from composer import smf
+from composer.compose import ComposedNote
+from composer.midi import MidiNote
+from composer.translators import accelerometer
+from composer.translators import text
+from composer.translators.text import TextTranslator, StreamingTextTranslator
+from the_blood.models import *
+
+
+def read_variable_length(data, i):
+    value = 0
+    while True:
+        byte = data[i]
+        i += 1
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, i
+
+
+def parse_midi_file(data):
+    """
+    Returns (format, ticks_per_beat, tracks), where each track is a list of
+    (tick, status, data bytes) events with absolute ticks.
+    """
+    assert data[:4] == b'MThd'
+    length, format, track_count, ticks_per_beat = struct.unpack('>IHHH', data[4:14])
+    assert length == 6
+    i = 14
+    tracks = []
+    for _ in range(track_count):
+        assert data[i:i + 4] == b'MTrk'
+        length, = struct.unpack('>I', data[i + 4:i + 8])
+        i += 8
+        end = i + length
+        tick = 0
+        status = None
+        events = []
+        while i < end:
+            delta, i = read_variable_length(data, i)
+            tick += delta
+            if data[i] & 0x80:
+                status = data[i]
+                i += 1
+            if status == 0xFF:
+                meta_type = data[i]
+                meta_length, i = read_variable_length(data, i + 1)
+                events.append((tick, status, bytes([meta_type]) + data[i:i + meta_length]))
+                i += meta_length
+                status = None
+            else:
+                events.append((tick, status, data[i:i + 2]))
+                i += 2
+        assert i == end
+        tracks.append(events)
+    assert i == len(data)
+    return format, ticks_per_beat, tracks
+
+
+class TestEncodeVariableLength(TestCase):
+
+    def test_encode(self):
+        self.assertEqual(b'\x00', smf.encode_variable_length(0))
+        self.assertEqual(b'\x7f', smf.encode_variable_length(0x7F))
+        self.assertEqual(b'\x81\x00', smf.encode_variable_length(0x80))
+        self.assertEqual(b'\x83\x60', smf.encode_variable_length(480))
+        self.assertEqual(b'\xff\x7f', smf.encode_variable_length(0x3FFF))
+        self.assertEqual(b'\x81\x80\x00', smf.encode_variable_length(0x4000))
+        self.assertEqual(b'\xff\xff\xff\x7f', smf.encode_variable_length(0x0FFFFFFF))
+
+    def test_round_trip(self):
+        for value in list(range(0x4100)) + [0x1FFFFF, 0x200000, 0x0FFFFFFF]:
+            decoded, i = read_variable_length(smf.encode_variable_length(value), 0)
+            self.assertEqual(value, decoded)
+
+    def test_out_of_range(self):
+        with self.assertRaises(ValueError):
+            smf.encode_variable_length(-1)
+        with self.assertRaises(ValueError):
+            smf.encode_variable_length(0x10000000)
+
+
+class TestMidiFileWriter(TestCase):
+
+    def test_byte_exact(self):
+        c4 = MidiNote(ComposedNote('C', 4), 100, duration=0.5, start=0.0)
+        e4 = MidiNote(ComposedNote('E', 4), 100, duration=0.5, start=0.0)
+        file = io.BytesIO()
+        smf.write_midi_file(file, [c4, e4], bpm=120)
+
+        expected = (
+            b'MThd\x00\x00\x00\x06\x00\x00\x00\x01\x01\xe0'
+            b'MTrk\x00\x00\x00\x1a'
+            b'\x00\xff\x51\x03\x07\xa1\x20'  # tempo: 500000 microseconds per beat
+            b'\x00\x91\x3c\x64'  # C4 on
+            b'\x00\x40\x64'  # E4 on, running status
+            b'\x83\x60\x81\x3c\x64'  # C4 off 480 ticks later
+            b'\x00\x40\x64'  # E4 off, running status
+            b'\x00\xff\x2f\x00'  # end of track
+        )
+        self.assertEqual(expected, file.getvalue())
+
+    def test_multi_track(self):
+        c4 = MidiNote(ComposedNote('C', 4), 100, duration=0.25, start=10.0)
+        file = io.BytesIO()
+        smf.write_midi_file(file, [c4], bpm=60, format=smf.MULTI_TRACK, ticks_per_beat=96)
+
+        format, ticks_per_beat, (tempo_track, note_track) = parse_midi_file(file.getvalue())
+        self.assertEqual(1, format)
+        self.assertEqual(96, ticks_per_beat)
+        self.assertEqual([(0, 0xFF, b'\x51\x0f\x42\x40'), (0, 0xFF, b'\x2f')], tempo_track)
+        self.assertEqual([(0, 0x91, b'\x3c\x64'), (24, 0x81, b'\x3c\x64'), (24, 0xFF, b'\x2f')], note_track)
+
+    def test_overlapping_notes_end_in_order(self):
+        notes = [
+            MidiNote(ComposedNote('C', 4), 90, duration=2.0, start=0.0),
+            MidiNote(ComposedNote('E', 4), 80, duration=0.5, start=0.5),
+            MidiNote(ComposedNote('G', 4), 70, duration=0.5, start=1.0),
+        ]
+        file = io.BytesIO()
+        smf.write_midi_file(file, notes, bpm=120)
+
+        format, ticks_per_beat, (track,) = parse_midi_file(file.getvalue())
+        events = [(tick, status, tuple(data)) for tick, status, data in track[1:-1]]
+        self.assertEqual([
+            (0, 0x91, (60, 90)),
+            (480, 0x91, (64, 80)),
+            (960, 0x81, (64, 80)),
+            (960, 0x91, (67, 70)),
+            (1440, 0x81, (67, 70)),
+            (1920, 0x81, (60, 90)),
+        ], events)
+
+    def test_notes_out_of_order(self):
+        with smf.MidiFileWriter(io.BytesIO()) as writer:
+            writer.add(MidiNote(ComposedNote('C', 4), 90, duration=1.0, start=1.0))
+            with self.assertRaises(ValueError):
+                writer.add(MidiNote(ComposedNote('C', 4), 90, duration=1.0, start=0.0))
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            smf.MidiFileWriter(io.BytesIO(), format=2)
+
+    def test_buffered_writes(self):
+        file = io.BytesIO()
+        writes = []
+        real_write = file.write
+
+        def write(data):
+            writes.append(len(data))
+            return real_write(data)
+
+        file.write = write
+        with smf.MidiFileWriter(file, buffer_size=64) as writer:
+            for i in range(1000):
+                writer.add(MidiNote(ComposedNote('C', 4), 100, duration=0.25, start=i * 0.25))
+                self.assertLess(len(writer._buffer), 64)
+                self.assertLessEqual(len(writer._note_offs), 1)
+
+        self.assertGreater(len(writes), 50)
+        format, ticks_per_beat, (track,) = parse_midi_file(file.getvalue())
+        self.assertEqual(2000 + 2, len(track))
+
+    def test_write_to_path(self):
+        notes = [MidiNote(ComposedNote('A', 4), 100, duration=0.5, start=i * 0.5) for i in range(4)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'a.mid')
+            smf.write_midi_file(path, notes)
+            with open(path, 'rb') as f:
+                format, ticks_per_beat, (track,) = parse_midi_file(f.read())
+        self.assertEqual(8 + 2, len(track))
+
+    def test_accelerometer_round_trip(self):
+        acc = accelerometer.MockAccelerometer(accelerometer.AccelerometerStrategy, Key('C'), 120)
+        with mock.patch('builtins.print'):
+            notes = list(smf.accelerometer_notes(acc, '<mock_accelerometer>', 300))
+        file = io.BytesIO()
+        smf.write_midi_file(file, notes, bpm=120)
+
+        format, ticks_per_beat, (track,) = parse_midi_file(file.getvalue())
+        note_ons = [(tick, data[0], data[1]) for tick, status, data in track if status == 0x91]
+        expected = [(round(n.start * 2 * ticks_per_beat), n.number, n.velocity) for n in notes]
+        self.assertEqual(expected, note_ons)
+
+    def test_text_round_trip(self):
+        translator = TextTranslator('This is a sentence')
+        notes = list(smf.text_notes(translator, bpm=120))
+        file = io.BytesIO()
+        smf.write_midi_file(file, notes, bpm=120)
+
+        format, ticks_per_beat, (track,) = parse_midi_file(file.getvalue())
+        note_ons = [data[0] for tick, status, data in track if status == 0x91]
+        self.assertEqual([n.number for n in notes], note_ons)
+        self.assertEqual(sum(len(phrase) for phrase in translator.melody), len(note_ons))
+        self.assertEqual(len(notes) * ticks_per_beat, track[-1][0])
+
+    def test_text_rests(self):
+        translator = StreamingTextTranslator(io.StringIO("It's done"), non_letters=text.REST)
+        notes = list(smf.text_notes(translator, bpm=120))
+        self.assertEqual(7, len(notes))
+        self.assertEqual([0.0, 0.5, 1.5, 2.0, 2.5, 3.0, 3.5], [n.start for n in notes])
@@ -1,8 +1,11 @@
+import io
+import string
 import unittest
 
 from mingus.containers import Track, Bar
 
-from composer.translators.text import TextTranslator
+from composer.translators import text as text_translator
+from composer.translators.text import TextTranslator, StreamingTextTranslator
 from the_blood.models import *
 
 
@@ -79,3 +82,108 @@ class TestText(unittest.TestCase):
             (G, G, B, A, G, B, E, G)
         ]
         self.assertEqual(expected, translator.melody)
+
+
+    ####################################################################
+    def test_non_letters(self):
+        text = "It's 4 o'clock"
+        with self.assertRaises(NotImplementedError):
+            TextTranslator(text)
+
+        translator = TextTranslator(text, non_letters=text_translator.SKIP)
+        self.assertEqual([(D, A, G), (), (C, E, G, C, E, F)], translator.melody)
+
+        translator = TextTranslator(text, non_letters=text_translator.REST)
+        self.assertEqual([(D, A, None, G), (None,), (C, None, E, G, C, E, F)], translator.melody)
+
+        with self.assertRaises(ValueError):
+            TextTranslator(text, non_letters='ignore')
+
+
+    ####################################################################
+    def test_char_table(self):
+        # The arithmetic the translator used before CHAR_TO_DEGREE.
+        def get_note_from_char(key, char):
+            char = char.lower()
+            i = string.ascii_lowercase.index(char)
+            while i > 6:
+                i -= 7
+            return key.scale[i]
+
+        for text in ('This is a sentence', 'It was a good sentence', 'The sentence was dope'):
+            translator = TextTranslator(text, non_letters=text_translator.REST)
+            for char in [chr(i) for i in range(256)] + ['é', 'ß', '\u2014']:
+                if char in string.ascii_letters:
+                    expected = get_note_from_char(translator.key, char)
+                    self.assertEqual(expected, translator._get_note_from_char(char))
+                    self.assertEqual((expected,), translator._get_phrase(char))
+                else:
+                    self.assertEqual((None,), translator._get_phrase(char), msg=repr(char))
+                    with self.assertRaises(NotImplementedError):
+                        translator._get_note_from_char(char)
+
+
+#######################################################################
+class TestStreamingText(unittest.TestCase):
+
+    ####################################################################
+    def test_iter_words(self):
+        text = 'This is  a\nsentence,\twith   whitespace '
+        expected = ['This', 'is', 'a', 'sentence,', 'with', 'whitespace']
+        for chunk_size in range(1, len(text) + 2):
+            self.assertEqual(expected, list(text_translator.iter_words(text, chunk_size)), msg=chunk_size)
+            self.assertEqual(expected, list(text_translator.iter_words(io.StringIO(text), chunk_size)))
+        self.assertEqual(expected, list(text_translator.iter_words(['This i', 's  a\nsen', '', 'tence,\twith   whitespace '])))
+
+    ####################################################################
+    def test_same_as_text_translator(self):
+        text = 'This is a sentence'
+        eager = TextTranslator(text)
+        for source in (text, io.StringIO(text), iter(['Thi', 's is a ', 'sentence'])):
+            streaming = StreamingTextTranslator(source, chunk_size=3)
+            self.assertEqual(eager.key, streaming.key)
+            self.assertEqual(eager.time_signature, streaming.time_signature)
+            self.assertEqual(eager.melody, list(streaming.phrases()))
+
+    ####################################################################
+    def test_same_words_with_any_whitespace(self):
+        text = '  This is  a\nsentence,\twith\r\n  whitespace '
+        for non_letters in (text_translator.SKIP, text_translator.REST):
+            eager = TextTranslator(text, non_letters=non_letters)
+            streaming = StreamingTextTranslator(text, non_letters=non_letters, chunk_size=4)
+            self.assertEqual(list(text_translator.iter_words(text)), eager.words)
+            self.assertEqual(eager.key, streaming.key)
+            self.assertEqual(eager.time_signature, streaming.time_signature)
+            self.assertEqual(eager.melody, list(streaming.phrases()))
+        with self.assertRaises(ValueError):
+            TextTranslator(' \n ')
+
+    ####################################################################
+    def test_reads_lazily(self):
+        chunks_read = []
+
+        def book():
+            for i in range(1000000):
+                chunks_read.append(i)
+                yield 'This is a sentence. '
+
+        translator = StreamingTextTranslator(book())
+        self.assertEqual(1, len(chunks_read))
+        phrases = translator.phrases()
+        for _ in range(8):
+            next(phrases)
+        self.assertEqual(2, len(chunks_read))
+        self.assertEqual((A, C, D, G), next(phrases))
+        self.assertEqual(3, len(chunks_read))
+
+    ####################################################################
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            StreamingTextTranslator(io.StringIO('   '))
+
+    ####################################################################
+    def test_binary_file(self):
+        with self.assertRaises(TypeError):
+            StreamingTextTranslator(io.BytesIO(b'This is a sentence'))
+        # An empty one ends instead of reading b'' forever.
+        self.assertEqual([], list(text_translator.iter_words(io.BytesIO(b''))))
@@ -0,0 +1,103 @@
+import json
+import os
+import tempfile
+from unittest import TestCase, mock
+
+from composer import translate_many
+from composer.translators import text
+from composer.translators.text import StreamingTextTranslator
+from tests.test_smf import parse_midi_file
+
+DOCUMENTS = {
+    'sentence.txt': 'This is a sentence.\nAnd another one.',
+    'good.txt': 'It was a good sentence, truly.',
+    'dope.txt': 'The sentence was dope!',
+}
+
+
+class TestTranslateMany(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.paths = []
+        for name, content in DOCUMENTS.items():
+            path = os.path.join(self.directory.name, name)
+            with open(path, 'w') as f:
+                f.write(content)
+            self.paths.append(path)
+        self.output = os.path.join(self.directory.name, 'out')
+
+    def test_json(self):
+        summaries = translate_many.translate_many(self.paths, self.output, output_format=translate_many.JSON, workers=2)
+        self.assertEqual(self.paths, [summary['source'] for summary in summaries])
+
+        with open(os.path.join(self.output, translate_many.INDEX_FILE)) as f:
+            self.assertEqual(summaries, json.load(f))
+
+        for path, summary in zip(self.paths, summaries):
+            translator = StreamingTextTranslator(DOCUMENTS[os.path.basename(path)], non_letters=text.SKIP)
+            with open(summary['output']) as f:
+                translated = json.load(f)
+            self.assertEqual(translator.key.name, translated['key'])
+            self.assertEqual(translator.time_signature, translated['time_signature'])
+            self.assertEqual([[note.name for note in phrase] for phrase in translator.phrases()], translated['melody'])
+
+    def test_midi(self):
+        summaries = translate_many.translate_many(self.paths, self.output, workers=2)
+        for summary in summaries:
+            self.assertTrue(summary['output'].endswith('.mid'))
+            with open(summary['output'], 'rb') as f:
+                format, ticks_per_beat, (track,) = parse_midi_file(f.read())
+            note_ons = [event for event in track if event[1] == 0x91]
+            self.assertEqual(summary['notes'], len(note_ons))
+
+    def test_same_in_one_process(self):
+        many = translate_many.translate_many(self.paths, self.output, workers=3)
+        one = translate_many.translate_many(self.paths, self.output, workers=1)
+        self.assertEqual(many, one)
+
+    def test_failed_file(self):
+        # 'Hello' has 5 letters, so there's no key for it.
+        for name, content in (('hello.txt', 'Hello world again'), ('empty.txt', ' \n')):
+            path = os.path.join(self.directory.name, name)
+            with open(path, 'w') as f:
+                f.write(content)
+            self.paths.insert(1, path)
+        for output_format in translate_many.OUTPUT_FORMATS:
+            for workers in (1, 2):
+                summaries = translate_many.translate_many(self.paths, self.output, output_format=output_format,
+                                                          workers=workers)
+                self.assertEqual(self.paths, [summary['source'] for summary in summaries])
+                self.assertEqual(['empty.txt', 'hello.txt'],
+                                 [os.path.basename(s['source']) for s in summaries if 'error' in s])
+                self.assertEqual(['error', 'source'], sorted(summaries[2]))
+                self.assertIn('5 letter', summaries[2]['error'])
+                hello = os.path.join(self.output, 'hello' + translate_many.EXTENSIONS[output_format])
+                self.assertFalse(os.path.exists(hello))
+                self.assertEqual(3, sum('notes' in summary for summary in summaries))
+                with open(os.path.join(self.output, translate_many.INDEX_FILE)) as f:
+                    self.assertEqual(summaries, json.load(f))
+
+    def test_duplicate_names(self):
+        with self.assertRaises(ValueError):
+            translate_many.translate_many(self.paths + self.paths[:1], self.output)
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            translate_many.translate_many(self.paths, self.output, output_format='wav')
+
+    def test_main(self):
+        with mock.patch('builtins.print') as printed:
+            translate_many.main(self.paths + ['--output', self.output, '--format', 'json', '--workers', '1'])
+        self.assertEqual(3, printed.call_count)
+        self.assertTrue(os.path.exists(os.path.join(self.output, 'dope.json')))
+
+    def test_json_notes(self):
+        summaries = translate_many.translate_many(self.paths, self.output, output_format=translate_many.JSON,
+                                                  workers=1, non_letters=text.REST)
+        for summary in summaries:
+            with open(summary['output']) as f:
+                melody = json.load(f)['melody']
+            self.assertIn(None, sum(melody, []))
+            self.assertEqual(summary['notes'], sum(note is not None for phrase in melody for note in phrase))
@@ -1,10 +1,13 @@
-import unittest
-from unittest import TestCase
+import sys
+from unittest import TestCase, mock
+
+import numpy as np
+
+from composer.compose import ComposedNote
 from the_blood.models import *
 
 
 ########################################################################
-@unittest.skip('NEED TO RE-IMPLEMENT TRANSPOSITION')
 class TestTranspose(TestCase):
 
     ####################################################################
@@ -73,7 +76,6 @@ class TestTranspose(TestCase):
 
 
 ########################################################################
-@unittest.skip('Not implemented yet.')
 class TestTransposeMultiple(TestCase):
 
     ####################################################################
@@ -83,7 +85,7 @@ class TestTransposeMultiple(TestCase):
 
     ####################################################################
     def test_transpose_multiple_notes_down_a_third(self):
-        self.assertEqual([G, E_flat, F], Transpose(B, G, A).down.third)
+        self.assertEqual([G, E_flat, F], Transpose(B, G, A, quality_to_use=FLAT).down.third)
 
     ####################################################################
     def test_transpose_multiple_notes_up_a_fifth(self):
@@ -94,12 +96,63 @@ class TestTransposeMultiple(TestCase):
     ####################################################################
     def test_steps(self):
         self.assertEqual([B], Transpose(A).up.steps(WHOLE_STEP))
-        self.assertEqual([B], Transpose(A).up.steps(1))
-        self.assertEqual([B], Transpose(A).up.steps(.5, .5))
+        self.assertEqual([B], Transpose(A).up.steps(HALF_STEP, HALF_STEP))
 
         up_a_third = Transpose(A).up.third
         up_two_whole_steps = Transpose(A).up.steps(WHOLE_STEP, WHOLE_STEP)
         self.assertEqual(up_a_third, up_two_whole_steps)
         self.assertEqual([C_sharp], up_two_whole_steps)
 
-        self.assertEqual([B], Transpose(A).up.steps(*[.5, .5]))
+        self.assertEqual([A], Transpose(A).up.octave)
+        self.assertEqual([C], Transpose(A).up.minor_third)
+
+    ####################################################################
+    def test_sequence(self):
+        melody = [C, E, G, C, B, 'D']
+        self.assertEqual([D, F_sharp, A, D, C_sharp, E], Transpose(melody).up.whole_step)
+        self.assertEqual([F, A, C, F, E, G], Transpose(melody).down.fifth)
+        self.assertEqual([], Transpose([]).up.third)
+
+    ####################################################################
+    def test_spelled_in_target_key(self):
+        transpose = Transpose([Eb, G, Bb, D, A], key='Eb')
+        self.assertEqual([G, B, D, F_sharp, C_sharp], transpose.up.third)
+        self.assertEqual(Key('G'), transpose.target_key)
+
+        # F# major spells F as E#, and its out of key notes as sharps.
+        self.assertEqual([F_sharp, A_sharp, C_sharp, E_sharp, D], Transpose([C, E, G, B, G_sharp], key='C').up.steps(6))
+        self.assertEqual([Db, F, Ab, C, A], Transpose([C, E, G, B, G_sharp], key='C').up.half_step)
+        self.assertEqual(Key('Bbm'), transposed_key('Am', 1))
+
+    ####################################################################
+    def test_composed_notes(self):
+        melody = [ComposedNote('A', 3), ComposedNote('B', 3), ComposedNote('C#', 4)]
+        transposed = Transpose(melody).up.third
+        self.assertEqual(['C#4', 'D#4', 'F4'], [str(note) for note in transposed])
+        self.assertTrue(all(type(note) is ComposedNote for note in transposed))
+        self.assertEqual([note.midi_number + 4 for note in melody], [note.midi_number for note in transposed])
+        self.assertEqual(['A2', 'B2', 'C#3'], [str(note) for note in Transpose(melody).down.octave])
+
+    ####################################################################
+    def test_mixed_composed_notes_and_notes(self):
+        for notes in ([ComposedNote('C', 4), C], [C, ComposedNote('C', 4)], [ComposedNote('C', 4), 'E']):
+            with self.assertRaises(TypeError, msg=notes):
+                Transpose(notes).up.third
+
+    ####################################################################
+    def test_semitone_array(self):
+        semitones = np.arange(48, 60)
+        transpose = Transpose(semitones)
+        np.testing.assert_array_equal(semitones + 7, transpose.up.fifth)
+        np.testing.assert_array_equal(semitones - 4, transpose.down.third)
+        self.assertEqual(SHARP_SPELLING, transpose.spelling)
+
+    ####################################################################
+    def test_without_numpy(self):
+        melody = [ComposedNote('G', 4), ComposedNote('Bb', 4), ComposedNote('G', 4), ComposedNote('D', 5)]
+        expected = Transpose(melody).up.fifth
+        names = Transpose(melody[:2]).up.fifth
+        with mock.patch.dict(sys.modules, {'numpy': None}):
+            self.assertEqual([str(n) for n in expected], [str(n) for n in Transpose(melody).up.fifth])
+            self.assertEqual(names, Transpose(melody[:2]).up.fifth)
+            self.assertEqual([D, F, D, A], Transpose([G, Bb, G, D]).up.fifth)
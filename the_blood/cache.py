@@ -0,0 +1,71 @@
+#######################################################################
+class LRUCache:
+    """
+    A bounded cache that forgets the least recently used item first.
+    A maxsize of None never forgets anything, and 0 stores nothing.
+    """
+
+    ####################################################################
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__items = {}
+
+    ####################################################################
+    def __len__(self):
+        return len(self.__items)
+
+    ####################################################################
+    def __contains__(self, key):
+        return key in self.__items
+
+    ####################################################################
+    def get(self, key):
+        """
+        Return the cached item for key, or raise KeyError on a miss.
+        """
+        try:
+            # Re-inserting moves the item to the most recently used end.
+            item = self.__items.pop(key)
+        except KeyError:
+            self.misses += 1
+            raise
+        self.__items[key] = item
+        self.hits += 1
+        return item
+
+    ####################################################################
+    def put(self, key, item):
+        if self.maxsize == 0:
+            return
+        self.__items.pop(key, None)
+        self.__items[key] = item
+        self.__evict()
+
+    ####################################################################
+    def __evict(self):
+        if self.maxsize is None:
+            return
+        while len(self.__items) > self.maxsize:
+            del self.__items[next(iter(self.__items))]
+
+    ####################################################################
+    def resize(self, maxsize):
+        self.maxsize = maxsize
+        self.__evict()
+
+    ####################################################################
+    def clear(self):
+        self.__items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    ####################################################################
+    def info(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'maxsize': self.maxsize,
+            'size': len(self.__items),
+        }
@@ -15,6 +15,17 @@ SEVENTH = '7'
 NINTH = '9'
 ELEVENTH = '11'
 
+# Semitones above C
+NATURAL_PITCH_CLASSES = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
+
+ACCIDENTAL_SEMITONES = {
+    NATURAL: 0,
+    SHARP: 1,
+    FLAT: -1,
+    DOUBLE_SHARP: 2,
+    DOUBLE_FLAT: -2,
+}
+
 SHARPS_AND_FLATS = {
     '##': DOUBLE_SHARP,
     'double sharp': DOUBLE_SHARP,
@@ -201,3 +212,30 @@ LOCRIAN_SCALE_NAME = 'Locrian'
 MODE_NAMES = (IONIAN_SCALE_NAME, DORIAN_SCALE_NAME, PHRYGIAN_SCALE_NAME,
               LYDIAN_SCALE_NAME, MIXOLYDIAN_SCALE_NAME, AEOLIAN_SCALE_NAME,
               LOCRIAN_SCALE_NAME)
+
+# The keys with at most seven sharps or flats, following the circle of fifths.
+MAJOR_KEY_NAMES = ('C', 'G', 'D', 'A', 'E', 'B', 'F#', 'C#',
+                   'F', 'Bb', 'Eb', 'Ab', 'Db', 'Gb', 'Cb')
+MINOR_KEY_NAMES = ('Am', 'Em', 'Bm', 'F#m', 'C#m', 'G#m', 'D#m', 'A#m',
+                   'Dm', 'Gm', 'Cm', 'Fm', 'Bbm', 'Ebm', 'Abm')
+
+
+# The notes of each chord quality, as (key, scale degree) pairs counted from 0,
+# where the key is the chord root's major or minor key. A dominant seventh,
+# for example, is the major triad plus the minor key's seventh.
+_MAJOR_TRIAD = ((MAJOR_SCALE_NAME, 0), (MAJOR_SCALE_NAME, 2), (MAJOR_SCALE_NAME, 4))
+_MINOR_TRIAD = ((MINOR_SCALE_NAME, 0), (MINOR_SCALE_NAME, 2), (MINOR_SCALE_NAME, 4))
+_DOMINANT_SEVENTH = _MAJOR_TRIAD + ((MINOR_SCALE_NAME, 6),)
+_MINOR_SEVENTH = _MINOR_TRIAD + ((MINOR_SCALE_NAME, 6),)
+
+CHORD_DEGREES = {
+    MAJOR: _MAJOR_TRIAD,
+    MINOR: _MINOR_TRIAD,
+    SEVENTH: _DOMINANT_SEVENTH,
+    MAJOR_ABBREVIATION + SEVENTH: _MAJOR_TRIAD + ((MAJOR_SCALE_NAME, 6),),
+    MINOR + SEVENTH: _MINOR_SEVENTH,
+    NINTH: _DOMINANT_SEVENTH + ((MAJOR_SCALE_NAME, 1),),
+    MINOR + NINTH: _MINOR_SEVENTH + ((MINOR_SCALE_NAME, 1),),
+    ELEVENTH: _DOMINANT_SEVENTH + ((MAJOR_SCALE_NAME, 1), (MAJOR_SCALE_NAME, 3)),
+    MINOR + ELEVENTH: _MINOR_SEVENTH + ((MINOR_SCALE_NAME, 1), (MINOR_SCALE_NAME, 3)),
+}
@@ -16,3 +16,11 @@ class InvalidScaleError(Exception):
 
 class InvalidModeError(Exception):
     pass
+
+
+class InvalidPitchError(Exception):
+    pass
+
+
+class InvalidChordError(Exception):
+    pass
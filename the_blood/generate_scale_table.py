@@ -0,0 +1,81 @@
+"""
+Regenerates the_blood/scale_table.py from the algorithmic scale builder:
+
+    python -m the_blood.generate_scale_table
+"""
+import os
+
+from .models import *
+
+
+#######################################################################
+def get_tonics():
+    return tuple(Note(name + quality) for name in NATURAL_NOTES for quality in (NATURAL, SHARP, FLAT))
+
+
+#######################################################################
+def calculate_scale_notes():
+    scale_notes = {}
+    for scale_name in SCALE_TO_INTERVALS_MAP:
+        pattern = ScalePattern(scale_name)
+        for tonic in get_tonics():
+            try:
+                notes = Scale(tonic, pattern)._calculate_notes()
+            except InvalidKeyError:
+                # This tonic would need triple sharps or flats for this scale.
+                continue
+            scale_notes[(tonic.name, pattern.name)] = tuple(note.name for note in notes)
+    return scale_notes
+
+
+#######################################################################
+def calculate_related_keys(scale_notes):
+    relative_keys = {}
+    parallel_keys = {}
+    for name in MAJOR_KEY_NAMES:
+        notes = scale_notes[(name, MAJOR_SCALE_NAME)]
+        relative_keys[name] = notes[5] + MINOR
+        parallel_keys[name] = name + MINOR
+    for name in MINOR_KEY_NAMES:
+        tonic = name[:-len(MINOR)]
+        notes = scale_notes[(tonic, MINOR_SCALE_NAME)]
+        relative_keys[name] = notes[2]
+        parallel_keys[name] = tonic
+    return relative_keys, parallel_keys
+
+
+#######################################################################
+def render():
+    scale_notes = calculate_scale_notes()
+    relative_keys, parallel_keys = calculate_related_keys(scale_notes)
+
+    lines = [
+        '# Generated by `python -m the_blood.generate_scale_table`. Do not edit by hand.',
+        '',
+        '# (tonic, scale name): note names',
+        'SCALE_NOTES = {',
+    ]
+    for (tonic, scale_name), names in scale_notes.items():
+        lines.append('    ({!r}, {!r}): {!r},'.format(tonic, scale_name, names))
+    lines.append('}')
+
+    for constant, related in (('RELATIVE_KEYS', relative_keys), ('PARALLEL_KEYS', parallel_keys)):
+        lines.append('')
+        lines.append('{} = {{'.format(constant))
+        for key_name, related_name in related.items():
+            lines.append('    {!r}: {!r},'.format(key_name, related_name))
+        lines.append('}')
+
+    return '\n'.join(lines) + '\n'
+
+
+#######################################################################
+def main():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scale_table.py')
+    with open(path, 'w') as f:
+        f.write(render())
+    print('Wrote {}'.format(path))
+
+
+if __name__ == '__main__':
+    main()
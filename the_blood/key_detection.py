@@ -0,0 +1,164 @@
+import math
+
+from .models import *
+
+# Krumhansl-Kessler key profiles: how well each pitch class, counted up from
+# the tonic, fits a major or minor key.
+MAJOR_PROFILE = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+MINOR_PROFILE = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+
+# Weights grow by 1/decay per note instead of shrinking every bin, and are
+# scaled back down once they pass this.
+_RESCALE_AT = 1e100
+
+
+#######################################################################
+def _accidentals(key):
+    return sum(len(note.name) - 1 for note in key.notes)
+
+
+#######################################################################
+def get_detectable_keys():
+    """
+    One major and one minor Key per pitch class: of the enharmonic spellings,
+    the one with the fewest sharps and flats (F# over Gb on a tie).
+    """
+    keys = []
+    for names in (MAJOR_KEY_NAMES, MINOR_KEY_NAMES):
+        by_tonic = {}
+        for name in names:
+            key = Key(name)
+            best = by_tonic.get(key.tonic.pitch_class)
+            if best is None or _accidentals(key) < _accidentals(best):
+                by_tonic[key.tonic.pitch_class] = key
+        keys.extend(by_tonic[pitch_class] for pitch_class in range(PITCH_CLASS_COUNT))
+    return tuple(keys)
+
+
+#######################################################################
+def _centered(profile, tonic):
+    # Rotate the profile to start on the tonic, then center and normalize it,
+    # so a dot product with the histogram is a Pearson correlation's numerator.
+    rotated = [profile[(pitch_class - tonic) % PITCH_CLASS_COUNT] for pitch_class in range(PITCH_CLASS_COUNT)]
+    mean = sum(rotated) / PITCH_CLASS_COUNT
+    centered = [value - mean for value in rotated]
+    norm = math.sqrt(sum(value * value for value in centered))
+    return tuple(value / norm for value in centered)
+
+
+#######################################################################
+class KeyEstimator:
+    """
+    Estimates the key of a stream of notes as they arrive.
+
+    Every note goes into a 12-bin pitch-class histogram, where older notes
+    count for less: after each note, every earlier note's weight has been
+    multiplied by `decay`. The histogram's correlation with each of the 24
+    Krumhansl-Kessler key profiles is kept up to date as notes are added, so
+    add() is O(1) (24 additions) and the current key never needs a rescan.
+    """
+
+    ####################################################################
+    def __init__(self, decay=0.95):
+        if not 0 < decay <= 1:
+            raise ValueError('decay must be greater than 0 and at most 1. Got {}.'.format(decay))
+        self.decay = decay
+        self.keys = get_detectable_keys()
+        # profiles[pitch_class] is every key's profile value for that pitch class
+        profiles = [_centered(MAJOR_PROFILE, key.tonic.pitch_class) for key in self.keys[:PITCH_CLASS_COUNT]]
+        profiles += [_centered(MINOR_PROFILE, key.tonic.pitch_class) for key in self.keys[PITCH_CLASS_COUNT:]]
+        self._profiles = tuple(tuple(profile[pitch_class] for profile in profiles)
+                               for pitch_class in range(PITCH_CLASS_COUNT))
+        self.reset()
+
+    ####################################################################
+    def reset(self):
+        self.count = 0
+        self._histogram = [0.0] * PITCH_CLASS_COUNT
+        self._dots = [0.0] * len(self.keys)
+        self._sum = 0.0
+        self._sum_of_squares = 0.0
+        self._weight = 1.0
+
+    ####################################################################
+    def add_pitch_class(self, pitch_class, weight=1.0):
+        weight *= self._weight
+        old = self._histogram[pitch_class]
+        self._histogram[pitch_class] = old + weight
+        self._sum += weight
+        self._sum_of_squares += weight * (2 * old + weight)
+        dots = self._dots
+        for i, value in enumerate(self._profiles[pitch_class]):
+            dots[i] += weight * value
+
+        self.count += 1
+        self._weight /= self.decay
+        if self._weight > _RESCALE_AT:
+            self._rescale()
+
+    ####################################################################
+    def add(self, note, weight=1.0):
+        """
+        Add a Note (or ComposedNote, or note name) to the histogram.
+        """
+        self.add_pitch_class(Note(note).pitch_class, weight)
+
+    ####################################################################
+    def add_midi_number(self, midi_number, weight=1.0):
+        self.add_pitch_class(midi_number % PITCH_CLASS_COUNT, weight)
+
+    ####################################################################
+    def _rescale(self):
+        scale = self._weight
+        self._histogram = [value / scale for value in self._histogram]
+        self._dots = [value / scale for value in self._dots]
+        self._sum /= scale
+        self._sum_of_squares /= scale * scale
+        self._weight = 1.0
+
+    ####################################################################
+    @property
+    def histogram(self):
+        """
+        The decayed weight of each pitch class, where the latest note counts 1.
+        """
+        scale = self._weight * self.decay
+        return tuple(value / scale for value in self._histogram)
+
+    ####################################################################
+    def correlations(self):
+        """
+        Each key's correlation with the histogram, -1 to 1, in the order of self.keys.
+        All 0 before any notes.
+        """
+        variance = self._sum_of_squares - self._sum * self._sum / PITCH_CLASS_COUNT
+        if variance <= 1e-12 * self._sum_of_squares:
+            return [0.0] * len(self.keys)
+        deviation = math.sqrt(variance)
+        return [dot / deviation for dot in self._dots]
+
+    ####################################################################
+    def ranked(self):
+        """
+        (Key, correlation) for all 24 keys, best first.
+        """
+        return sorted(zip(self.keys, self.correlations()), key=lambda pair: -pair[1])
+
+    ####################################################################
+    @property
+    def key(self):
+        """
+        The best fitting Key right now, or None before any notes.
+        """
+        if not self.count:
+            return None
+        correlations = self.correlations()
+        return self.keys[correlations.index(max(correlations))]
+
+    ####################################################################
+    @property
+    def confidence(self):
+        """
+        The best key's correlation with the histogram, -1 to 1.
+        """
+        return max(self.correlations()) if self.count else 0.0
@@ -1,5 +1,24 @@
+import bisect
+import itertools
+import math
+import operator
+
+from .cache import LRUCache
 from .data import *
 from .errors import *
+from .parsing import parse_name, parse_note, parse_quality
+
+try:
+    from .scale_table import SCALE_NOTES, RELATIVE_KEYS, PARALLEL_KEYS
+except ImportError:
+    # The precomputed table is optional. Without it every scale is calculated.
+    SCALE_NOTES, RELATIVE_KEYS, PARALLEL_KEYS = {}, {}, {}
+
+
+# SEMITONE_PITCHES: (16.35, 17.32, ...), one semitone apart, lowest first
+# PITCH_TO_SEMITONE: {16.35: 0, 17.32: 1, ...}
+SEMITONE_PITCHES = tuple(PITCHES.values())
+PITCH_TO_SEMITONE = {hz: semitone for semitone, hz in enumerate(SEMITONE_PITCHES)}
 
 
 #######################################################################
@@ -30,127 +49,159 @@ class Quality(str):
     ###################################################################
     @classmethod
     def clean(cls, quality):
-        cleaned = quality.lower().strip().replace(' ', '')
-        try:
-            return QUALITIES[cleaned]
-        except KeyError:
+        cleaned = parse_quality(quality)
+        if cleaned is None:
             raise InvalidQualityError('"{}" is not a valid quality.'.format(quality))
+        return cleaned
 
 
 ########################################################################
 class Pitch:
+    """
+    A pitch in Hz, stored once as a float, along with its semitone number.
+    Pitches compare and do arithmetic with other Pitches, floats and ints.
+    Because semitone numbers only ever go up as Hz go up, ordering by Hz
+    is the same as ordering by semitone.
+    """
 
+    __slots__ = ('value', 'semitone')
     __interval_increase = 1.0595
 
     ####################################################################
     def __init__(self, _float):
-        self._value = _float
-        if isinstance(_float, Pitch):
-            _float = _float._value
-        self.value = float(_float)
+        if type(_float) is Pitch:
+            self.value = _float.value
+            self.semitone = _float.semitone
+        else:
+            self.value = float(_float)
+            self.semitone = self.__get_semitone(self.value)
+
+    ####################################################################
+    @staticmethod
+    def __get_semitone(value):
+        """
+        The number of semitones above the lowest pitch in PITCHES (C0).
+        Pitches in between two semitones get the nearest one.
+        """
+        try:
+            return PITCH_TO_SEMITONE[value]
+        except KeyError:
+            if value <= 0:
+                return None
+            return round(12 * math.log2(value / SEMITONE_PITCHES[0]))
+
+    ####################################################################
+    @classmethod
+    def from_semitone(cls, semitone):
+        if not 0 <= semitone < len(SEMITONE_PITCHES):
+            error = ('Semitone {semitone} is outside of the pitch table. '
+                     'Pitches go from semitone 0 ({lowest}) to semitone {top} ({highest}).')
+            raise InvalidPitchError(error.format(semitone=semitone, top=len(SEMITONE_PITCHES) - 1,
+                                                 lowest=SEMITONE_PITCHES[0], highest=SEMITONE_PITCHES[-1]))
+        return cls(SEMITONE_PITCHES[semitone])
+
+    ####################################################################
+    @property
+    def is_in_pitch_table(self):
+        return self.value in PITCH_TO_SEMITONE
 
     ####################################################################
     def __str__(self):
-        return 'Pitch({})'.format(self._value)
+        return 'Pitch({})'.format(self.value)
 
     ####################################################################
     def __repr__(self):
-        return 'Pitch({})'.format(self._value)
+        return 'Pitch({})'.format(self.value)
+
+    ####################################################################
+    def __float__(self):
+        return self.value
 
     ####################################################################
     def __hash__(self):
-        return hash(self._value)
+        return hash(self.value)
 
     ####################################################################
     def __eq__(self, other):
-        if isinstance(other, (float, int)):
-            return self._value == other
-        elif isinstance(other, Pitch):
-            return self._value == other._value
-        else:
-            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+        if type(other) is Pitch:
+            return self.value == other.value
+        elif isinstance(other, (float, int)):
+            return self.value == other
+        raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
 
     ####################################################################
     def __add__(self, other):
-        if isinstance(other, (float, int)):
-            return self._value + other
-        elif isinstance(other, Pitch):
-            return self._value + other._value
-        else:
-            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+        if type(other) is Pitch:
+            return self.value + other.value
+        elif isinstance(other, (float, int)):
+            return self.value + other
+        raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
 
     ####################################################################
     def __sub__(self, other):
-        if isinstance(other, (float, int)):
-            return self._value - other
-        elif isinstance(other, Pitch):
-            return self._value - other._value
-        else:
-            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+        if type(other) is Pitch:
+            return self.value - other.value
+        elif isinstance(other, (float, int)):
+            return self.value - other
+        raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
 
     ####################################################################
     def __rsub__(self, other):
-        if isinstance(other, (float, int)):
-            return other - self._value
-        elif isinstance(other, Pitch):
-            return other._value - self._value
-        else:
-            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+        if type(other) is Pitch:
+            return other.value - self.value
+        elif isinstance(other, (float, int)):
+            return other - self.value
+        raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
 
     ####################################################################
     def __mul__(self, other):
-        if isinstance(other, (float, int)):
-            return self._value * other
-        elif isinstance(other, Pitch):
-            return self._value * other._value
-        else:
-            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+        if type(other) is Pitch:
+            return self.value * other.value
+        elif isinstance(other, (float, int)):
+            return self.value * other
+        raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
 
     ####################################################################
     def __gt__(self, other):
-        if isinstance(other, (float, int)):
-            return self._value > other
-        elif isinstance(other, Pitch):
-            return self._value > other._value
-        else:
-            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+        if type(other) is Pitch:
+            return self.value > other.value
+        elif isinstance(other, (float, int)):
+            return self.value > other
+        raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
 
     ####################################################################
     def __ge__(self, other):
-        if isinstance(other, (float, int)):
-            return self._value >= other
-        elif isinstance(other, Pitch):
-            return self._value >= other._value
-        else:
-            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+        if type(other) is Pitch:
+            return self.value >= other.value
+        elif isinstance(other, (float, int)):
+            return self.value >= other
+        raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
 
     ####################################################################
     def __lt__(self, other):
-        if isinstance(other, (float, int)):
-            return self._value < other
-        elif isinstance(other, Pitch):
-            return self._value < other._value
-        else:
-            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+        if type(other) is Pitch:
+            return self.value < other.value
+        elif isinstance(other, (float, int)):
+            return self.value < other
+        raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
 
     ####################################################################
     def __le__(self, other):
-        if isinstance(other, (float, int)):
-            return self._value <= other
-        elif isinstance(other, Pitch):
-            return self._value <= other._value
-        else:
-            raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
+        if type(other) is Pitch:
+            return self.value <= other.value
+        elif isinstance(other, (float, int)):
+            return self.value <= other
+        raise TypeError('Cannot compare Pitch to type {}'.format(type(other)))
 
     ####################################################################
     @property
     def next_pitch(self):
-        next_hz = self._value * self.__interval_increase
+        next_hz = self.value * self.__interval_increase
         return Pitch(next_hz)
 
     ####################################################################
     # def in_tune(self, pitch_2):
-    #     diff = pitch_2 / self._value
+    #     diff = pitch_2 / self.value
     #     if diff > 1.05:
     #         return SHARP
     #     elif diff < 0.95:
@@ -159,27 +210,21 @@ class Pitch:
 
     ####################################################################
     def increase(self, semitones):
-        increased = 0
-
-        for hz in PITCHES.values():
-            if hz > self._value:
-                increased += 1
-            if increased == semitones:
-                break
-
-        return Pitch(hz)
+        if self.is_in_pitch_table:
+            semitone = self.semitone + semitones
+        else:
+            # Count from the first pitch in the table above this one.
+            semitone = bisect.bisect_right(SEMITONE_PITCHES, self.value) + semitones - 1
+        return Pitch.from_semitone(semitone)
 
     ####################################################################
     def decrease(self, semitones):
-        decreased = 0
-
-        for hz in reversed(PitchMap):
-            if hz < self._value:
-                decreased += 1
-            if decreased == semitones:
-                break
-
-        return Pitch(hz)
+        if self.is_in_pitch_table:
+            semitone = self.semitone - semitones
+        else:
+            # Count from the first pitch in the table below this one.
+            semitone = bisect.bisect_left(SEMITONE_PITCHES, self.value) - semitones
+        return Pitch.from_semitone(semitone)
 
 
 ########################################################################
@@ -239,24 +284,65 @@ class UnavailableNoteError(Exception): pass
 
 ########################################################################
 class Note:
+    """
+    There is only ever one Note for each spelling. Note('C#'), Note('c sharp')
+    and Note(C_sharp) all return the same object, so Notes can be compared
+    by identity. Subclasses such as ComposedNote are not interned.
+    """
+
+    __slots__ = ('__name', '__quality', '__hash', '__pitch_class')
+    __interned = {}
+
+    ####################################################################
+    def __new__(cls, note, *args, **kwargs):
+        key = note.name if isinstance(note, Note) else note
+        try:
+            interned = Note.__interned[key]
+        except KeyError:
+            interned = Note.__intern(key)
+        if cls is Note:
+            return interned
+
+        # Subclasses get their own instance, copied from the interned Note.
+        instance = super().__new__(cls)
+        instance.__name = interned.__name
+        instance.__quality = interned.__quality
+        instance.__hash = interned.__hash
+        instance.__pitch_class = interned.__pitch_class
+        return instance
+
+    ####################################################################
+    @staticmethod
+    def __intern(note):
+        parsed = parse_note(note)
+        if parsed is None or parsed.octave is not None:
+            raise InvalidNoteError('"{}" is not a valid note.'.format(note))
+        quality = parsed.accidental
+        name = parsed.letter + quality
+
+        try:
+            # A new way of writing a note we already have, e.g. 'c sharp'.
+            # Only the canonical name is interned: other spellings are
+            # remembered by the bounded PARSED_NOTES cache instead.
+            return Note.__interned[name]
+        except KeyError:
+            pass
+        instance = object.__new__(Note)
+        instance.__name = name
+        instance.__quality = Quality(quality)
+        instance.__hash = hash((name, instance.__quality))
+        instance.__pitch_class = (NATURAL_PITCH_CLASSES[name[0]] + ACCIDENTAL_SEMITONES[quality]) % 12
+        Note.__interned[name] = instance
+        return instance
 
     ####################################################################
     def __init__(self, note):
-        if isinstance(note, Note):
-            name = note.natural_name
-            quality = note.quality
-        else:
-            name = note[:1].upper().strip()
-            assert name in NATURAL_NOTES, '"{}" is not a valid note.'.format(name)
-            quality = note[1:].replace("-", "").replace("_", "").lower().strip()
-            if quality:
-                try:
-                    quality = SHARPS_AND_FLATS[quality]
-                except KeyError:
-                    raise InvalidNoteError('"{}" is not a valid note.'.format(note))
+        # Everything is set in __new__, so interned Notes are never parsed twice.
+        pass
 
-        self.__name = '{}{}'.format(name, quality)
-        self.__quality = Quality(quality)
+    ####################################################################
+    def __reduce__(self):
+        return Note, (self.__name,)
 
     ####################################################################
     @property
@@ -268,6 +354,14 @@ class Note:
     def quality(self):
         return self.__quality
 
+    ####################################################################
+    @property
+    def pitch_class(self):
+        """
+        Semitones above C, from 0 to 11. Enharmonic notes share a pitch class.
+        """
+        return self.__pitch_class
+
     ####################################################################
     def __str__(self):
         return self.name
@@ -278,13 +372,18 @@ class Note:
 
     ####################################################################
     def __eq__(self, other):
+        if self is other:
+            return True
+        if type(self) is Note and type(other) is Note:
+            # Both are interned, so different objects are different notes.
+            return False
         if not isinstance(other, Note):
             raise TypeError('Cannot compare type Note to type "{}"'.format(type(other)))
-        return hash(self) == hash(other)
+        return self.__name == other.__name
 
     ####################################################################
     def __hash__(self):
-        return hash(tuple((self.name, self.quality)))
+        return self.__hash
 
     ####################################################################
     @classmethod
@@ -360,6 +459,12 @@ class Note:
         return Note(previous_note_name)
 
 
+# Read a Note's slots directly, without going through its properties,
+# for converting many notes at once.
+_get_pitch_class = operator.attrgetter('_Note__pitch_class')
+_get_quality = operator.attrgetter('_Note__quality')
+
+
 #######################################################################
 def PitchMap(item):
     """
@@ -378,32 +483,45 @@ def PitchMap(item):
             (Note('C#') Octave(0)): Pitch('17.32'),
             ...
         }
+
+    Both directions are answered from PITCH_TO_NOTES and NOTE_TO_PITCH,
+    which are built from PITCHES the first time PitchMap is called.
     """
-    need_pitch = isinstance(item, tuple) and isinstance(item[0], Note) and isinstance(item[1], Octave)
-    need_note = isinstance(item, Pitch)
-
-    for notes_with_octaves, _pitch in PITCHES.items():
-        if need_note:
-            if _pitch == item:
-                notes_with_octaves = notes_with_octaves.split('/')
-                notes = []
-                for note_with_octave in notes_with_octaves:
-                    name = note_with_octave[0]  # first character
-                    quality = note_with_octave[1:-1]  # any/every thing in the middle
-                    octave = Octave(note_with_octave[-1])  # last character, integer for octave
-                    note = Note(name + quality)
-                    notes.append((note, octave))
-                return tuple(notes)
-        elif need_pitch:
-            target_note, target_octave = item
-            notes_with_octaves = notes_with_octaves.split('/')
-            for note_with_octave in notes_with_octaves:
-                name = note_with_octave[0]  # first character
-                quality = note_with_octave[1:-1]  # any/every thing in the middle
-                octave = Octave(note_with_octave[-1])  # last character, integer for octave
-                note = Note(name + quality)
-                if target_note == note and target_octave == octave:
-                    return Pitch(_pitch)
+    pitch_to_notes, note_to_pitch = _pitch_index or __build_pitch_index()
+    if isinstance(item, Pitch):
+        return pitch_to_notes.get(item.value)
+    elif isinstance(item, tuple) and isinstance(item[0], Note) and isinstance(item[1], Octave):
+        return note_to_pitch.get(item)
+
+
+# PITCH_TO_NOTES: {16.35: ((Note('B#'), Octave(0)), (Note('C'), Octave(0)), ...), ...}
+# NOTE_TO_PITCH: {(Note('C'), Octave(0)): Pitch(16.35), ...}
+# Both are built on first use. Until then this is None.
+_pitch_index = None
+
+
+#######################################################################
+def __build_pitch_index():
+    global _pitch_index
+    pitch_to_notes = {}
+    note_to_pitch = {}
+
+    for notes_with_octaves, hz in PITCHES.items():
+        pitch = Pitch(hz)
+        notes = []
+        for note_with_octave in notes_with_octaves.split('/'):
+            # The table's names are all spelled like 'Dbb1', so no parsing is needed.
+            name = note_with_octave.rstrip('0123456789')
+            octave = Octave(note_with_octave[len(name):])
+            note = Note(name)
+            notes.append((note, octave))
+            # A spelling listed under more than one pitch keeps the
+            # lowest one, the same answer the old top-down scan gave.
+            note_to_pitch.setdefault((note, octave), pitch)
+        pitch_to_notes[pitch.value] = tuple(notes)
+
+    _pitch_index = (pitch_to_notes, note_to_pitch)
+    return _pitch_index
 
 
 #######################################################################
@@ -523,13 +641,10 @@ class Range:
         self.lowest_pitch = Pitch(lowest_pitch)
         self.highest_pitch = Pitch(highest_pitch)
 
-        _pitches = []
-        for names, hz in PITCHES.items():
-            pitch = Pitch(hz)
-            if lowest_pitch <= pitch <= highest_pitch:
-                _pitches.append(pitch)
-
-        self.pitches = tuple(_pitches)
+        # SEMITONE_PITCHES is sorted, so the range is one slice of it.
+        lowest = bisect.bisect_left(SEMITONE_PITCHES, self.lowest_pitch.value)
+        highest = bisect.bisect_right(SEMITONE_PITCHES, self.highest_pitch.value)
+        self.pitches = tuple(Pitch(hz) for hz in SEMITONE_PITCHES[lowest:highest])
 
     def __len__(self):
         return len(self.pitches)
@@ -540,7 +655,6 @@ class Range:
 
 
 PianoRange = Range(Pitch(27.50), Pitch(4186.01))
-assert len(PianoRange) == 88, 'Piano Range: {}'.format(len(PianoRange))
 
 
 #######################################################################
@@ -623,8 +737,137 @@ MODAL_SCALES = (IonianScale, DorianScale, PhrygianScale,
                 LydianScale, MixolydianScale, AeolianScale, LocrianScale)
 
 
+PITCH_CLASS_COUNT = 12
+ALL_PITCH_CLASSES = (1 << PITCH_CLASS_COUNT) - 1
+
+
+#######################################################################
+class PitchClassSet:
+    """
+    A compact, immutable set of pitch classes: a 12-bit mask with bit 0 for C,
+    bit 1 for C#/Db and so on up to bit 11 for B, plus the notes spelling
+    them in order (the scale degrees, for a scale). Membership, transposition
+    and comparison only touch the mask.
+    """
+    __slots__ = ('mask', 'spelling')
+
+    ####################################################################
+    def __init__(self, mask, spelling=()):
+        self.mask = mask & ALL_PITCH_CLASSES
+        self.spelling = tuple(spelling)
+
+    ####################################################################
+    @classmethod
+    def from_notes(cls, notes):
+        notes = tuple(Note(note) for note in notes)
+        mask = 0
+        for note in notes:
+            mask |= 1 << note.pitch_class
+        return cls(mask, notes)
+
+    ####################################################################
+    def __contains__(self, item):
+        try:
+            return self.mask >> item.pitch_class & 1 == 1
+        except AttributeError:
+            return self.mask >> item & 1 == 1
+
+    ####################################################################
+    def __len__(self):
+        return bin(self.mask).count('1')
+
+    ####################################################################
+    def __iter__(self):
+        for pitch_class in range(PITCH_CLASS_COUNT):
+            if self.mask >> pitch_class & 1:
+                yield pitch_class
+
+    ####################################################################
+    def __eq__(self, other):
+        if not isinstance(other, PitchClassSet):
+            return NotImplemented
+        return self.mask == other.mask
+
+    ####################################################################
+    def __hash__(self):
+        return hash(self.mask)
+
+    ####################################################################
+    def __and__(self, other):
+        return PitchClassSet(self.mask & other.mask)
+
+    ####################################################################
+    def __or__(self, other):
+        return PitchClassSet(self.mask | other.mask)
+
+    ####################################################################
+    def __sub__(self, other):
+        return PitchClassSet(self.mask & ~other.mask)
+
+    ####################################################################
+    def issubset(self, other):
+        return self.mask & other.mask == self.mask
+
+    ####################################################################
+    def issuperset(self, other):
+        return self.mask & other.mask == other.mask
+
+    ####################################################################
+    def transpose(self, semitones):
+        """
+        Rotate the mask up by `semitones`. Only the mask moves: spelling a
+        transposed note needs to know the interval's letter name too, so the
+        result has no spelling.
+        """
+        semitones %= PITCH_CLASS_COUNT
+        mask = self.mask << semitones | self.mask >> (PITCH_CLASS_COUNT - semitones)
+        return PitchClassSet(mask)
+
+    ####################################################################
+    def spell(self, pitch_class):
+        """
+        The note spelling this pitch class, or None if it isn't in the set.
+        """
+        for note in self.spelling:
+            if note.pitch_class == pitch_class:
+                return note
+
+    ####################################################################
+    def __repr__(self):
+        return 'PitchClassSet(0b{mask:012b})'.format(mask=self.mask)
+
+
+# Scales, Modes and Keys never change once they are built,
+# so one instance per (class, tonic, scale pattern) is shared process-wide.
+SCALE_CACHE = LRUCache(maxsize=256)
+
+
+#######################################################################
+class CachedConstruction(type):
+    """
+    Metaclass for classes whose instances are looked up in SCALE_CACHE
+    before being built. The class provides _cache_key(), taking the same
+    arguments as __init__.
+    """
+
+    ####################################################################
+    def __call__(cls, *args, **kwargs):
+        key = cls._cache_key(*args, **kwargs)
+        try:
+            return SCALE_CACHE.get(key)
+        except KeyError:
+            instance = super().__call__(*args, **kwargs)
+            SCALE_CACHE.put(key, instance)
+            return instance
+
+
 #######################################################################
-class Scale(ScalePattern):
+class Scale(ScalePattern, metaclass=CachedConstruction):
+
+    ####################################################################
+    @classmethod
+    def _cache_key(cls, tonic, base_scale):
+        return cls, Note(tonic).name, base_scale.name, tuple(base_scale.intervals)
 
     ####################################################################
     def __init__(self, tonic, base_scale):
@@ -648,6 +891,7 @@ class Scale(ScalePattern):
 
         self.notes = tuple(self._generate_notes())
         self.note_names = tuple(note.name for note in self.notes)
+        self._pitch_classes = PitchClassSet.from_notes(self.notes)
 
         # num_intervals = len(self.notes)
         # self.first = self.notes[0]
@@ -669,6 +913,14 @@ class Scale(ScalePattern):
 
     ####################################################################
     def _generate_notes(self):
+        try:
+            names = SCALE_NOTES[(self.tonic.name, self.base_scale.name)]
+        except KeyError:
+            return self._calculate_notes()
+        return [Note(name) for name in names]
+
+    ####################################################################
+    def _calculate_notes(self):
         # We already know the root note, so create a list starting with that
         notes = [self.tonic]
 
@@ -704,6 +956,14 @@ class Scale(ScalePattern):
 
         return notes
 
+    ####################################################################
+    @property
+    def pitch_classes(self):
+        """
+        This scale's notes as a PitchClassSet.
+        """
+        return self._pitch_classes
+
     ####################################################################
     def __eq__(self, other):
         if not isinstance(other, Scale):
@@ -794,28 +1054,27 @@ class Mode(Scale):
 
 ########################################################################
 def _get_note_and_quality_from_music_element(element_name):
-    try:
-        note = Note(element_name[0])
-    except IndexError:
+    parsed = parse_name(element_name)
+    if parsed is None:
         raise InvalidNoteError('"{}" does not contain a valid root note.'.format(element_name))
-    remainder = element_name[1:]
-
-    if remainder:
-        for char in remainder:
-            try:
-                note = Note(note.name + char)
-            except InvalidNoteError:
-                break
-
-    quality = element_name[len(note.name):] or ''
-    if quality:
-        quality = Quality(quality)
+    if parsed.quality is None:
+        raise InvalidQualityError('"{}" does not have a valid quality.'.format(element_name))
 
+    note = Note(parsed.letter + parsed.accidental)
+    quality = Quality(parsed.quality) if parsed.quality else ''
     return note, quality
 
 
 ########################################################################
-class Key:
+class Key(metaclass=CachedConstruction):
+
+    ####################################################################
+    @classmethod
+    def _cache_key(cls, name):
+        # The whole quality, not just major or minor: Key('Abm7') is named and
+        # answers is_major() differently from Key('Ab'), though their notes are the same.
+        tonic, quality = _get_note_and_quality_from_music_element(name.strip())
+        return cls, tonic.name, str(quality)
 
     ####################################################################
     def __init__(self, name):
@@ -878,6 +1137,38 @@ class Key:
     #             self.mixolydian_mode,
     #         )
 
+    ####################################################################
+    @property
+    def relative(self):
+        """
+        The major or minor key that shares this key's notes.
+        """
+        try:
+            name = RELATIVE_KEYS[self.name]
+        except KeyError:
+            name = self.notes[5].name + MINOR if self.is_major() else self.notes[2].name
+        return Key(name)
+
+    ####################################################################
+    @property
+    def parallel(self):
+        """
+        The major or minor key that shares this key's tonic.
+        """
+        try:
+            name = PARALLEL_KEYS[self.name]
+        except KeyError:
+            name = self.tonic.name + MINOR if self.is_major() else self.tonic.name
+        return Key(name)
+
+    ####################################################################
+    @property
+    def pitch_classes(self):
+        """
+        This key's notes as a PitchClassSet.
+        """
+        return self.scale.pitch_classes
+
     ####################################################################
     def __str__(self):
         return 'Key of {}'.format(self.name)
@@ -898,3 +1189,456 @@ class Key:
     ####################################################################
     def is_major(self):
         return self.quality == MAJOR
+
+
+# Chord notes by (root name, quality). There are only a few hundred spellings,
+# so every one that has been asked for is kept.
+CHORD_SPELLINGS = {}
+
+
+########################################################################
+def _get_chord_root_and_quality(name):
+    root, quality = _get_note_and_quality_from_music_element(name.strip())
+    if quality not in CHORD_DEGREES:
+        raise InvalidChordError('"{}" is not a valid chord.'.format(name))
+    return root, quality
+
+
+########################################################################
+def spell_chord(root, quality):
+    """
+    The notes of the chord with this root Note and quality, root first,
+    spelled the way the root's major and minor keys spell them.
+    """
+    try:
+        return CHORD_SPELLINGS[root.name, quality]
+    except KeyError:
+        pass
+
+    key_names = {MAJOR_SCALE_NAME: root.name, MINOR_SCALE_NAME: root.name + MINOR}
+    try:
+        notes = tuple(Key(key_names[scale_name]).notes[degree] for scale_name, degree in CHORD_DEGREES[quality])
+    except InvalidKeyError as e:
+        raise InvalidChordError('Cannot spell {root}{quality}: {e}'.format(root=root, quality=quality, e=e))
+    CHORD_SPELLINGS[root.name, quality] = notes
+    return notes
+
+
+########################################################################
+class Chord(metaclass=CachedConstruction):
+    """
+    A chord named by its root and a chord quality from QUALITIES, e.g. Chord('A'),
+    Chord('C#m7'), Chord('Bb maj7') or Chord('G11'). The notes come from the
+    root's major and minor keys as laid out in CHORD_DEGREES.
+    """
+
+    ####################################################################
+    @classmethod
+    def _cache_key(cls, name, key=None):
+        root, quality = _get_chord_root_and_quality(name)
+        if isinstance(key, Key):
+            key = key.name
+        return cls, root.name, quality, key
+
+    ####################################################################
+    def __init__(self, name, key=None):
+        root, quality = _get_chord_root_and_quality(name)
+        self.root_note = root
+        self.quality = quality
+        self.is_minor = MAJOR_ABBREVIATION not in quality and MINOR in quality
+        self.is_major = not self.is_minor
+        self.name = '{root}{quality}'.format(root=root, quality=quality)
+        self.notes = spell_chord(root, quality)
+        self.key_specified = key is not None
+        if isinstance(key, Key):
+            self.key = key
+        else:
+            self.key = Key(key) if key else self.default_key
+        self.note_names = tuple(note.name for note in self.notes)
+        self._pitch_classes = PitchClassSet.from_notes(self.notes)
+
+    ####################################################################
+    @classmethod
+    def from_notes(cls, notes):
+        """
+        The chord made of exactly these notes, in any order, or None if they aren't one.
+        """
+        name = identify_chord(notes)
+        return cls(name) if name else None
+
+    ####################################################################
+    @property
+    def default_key(self):
+        quality = MINOR if self.is_minor else MAJOR
+        name = '{root}{quality}'.format(root=self.root_note.name, quality=quality)
+        return Key(name)
+
+    ####################################################################
+    @property
+    def triad(self):
+        return self.notes[:3]
+
+    ####################################################################
+    @property
+    def seventh(self):
+        return self.notes[3] if len(self.notes) > 3 else None
+
+    ####################################################################
+    @property
+    def ninth(self):
+        return self.notes[4] if len(self.notes) > 4 else None
+
+    ####################################################################
+    @property
+    def eleventh(self):
+        return self.notes[5] if len(self.notes) > 5 else None
+
+    ####################################################################
+    @property
+    def pitch_classes(self):
+        """
+        This chord's notes as a PitchClassSet.
+        """
+        return self._pitch_classes
+
+    ####################################################################
+    def __str__(self):
+        return '{} Chord'.format(self.name)
+
+    ####################################################################
+    def __repr__(self):
+        return 'Chord({})'.format(self.name)
+
+    ####################################################################
+    def __iter__(self):
+        for note in self.notes:
+            yield note
+
+    ####################################################################
+    def __eq__(self, other):
+        if not isinstance(other, Chord):
+            raise TypeError('Cannot compare type {} to type Chord.'.format(type(other)))
+        return self.name == other.name
+
+    ####################################################################
+    def __hash__(self):
+        return hash(self.name)
+
+
+########################################################################
+def __build_chord_table():
+    """
+    CHORD_TABLE[mask] is (root pitch class, quality) for the chord made of
+    exactly the pitch classes in the PitchClassSet mask, or None.
+    """
+    global _chord_table
+    intervals = {MAJOR_SCALE_NAME: MAJOR_INTERVALS, MINOR_SCALE_NAME: MINOR_INTERVALS}
+    table = [None] * (1 << PITCH_CLASS_COUNT)
+    for quality, degrees in CHORD_DEGREES.items():
+        semitones = [sum(intervals[scale_name][:degree]) for scale_name, degree in degrees]
+        for root in range(PITCH_CLASS_COUNT):
+            mask = 0
+            for semitone in semitones:
+                mask |= 1 << (root + semitone) % PITCH_CLASS_COUNT
+            assert table[mask] is None, 'Chords {} and {} share their notes.'.format(table[mask], (root, quality))
+            table[mask] = (root, quality)
+    _chord_table = tuple(table)
+    return _chord_table
+
+
+# CHORD_TABLE, built the first time a chord is identified.
+_chord_table = None
+
+
+########################################################################
+def identify_chord(notes):
+    """
+    The name of the chord made of exactly these notes, in any order or
+    inversion, or None. The root is spelled the way it is in `notes`.
+    """
+    notes = [Note(note) for note in notes]
+    mask = 0
+    for note in notes:
+        mask |= 1 << note.pitch_class
+    match = (_chord_table or __build_chord_table())[mask]
+    if match is None:
+        return None
+    root_pitch_class, quality = match
+    root = next(note for note in notes if note.pitch_class == root_pitch_class)
+    return root.name + quality
+
+
+# How to write each pitch class, C first, when the notes around it don't say.
+SHARP_SPELLING = (C, C_sharp, D, D_sharp, E, F, F_sharp, G, G_sharp, A, A_sharp, B)
+FLAT_SPELLING = (C, D_flat, D, E_flat, E, F, G_flat, G, A_flat, A, B_flat, B)
+
+# Spelling tables by (quality to use, key name), built as they are asked for.
+SPELLINGS = {}
+
+
+########################################################################
+def _count_accidentals(key):
+    return sum(len(note.name) - 1 for note in key.notes)
+
+
+########################################################################
+def transposed_key(key, semitones):
+    """
+    The major or minor key `semitones` above (or below, if negative) `key`,
+    spelled with the fewest sharps and flats: Key('Eb') up 4 is Key('G').
+    """
+    key = key if isinstance(key, Key) else Key(key)
+    pitch_class = (key.tonic.pitch_class + semitones) % PITCH_CLASS_COUNT
+    names = MAJOR_KEY_NAMES if key.is_major() else MINOR_KEY_NAMES
+    candidates = [Key(name) for name in names if Key(name).tonic.pitch_class == pitch_class]
+    return min(candidates, key=_count_accidentals)
+
+
+########################################################################
+def get_spelling(quality_to_use=None, key=None):
+    """
+    The Note to write each pitch class as, indexed by pitch class. Notes in
+    `key` are spelled as the key spells them. Any others are naturals where
+    possible, then sharps or flats as `quality_to_use` says, or as the key
+    leans if it doesn't.
+    """
+    key = Key(key) if isinstance(key, str) else key
+    cache_key = quality_to_use, key and key.name
+    try:
+        return SPELLINGS[cache_key]
+    except KeyError:
+        pass
+
+    if quality_to_use is None and key is not None and any(note.is_flat for note in key.notes):
+        quality_to_use = FLAT
+    spelling = list(FLAT_SPELLING if quality_to_use in (FLAT, DOUBLE_FLAT) else SHARP_SPELLING)
+    if key is not None:
+        for note in key.notes:
+            spelling[note.pitch_class] = note
+    SPELLINGS[cache_key] = spelling = tuple(spelling)
+    return spelling
+
+
+########################################################################
+class Transpose:
+    """
+    Transposes a whole sequence of notes in one step:
+
+        Transpose(A, C, E).up.third          # [C#, E, G#]
+        Transpose(melody, key='Eb').up.third   # spelled in G major
+        Transpose(semitone_array).down.fifth    # a NumPy array, 7 lower
+
+    Notes (or note names) come back as Notes, and ComposedNotes as the same
+    class in their new octave. Each note is turned into a number, every
+    number is moved at once (with NumPy, when it's installed), and the numbers
+    are turned back into notes through a 12-entry spelling table. That table
+    is chosen once for the whole sequence by get_spelling(): from the key the
+    notes end up in if `key` is given, and from `quality_to_use` (or the
+    first sharp or flat note) otherwise.
+
+    A NumPy array of semitone indices comes back as an array of semitone
+    indices. self.spelling says how to name them.
+    """
+
+    ####################################################################
+    def __init__(self, *notes, quality_to_use=None, key=None):
+        if len(notes) == 1 and not isinstance(notes[0], (str, Note)):
+            # One sequence or array of notes rather than the notes themselves
+            notes = notes[0]
+
+        if hasattr(notes, 'dtype'):
+            self._array = notes
+            self._raw_notes = ()
+        else:
+            self._array = None
+            # Any note names are turned into Notes the first time one is read.
+            self._raw_notes = notes if isinstance(notes, (list, tuple)) else tuple(notes)
+        composed = sum(map(hasattr, self._raw_notes, itertools.repeat('octave')))
+        if 0 < composed < len(self._raw_notes):
+            raise TypeError('Cannot transpose ComposedNotes together with notes that have no octave.')
+        self._composed = bool(composed)
+        self._values = None
+
+        if quality_to_use is None and key is None:
+            # Spell like the first sharp or flat note.
+            quality_to_use = self._get_first_accidental()
+        self.quality_to_use = {DOUBLE_SHARP: SHARP, DOUBLE_FLAT: FLAT}.get(quality_to_use, quality_to_use)
+        self.key = Key(key) if isinstance(key, str) else key
+        self.target_key = None
+        self.spelling = None
+
+        self._transposed_notes = []
+        self.transpose_up = False
+        self.transpose_down = False
+        self._steps = ()
+
+    ####################################################################
+    def _semitones(self):
+        semitones = sum(self._steps)
+        return int(semitones)
+
+    ####################################################################
+    def steps(self, *steps):
+        """
+        Transpose by these intervals added together, e.g. steps(W, H) for a minor third.
+        """
+        self._steps = tuple(steps)
+        return self._transpose()
+
+    ####################################################################
+    @property
+    def up(self):
+        self.transpose_up = True
+        self.transpose_down = False
+        return self
+
+    ####################################################################
+    @property
+    def down(self):
+        self.transpose_down = True
+        self.transpose_up = False
+        return self
+
+    ####################################################################
+    @property
+    def half_step(self):
+        self._steps = (H, )
+        return self._transpose()
+
+    ####################################################################
+    @property
+    def whole_step(self):
+        self._steps = (W, )
+        return self._transpose()
+
+    ####################################################################
+    @property
+    def third(self):
+        self._steps = (W, W)
+        return self._transpose()
+
+    ####################################################################
+    @property
+    def minor_third(self):
+        self._steps = (W, H)
+        return self._transpose()
+
+    ####################################################################
+    @property
+    def fifth(self):
+        self._steps = (W, W, W, H)
+        return self._transpose()
+
+    ####################################################################
+    @property
+    def octave(self):
+        self._steps = (W, W, W, W, W, W)
+        return self._transpose()
+
+    ####################################################################
+    def _read(self, getter, np=None, dtype=None):
+        """
+        getter(note) for every note, as a NumPy array of dtype if np is given.
+        """
+        try:
+            return self.__read(getter, np, dtype)
+        except AttributeError:
+            # There are note names among the notes.
+            self.__read_names()
+            return self.__read(getter, np, dtype)
+
+    ####################################################################
+    def __read(self, getter, np, dtype):
+        if np is None:
+            return list(map(getter, self._raw_notes))
+        return np.fromiter(map(getter, self._raw_notes), dtype=dtype, count=len(self._raw_notes))
+
+    ####################################################################
+    def __read_names(self):
+        self._raw_notes = tuple(note if isinstance(note, Note) else Note(note) for note in self._raw_notes)
+
+    ####################################################################
+    def _get_first_accidental(self):
+        try:
+            return next(filter(None, map(_get_quality, self._raw_notes)), None)
+        except AttributeError:
+            self.__read_names()
+            return next(filter(None, map(_get_quality, self._raw_notes)), None)
+
+    ####################################################################
+    def _get_values(self, np):
+        # Pitch classes for Notes, and semitones above C0 for ComposedNotes.
+        # ComposedNotes count B# and Cb in the octave of the C they are
+        # next to, so a note's octave is always its semitone // 12.
+        if self._values is None:
+            if not self._composed:
+                self._values = self._read(_get_pitch_class, np, 'int8')
+            elif np is None:
+                octaves = self._read(operator.attrgetter('octave'))
+                self._values = [12 * octave + value for octave, value in zip(octaves, self._read(_get_pitch_class))]
+            else:
+                octaves = self._read(operator.attrgetter('octave'), np, 'int16')
+                self._values = 12 * octaves + self._read(_get_pitch_class, np, 'int16')
+        return self._values
+
+    ####################################################################
+    def _transpose(self):
+        semitones = self._semitones() if self.transpose_up else -self._semitones()
+        self.target_key = self.key and transposed_key(self.key, semitones)
+        self.spelling = spelling = get_spelling(self.quality_to_use, self.target_key)
+
+        if self._array is not None:
+            self._transposed_notes = self._array + semitones
+            return self._transposed_notes
+
+        try:
+            import numpy as np
+        except ImportError:
+            # Without NumPy (as on CircuitPython), look the notes up one at a time.
+            np = None
+        values = self._get_values(np)
+
+        if self._composed:
+            note_class = type(self._raw_notes[0])
+            if np is None:
+                composed = {}
+                transposed = []
+                for value in values:
+                    value += semitones
+                    try:
+                        transposed.append(composed[value])
+                    except KeyError:
+                        composed[value] = note = note_class(spelling[value % 12], value // 12)
+                        transposed.append(note)
+            else:
+                # Build one ComposedNote per distinct result rather than one per note.
+                distinct, indexes = np.unique(values + semitones, return_inverse=True)
+                composed = np.empty(len(distinct), dtype=object)
+                composed[:] = [note_class(spelling[value % 12], value // 12) for value in distinct.tolist()]
+                transposed = composed[indexes].tolist()
+        else:
+            # shifted[pitch class] is how that pitch class is written once transposed.
+            shift = semitones % 12
+            shifted = spelling[shift:] + spelling[:shift]
+            if np is None:
+                transposed = list(map(shifted.__getitem__, values))
+            else:
+                table = np.empty(PITCH_CLASS_COUNT, dtype=object)
+                table[:] = shifted
+                transposed = table[values].tolist()
+
+        self._transposed_notes = transposed
+        return self._transposed_notes
+
+
+#######################################################################
+def __getattr__(name):
+    # Tables the module doesn't need to import are built the first time
+    # they're asked for.
+    if name == 'PITCH_TO_NOTES':
+        return (_pitch_index or __build_pitch_index())[0]
+    elif name == 'NOTE_TO_PITCH':
+        return (_pitch_index or __build_pitch_index())[1]
+    elif name == 'CHORD_TABLE':
+        return _chord_table or __build_chord_table()
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
@@ -0,0 +1,139 @@
+"""
+One grammar for every note, key and chord name, so Note, Key, Quality and
+Chord all read names the same way and each distinct name is read only once.
+
+    parse_note('c sharp') -> ParsedName('C', '#', '', None)
+    parse_note('Eb4')     -> ParsedName('E', 'b', '', 4)
+    parse_name('Bb min7') -> ParsedName('B', 'b', 'm7', None)
+
+Parsing never raises: a name that doesn't fit the grammar gives None, and a
+key or chord name whose root is fine but whose quality isn't gives a quality
+of None. The callers decide which error that is.
+"""
+from collections import namedtuple
+
+from .cache import LRUCache
+from .data import *
+
+# letter: 'A' to 'G'
+# accidental: NATURAL, SHARP, FLAT, DOUBLE_SHARP or DOUBLE_FLAT
+# quality: one of the values in QUALITIES ('' for notes), or None if it isn't one
+# octave: an int, or None if the name doesn't give one
+ParsedName = namedtuple('ParsedName', ('letter', 'accidental', 'quality', 'octave'))
+
+
+#######################################################################
+def _squeeze(written):
+    # Take out spaces, dashes and underscores.
+    return ''.join(written.split()).replace('-', '').replace('_', '')
+
+
+# Every way of writing an accidental, with its spaces, dashes and underscores
+# taken out: {'##': '##', 'doublesharp': '##', ..., 'flat': 'b'}
+ACCIDENTALS = {_squeeze(written): accidental for written, accidental in SHARPS_AND_FLATS.items()}
+_ACCIDENTAL = r'(?:[\s_-]*(##|bb|\#|b|double[\s_-]*sharp|double[\s_-]*flat|sharp|flat))?'
+
+# Notes already written the way Note names them ('C', 'F#', 'Bbb') don't
+# need the grammar, so building the Notes in models doesn't compile it.
+SPELLED_NOTES = {letter + accidental: ParsedName(letter, accidental, MAJOR, None)
+                 for letter in NATURAL_NOTES for accidental in ACCIDENTAL_SEMITONES}
+
+# NOTE_PATTERN: a note, optionally with an octave: 'C', 'c#', 'D flat', 'E-double-flat', 'F#4', 'B-1'
+# NAME_PATTERN: a root note followed by anything, which should be a quality: 'Am', 'Bb maj7', 'F sharp minor'
+# Both are compiled the first time a name needs them.
+_patterns = None
+
+# Parsed names by the text they were parsed from, failures included.
+PARSED_NOTES = LRUCache(maxsize=1024)
+PARSED_NAMES = LRUCache(maxsize=1024)
+PARSED_QUALITIES = LRUCache(maxsize=256)
+
+
+#######################################################################
+def _get_patterns():
+    global _patterns
+    if _patterns is None:
+        import re
+        _patterns = {
+            'NOTE_PATTERN': re.compile(r'\s*([A-G])' + _ACCIDENTAL + r'\s*(-?\d+)?\s*$', re.IGNORECASE),
+            'NAME_PATTERN': re.compile(r'\s*([A-G])' + _ACCIDENTAL + r'(.*)$', re.IGNORECASE | re.DOTALL),
+        }
+    return _patterns
+
+
+#######################################################################
+def __getattr__(name):
+    if name in ('NOTE_PATTERN', 'NAME_PATTERN'):
+        return _get_patterns()[name]
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+#######################################################################
+def _accidental(written):
+    if not written:
+        return NATURAL
+    try:
+        return ACCIDENTALS[written]
+    except KeyError:
+        return ACCIDENTALS[_squeeze(written.lower())]
+
+
+#######################################################################
+def parse_note(text):
+    """
+    A ParsedName for a note name with an optional octave, or None if `text` isn't one.
+    """
+    try:
+        return SPELLED_NOTES[text]
+    except KeyError:
+        pass
+    try:
+        return PARSED_NOTES.get(text)
+    except KeyError:
+        pass
+
+    match = _get_patterns()['NOTE_PATTERN'].match(text)
+    parsed = None
+    if match:
+        letter, accidental, octave = match.groups()
+        octave = None if octave is None else int(octave)
+        parsed = ParsedName(letter.upper(), _accidental(accidental), MAJOR, octave)
+    PARSED_NOTES.put(text, parsed)
+    return parsed
+
+
+#######################################################################
+def parse_quality(text):
+    """
+    The value in QUALITIES for a written quality ('minor', 'Maj 7', ...), or None.
+    """
+    # A Quality compares by parsing the other side, so only plain strings go in the cache.
+    text = str(text)
+    try:
+        return PARSED_QUALITIES.get(text)
+    except KeyError:
+        pass
+
+    quality = QUALITIES.get(text.lower().strip().replace(' ', ''))
+    PARSED_QUALITIES.put(text, quality)
+    return quality
+
+
+#######################################################################
+def parse_name(text):
+    """
+    A ParsedName for a key or chord name, a root note and then a quality, or
+    None if `text` doesn't start with a note. Names have no octave.
+    """
+    try:
+        return PARSED_NAMES.get(text)
+    except KeyError:
+        pass
+
+    match = _get_patterns()['NAME_PATTERN'].match(text)
+    parsed = None
+    if match:
+        letter, accidental, quality = match.groups()
+        parsed = ParsedName(letter.upper(), _accidental(accidental), parse_quality(quality), None)
+    PARSED_NAMES.put(text, parsed)
+    return parsed
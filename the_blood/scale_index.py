@@ -0,0 +1,175 @@
+from .cache import LRUCache
+from .models import *
+
+
+#######################################################################
+class ScaleMatch:
+    """
+    One scale in a ScaleIndex's answer, with the numbers it was ranked by.
+
+        coverage: how much of the query (counting repeats) is in the scale, 0 to 1
+        spelling: how much of the query is in the scale spelled the same way
+        tonic: how much of the query is the scale's tonic
+        first: whether the query's first note is the scale's tonic
+    """
+    __slots__ = ('scale', 'coverage', 'spelling', 'tonic', 'first', '_rank')
+
+    ####################################################################
+    def __init__(self, scale, coverage, spelling, tonic, first, rank):
+        self.scale = scale
+        self.coverage = coverage
+        self.spelling = spelling
+        self.tonic = tonic
+        self.first = first
+        self._rank = rank
+
+    ####################################################################
+    def __repr__(self):
+        r = 'ScaleMatch({scale!r}, coverage={coverage:.2f}, spelling={spelling:.2f}, tonic={tonic:.2f})'
+        return r.format(scale=self.scale, coverage=self.coverage, spelling=self.spelling, tonic=self.tonic)
+
+
+#######################################################################
+class _Entry:
+    __slots__ = ('scale', 'mask', 'note_names', 'tonic', 'is_key', 'accidentals')
+
+    def __init__(self, scale, pitch_classes):
+        self.scale = scale
+        self.mask = pitch_classes.mask
+        self.note_names = frozenset(note.name for note in pitch_classes.spelling)
+        self.tonic = pitch_classes.spelling[0].pitch_class
+        self.is_key = isinstance(scale, Key)
+        self.accidentals = sum(len(note.name) - 1 for note in pitch_classes.spelling)
+
+
+#######################################################################
+class ScaleIndex:
+    """
+    A reverse index from pitch classes to every scale in SCALE_TO_INTERVALS_MAP
+    on every tonic: Keys for major and minor, Modes for the modes.
+
+    Scales are grouped by their 12-bit PitchClassSet mask (all 189 diatonic
+    scales share just 12), so answering a query is a handful of bitwise tests
+    against the groups before any scale is looked at.
+
+    Results are ScaleMatches ranked by, in order:
+        - coverage: the share of the query's notes the scale contains
+        - spelling: the share it contains spelled the same way (D# over Eb)
+        - tonic: the share of the query that is the scale's tonic
+        - first: whether the query starts on the scale's tonic
+        - keys (major and minor) before modes
+        - fewer sharps and flats
+    """
+
+    ####################################################################
+    def __init__(self, scale_names=None, tonics=None, answers_cache_size=1024):
+        scale_names = scale_names or tuple(SCALE_TO_INTERVALS_MAP)
+        tonics = tonics or tuple(Note(name + quality) for name in NATURAL_NOTES
+                                 for quality in (NATURAL, SHARP, FLAT))
+
+        self.entries = []
+        for scale_name in scale_names:
+            for tonic in tonics:
+                try:
+                    scale = self._build(tonic, scale_name)
+                except InvalidKeyError:
+                    # This tonic would need triple sharps or flats for this scale.
+                    continue
+                self.entries.append(_Entry(scale, scale.pitch_classes))
+
+        # {mask: {note names: [entries spelled with those names]}}
+        self.by_mask = {}
+        for entry in self.entries:
+            self.by_mask.setdefault(entry.mask, {}).setdefault(entry.note_names, []).append(entry)
+        self.masks = tuple(self.by_mask)
+
+        # Answers to recent queries, by their first note and the rest as a multiset.
+        self._answers = LRUCache(maxsize=answers_cache_size)
+
+    ####################################################################
+    @staticmethod
+    def _build(tonic, scale_name):
+        if scale_name == MAJOR_SCALE_NAME:
+            return Key(tonic.name)
+        elif scale_name == MINOR_SCALE_NAME:
+            return Key(tonic.name + MINOR)
+        return Mode(tonic, ScalePattern(scale_name))
+
+    ####################################################################
+    def __len__(self):
+        return len(self.entries)
+
+    ####################################################################
+    def _query(self, notes, complete):
+        notes = tuple(Note(note) for note in notes)
+        if not notes:
+            return []
+        key = (notes[0], tuple(sorted(note.name for note in notes)), complete)
+        try:
+            return list(self._answers.get(key))
+        except KeyError:
+            pass
+
+        total = len(notes)
+        spelled = {}
+        pitch_class_weights = [0] * PITCH_CLASS_COUNT
+        for note in notes:
+            spelled[note.name] = spelled.get(note.name, 0) + 1
+            pitch_class_weights[note.pitch_class] += 1
+        query_mask = PitchClassSet.from_notes(notes).mask
+        first = notes[0].pitch_class
+
+        matches = []
+        for mask in self.masks:
+            if complete and mask & query_mask != query_mask or not mask & query_mask:
+                continue
+            coverage = sum(w for pc, w in enumerate(pitch_class_weights) if mask >> pc & 1) / total
+            for note_names, entries in self.by_mask[mask].items():
+                spelling = sum(w for name, w in spelled.items() if name in note_names) / total
+                for entry in entries:
+                    tonic = pitch_class_weights[entry.tonic] / total
+                    is_first = first == entry.tonic
+                    rank = (-coverage, -spelling, -tonic, not is_first, not entry.is_key, entry.accidentals)
+                    matches.append(ScaleMatch(entry.scale, coverage, spelling, tonic, is_first, rank))
+        matches.sort(key=lambda match: match._rank)
+
+        self._answers.put(key, tuple(matches))
+        return matches
+
+    ####################################################################
+    def containing(self, notes):
+        """
+        Every scale with all of these notes in it, enharmonics included, best match first.
+        """
+        return self._query(notes, complete=True)
+
+    ####################################################################
+    def rank(self, notes, limit=None):
+        """
+        Every scale with any of these notes in it, best match first.
+        Repeated notes count more, so a melody's notes can be passed as they are.
+        """
+        matches = self._query(notes, complete=False)
+        return matches[:limit] if limit else matches
+
+    ####################################################################
+    def analyze(self, notes):
+        """
+        The Key or Mode that best fits these notes, or None if there are none.
+        """
+        matches = self._query(notes, complete=False)
+        return matches[0].scale if matches else None
+
+
+_scale_index = None
+
+
+#######################################################################
+def get_scale_index():
+    """
+    The ScaleIndex of every scale and tonic, built the first time it's asked for.
+    """
+    global _scale_index
+    if _scale_index is None:
+        _scale_index = ScaleIndex()
+    return _scale_index
@@ -0,0 +1,260 @@
+# Generated by `python -m the_blood.generate_scale_table`. Do not edit by hand.
+
+# (tonic, scale name): note names
+SCALE_NOTES = {
+    ('A', 'Major'): ('A', 'B', 'C#', 'D', 'E', 'F#', 'G#'),
+    ('A#', 'Major'): ('A#', 'B#', 'C##', 'D#', 'E#', 'F##', 'G##'),
+    ('Ab', 'Major'): ('Ab', 'Bb', 'C', 'Db', 'Eb', 'F', 'G'),
+    ('B', 'Major'): ('B', 'C#', 'D#', 'E', 'F#', 'G#', 'A#'),
+    ('B#', 'Major'): ('B#', 'C##', 'D##', 'E#', 'F##', 'G##', 'A##'),
+    ('Bb', 'Major'): ('Bb', 'C', 'D', 'Eb', 'F', 'G', 'A'),
+    ('C', 'Major'): ('C', 'D', 'E', 'F', 'G', 'A', 'B'),
+    ('C#', 'Major'): ('C#', 'D#', 'E#', 'F#', 'G#', 'A#', 'B#'),
+    ('Cb', 'Major'): ('Cb', 'Db', 'Eb', 'Fb', 'Gb', 'Ab', 'Bb'),
+    ('D', 'Major'): ('D', 'E', 'F#', 'G', 'A', 'B', 'C#'),
+    ('D#', 'Major'): ('D#', 'E#', 'F##', 'G#', 'A#', 'B#', 'C##'),
+    ('Db', 'Major'): ('Db', 'Eb', 'F', 'Gb', 'Ab', 'Bb', 'C'),
+    ('E', 'Major'): ('E', 'F#', 'G#', 'A', 'B', 'C#', 'D#'),
+    ('E#', 'Major'): ('E#', 'F##', 'G##', 'A#', 'B#', 'C##', 'D##'),
+    ('Eb', 'Major'): ('Eb', 'F', 'G', 'Ab', 'Bb', 'C', 'D'),
+    ('F', 'Major'): ('F', 'G', 'A', 'Bb', 'C', 'D', 'E'),
+    ('F#', 'Major'): ('F#', 'G#', 'A#', 'B', 'C#', 'D#', 'E#'),
+    ('Fb', 'Major'): ('Fb', 'Gb', 'Ab', 'Bbb', 'Cb', 'Db', 'Eb'),
+    ('G', 'Major'): ('G', 'A', 'B', 'C', 'D', 'E', 'F#'),
+    ('G#', 'Major'): ('G#', 'A#', 'B#', 'C#', 'D#', 'E#', 'F##'),
+    ('Gb', 'Major'): ('Gb', 'Ab', 'Bb', 'Cb', 'Db', 'Eb', 'F'),
+    ('A', 'Minor'): ('A', 'B', 'C', 'D', 'E', 'F', 'G'),
+    ('A#', 'Minor'): ('A#', 'B#', 'C#', 'D#', 'E#', 'F#', 'G#'),
+    ('Ab', 'Minor'): ('Ab', 'Bb', 'Cb', 'Db', 'Eb', 'Fb', 'Gb'),
+    ('B', 'Minor'): ('B', 'C#', 'D', 'E', 'F#', 'G', 'A'),
+    ('B#', 'Minor'): ('B#', 'C##', 'D#', 'E#', 'F##', 'G#', 'A#'),
+    ('Bb', 'Minor'): ('Bb', 'C', 'Db', 'Eb', 'F', 'Gb', 'Ab'),
+    ('C', 'Minor'): ('C', 'D', 'Eb', 'F', 'G', 'Ab', 'Bb'),
+    ('C#', 'Minor'): ('C#', 'D#', 'E', 'F#', 'G#', 'A', 'B'),
+    ('Cb', 'Minor'): ('Cb', 'Db', 'Ebb', 'Fb', 'Gb', 'Abb', 'Bbb'),
+    ('D', 'Minor'): ('D', 'E', 'F', 'G', 'A', 'Bb', 'C'),
+    ('D#', 'Minor'): ('D#', 'E#', 'F#', 'G#', 'A#', 'B', 'C#'),
+    ('Db', 'Minor'): ('Db', 'Eb', 'Fb', 'Gb', 'Ab', 'Bbb', 'Cb'),
+    ('E', 'Minor'): ('E', 'F#', 'G', 'A', 'B', 'C', 'D'),
+    ('E#', 'Minor'): ('E#', 'F##', 'G#', 'A#', 'B#', 'C#', 'D#'),
+    ('Eb', 'Minor'): ('Eb', 'F', 'Gb', 'Ab', 'Bb', 'Cb', 'Db'),
+    ('F', 'Minor'): ('F', 'G', 'Ab', 'Bb', 'C', 'Db', 'Eb'),
+    ('F#', 'Minor'): ('F#', 'G#', 'A', 'B', 'C#', 'D', 'E'),
+    ('Fb', 'Minor'): ('Fb', 'Gb', 'Abb', 'Bbb', 'Cb', 'Dbb', 'Ebb'),
+    ('G', 'Minor'): ('G', 'A', 'Bb', 'C', 'D', 'Eb', 'F'),
+    ('G#', 'Minor'): ('G#', 'A#', 'B', 'C#', 'D#', 'E', 'F#'),
+    ('Gb', 'Minor'): ('Gb', 'Ab', 'Bbb', 'Cb', 'Db', 'Ebb', 'Fb'),
+    ('A', 'Ionian'): ('A', 'B', 'C#', 'D', 'E', 'F#', 'G#'),
+    ('A#', 'Ionian'): ('A#', 'B#', 'C##', 'D#', 'E#', 'F##', 'G##'),
+    ('Ab', 'Ionian'): ('Ab', 'Bb', 'C', 'Db', 'Eb', 'F', 'G'),
+    ('B', 'Ionian'): ('B', 'C#', 'D#', 'E', 'F#', 'G#', 'A#'),
+    ('B#', 'Ionian'): ('B#', 'C##', 'D##', 'E#', 'F##', 'G##', 'A##'),
+    ('Bb', 'Ionian'): ('Bb', 'C', 'D', 'Eb', 'F', 'G', 'A'),
+    ('C', 'Ionian'): ('C', 'D', 'E', 'F', 'G', 'A', 'B'),
+    ('C#', 'Ionian'): ('C#', 'D#', 'E#', 'F#', 'G#', 'A#', 'B#'),
+    ('Cb', 'Ionian'): ('Cb', 'Db', 'Eb', 'Fb', 'Gb', 'Ab', 'Bb'),
+    ('D', 'Ionian'): ('D', 'E', 'F#', 'G', 'A', 'B', 'C#'),
+    ('D#', 'Ionian'): ('D#', 'E#', 'F##', 'G#', 'A#', 'B#', 'C##'),
+    ('Db', 'Ionian'): ('Db', 'Eb', 'F', 'Gb', 'Ab', 'Bb', 'C'),
+    ('E', 'Ionian'): ('E', 'F#', 'G#', 'A', 'B', 'C#', 'D#'),
+    ('E#', 'Ionian'): ('E#', 'F##', 'G##', 'A#', 'B#', 'C##', 'D##'),
+    ('Eb', 'Ionian'): ('Eb', 'F', 'G', 'Ab', 'Bb', 'C', 'D'),
+    ('F', 'Ionian'): ('F', 'G', 'A', 'Bb', 'C', 'D', 'E'),
+    ('F#', 'Ionian'): ('F#', 'G#', 'A#', 'B', 'C#', 'D#', 'E#'),
+    ('Fb', 'Ionian'): ('Fb', 'Gb', 'Ab', 'Bbb', 'Cb', 'Db', 'Eb'),
+    ('G', 'Ionian'): ('G', 'A', 'B', 'C', 'D', 'E', 'F#'),
+    ('G#', 'Ionian'): ('G#', 'A#', 'B#', 'C#', 'D#', 'E#', 'F##'),
+    ('Gb', 'Ionian'): ('Gb', 'Ab', 'Bb', 'Cb', 'Db', 'Eb', 'F'),
+    ('A', 'Dorian'): ('A', 'B', 'C', 'D', 'E', 'F#', 'G'),
+    ('A#', 'Dorian'): ('A#', 'B#', 'C#', 'D#', 'E#', 'F##', 'G#'),
+    ('Ab', 'Dorian'): ('Ab', 'Bb', 'Cb', 'Db', 'Eb', 'F', 'Gb'),
+    ('B', 'Dorian'): ('B', 'C#', 'D', 'E', 'F#', 'G#', 'A'),
+    ('B#', 'Dorian'): ('B#', 'C##', 'D#', 'E#', 'F##', 'G##', 'A#'),
+    ('Bb', 'Dorian'): ('Bb', 'C', 'Db', 'Eb', 'F', 'G', 'Ab'),
+    ('C', 'Dorian'): ('C', 'D', 'Eb', 'F', 'G', 'A', 'Bb'),
+    ('C#', 'Dorian'): ('C#', 'D#', 'E', 'F#', 'G#', 'A#', 'B'),
+    ('Cb', 'Dorian'): ('Cb', 'Db', 'Ebb', 'Fb', 'Gb', 'Ab', 'Bbb'),
+    ('D', 'Dorian'): ('D', 'E', 'F', 'G', 'A', 'B', 'C'),
+    ('D#', 'Dorian'): ('D#', 'E#', 'F#', 'G#', 'A#', 'B#', 'C#'),
+    ('Db', 'Dorian'): ('Db', 'Eb', 'Fb', 'Gb', 'Ab', 'Bb', 'Cb'),
+    ('E', 'Dorian'): ('E', 'F#', 'G', 'A', 'B', 'C#', 'D'),
+    ('E#', 'Dorian'): ('E#', 'F##', 'G#', 'A#', 'B#', 'C##', 'D#'),
+    ('Eb', 'Dorian'): ('Eb', 'F', 'Gb', 'Ab', 'Bb', 'C', 'Db'),
+    ('F', 'Dorian'): ('F', 'G', 'Ab', 'Bb', 'C', 'D', 'Eb'),
+    ('F#', 'Dorian'): ('F#', 'G#', 'A', 'B', 'C#', 'D#', 'E'),
+    ('Fb', 'Dorian'): ('Fb', 'Gb', 'Abb', 'Bbb', 'Cb', 'Db', 'Ebb'),
+    ('G', 'Dorian'): ('G', 'A', 'Bb', 'C', 'D', 'E', 'F'),
+    ('G#', 'Dorian'): ('G#', 'A#', 'B', 'C#', 'D#', 'E#', 'F#'),
+    ('Gb', 'Dorian'): ('Gb', 'Ab', 'Bbb', 'Cb', 'Db', 'Eb', 'Fb'),
+    ('A', 'Phrygian'): ('A', 'Bb', 'C', 'D', 'E', 'F', 'G'),
+    ('A#', 'Phrygian'): ('A#', 'B', 'C#', 'D#', 'E#', 'F#', 'G#'),
+    ('Ab', 'Phrygian'): ('Ab', 'Bbb', 'Cb', 'Db', 'Eb', 'Fb', 'Gb'),
+    ('B', 'Phrygian'): ('B', 'C', 'D', 'E', 'F#', 'G', 'A'),
+    ('B#', 'Phrygian'): ('B#', 'C#', 'D#', 'E#', 'F##', 'G#', 'A#'),
+    ('Bb', 'Phrygian'): ('Bb', 'Cb', 'Db', 'Eb', 'F', 'Gb', 'Ab'),
+    ('C', 'Phrygian'): ('C', 'Db', 'Eb', 'F', 'G', 'Ab', 'Bb'),
+    ('C#', 'Phrygian'): ('C#', 'D', 'E', 'F#', 'G#', 'A', 'B'),
+    ('Cb', 'Phrygian'): ('Cb', 'Dbb', 'Ebb', 'Fb', 'Gb', 'Abb', 'Bbb'),
+    ('D', 'Phrygian'): ('D', 'Eb', 'F', 'G', 'A', 'Bb', 'C'),
+    ('D#', 'Phrygian'): ('D#', 'E', 'F#', 'G#', 'A#', 'B', 'C#'),
+    ('Db', 'Phrygian'): ('Db', 'Ebb', 'Fb', 'Gb', 'Ab', 'Bbb', 'Cb'),
+    ('E', 'Phrygian'): ('E', 'F', 'G', 'A', 'B', 'C', 'D'),
+    ('E#', 'Phrygian'): ('E#', 'F#', 'G#', 'A#', 'B#', 'C#', 'D#'),
+    ('Eb', 'Phrygian'): ('Eb', 'Fb', 'Gb', 'Ab', 'Bb', 'Cb', 'Db'),
+    ('F', 'Phrygian'): ('F', 'Gb', 'Ab', 'Bb', 'C', 'Db', 'Eb'),
+    ('F#', 'Phrygian'): ('F#', 'G', 'A', 'B', 'C#', 'D', 'E'),
+    ('Fb', 'Phrygian'): ('Fb', 'Gbb', 'Abb', 'Bbb', 'Cb', 'Dbb', 'Ebb'),
+    ('G', 'Phrygian'): ('G', 'Ab', 'Bb', 'C', 'D', 'Eb', 'F'),
+    ('G#', 'Phrygian'): ('G#', 'A', 'B', 'C#', 'D#', 'E', 'F#'),
+    ('Gb', 'Phrygian'): ('Gb', 'Abb', 'Bbb', 'Cb', 'Db', 'Ebb', 'Fb'),
+    ('A', 'Lydian'): ('A', 'B', 'C#', 'D#', 'E', 'F#', 'G#'),
+    ('A#', 'Lydian'): ('A#', 'B#', 'C##', 'D##', 'E#', 'F##', 'G##'),
+    ('Ab', 'Lydian'): ('Ab', 'Bb', 'C', 'D', 'Eb', 'F', 'G'),
+    ('B', 'Lydian'): ('B', 'C#', 'D#', 'E#', 'F#', 'G#', 'A#'),
+    ('B#', 'Lydian'): ('B#', 'C##', 'D##', 'E##', 'F##', 'G##', 'A##'),
+    ('Bb', 'Lydian'): ('Bb', 'C', 'D', 'E', 'F', 'G', 'A'),
+    ('C', 'Lydian'): ('C', 'D', 'E', 'F#', 'G', 'A', 'B'),
+    ('C#', 'Lydian'): ('C#', 'D#', 'E#', 'F##', 'G#', 'A#', 'B#'),
+    ('Cb', 'Lydian'): ('Cb', 'Db', 'Eb', 'F', 'Gb', 'Ab', 'Bb'),
+    ('D', 'Lydian'): ('D', 'E', 'F#', 'G#', 'A', 'B', 'C#'),
+    ('D#', 'Lydian'): ('D#', 'E#', 'F##', 'G##', 'A#', 'B#', 'C##'),
+    ('Db', 'Lydian'): ('Db', 'Eb', 'F', 'G', 'Ab', 'Bb', 'C'),
+    ('E', 'Lydian'): ('E', 'F#', 'G#', 'A#', 'B', 'C#', 'D#'),
+    ('E#', 'Lydian'): ('E#', 'F##', 'G##', 'A##', 'B#', 'C##', 'D##'),
+    ('Eb', 'Lydian'): ('Eb', 'F', 'G', 'A', 'Bb', 'C', 'D'),
+    ('F', 'Lydian'): ('F', 'G', 'A', 'B', 'C', 'D', 'E'),
+    ('F#', 'Lydian'): ('F#', 'G#', 'A#', 'B#', 'C#', 'D#', 'E#'),
+    ('Fb', 'Lydian'): ('Fb', 'Gb', 'Ab', 'Bb', 'Cb', 'Db', 'Eb'),
+    ('G', 'Lydian'): ('G', 'A', 'B', 'C#', 'D', 'E', 'F#'),
+    ('G#', 'Lydian'): ('G#', 'A#', 'B#', 'C##', 'D#', 'E#', 'F##'),
+    ('Gb', 'Lydian'): ('Gb', 'Ab', 'Bb', 'C', 'Db', 'Eb', 'F'),
+    ('A', 'Mixolydian'): ('A', 'B', 'C#', 'D', 'E', 'F#', 'G'),
+    ('A#', 'Mixolydian'): ('A#', 'B#', 'C##', 'D#', 'E#', 'F##', 'G#'),
+    ('Ab', 'Mixolydian'): ('Ab', 'Bb', 'C', 'Db', 'Eb', 'F', 'Gb'),
+    ('B', 'Mixolydian'): ('B', 'C#', 'D#', 'E', 'F#', 'G#', 'A'),
+    ('B#', 'Mixolydian'): ('B#', 'C##', 'D##', 'E#', 'F##', 'G##', 'A#'),
+    ('Bb', 'Mixolydian'): ('Bb', 'C', 'D', 'Eb', 'F', 'G', 'Ab'),
+    ('C', 'Mixolydian'): ('C', 'D', 'E', 'F', 'G', 'A', 'Bb'),
+    ('C#', 'Mixolydian'): ('C#', 'D#', 'E#', 'F#', 'G#', 'A#', 'B'),
+    ('Cb', 'Mixolydian'): ('Cb', 'Db', 'Eb', 'Fb', 'Gb', 'Ab', 'Bbb'),
+    ('D', 'Mixolydian'): ('D', 'E', 'F#', 'G', 'A', 'B', 'C'),
+    ('D#', 'Mixolydian'): ('D#', 'E#', 'F##', 'G#', 'A#', 'B#', 'C#'),
+    ('Db', 'Mixolydian'): ('Db', 'Eb', 'F', 'Gb', 'Ab', 'Bb', 'Cb'),
+    ('E', 'Mixolydian'): ('E', 'F#', 'G#', 'A', 'B', 'C#', 'D'),
+    ('E#', 'Mixolydian'): ('E#', 'F##', 'G##', 'A#', 'B#', 'C##', 'D#'),
+    ('Eb', 'Mixolydian'): ('Eb', 'F', 'G', 'Ab', 'Bb', 'C', 'Db'),
+    ('F', 'Mixolydian'): ('F', 'G', 'A', 'Bb', 'C', 'D', 'Eb'),
+    ('F#', 'Mixolydian'): ('F#', 'G#', 'A#', 'B', 'C#', 'D#', 'E'),
+    ('Fb', 'Mixolydian'): ('Fb', 'Gb', 'Ab', 'Bbb', 'Cb', 'Db', 'Ebb'),
+    ('G', 'Mixolydian'): ('G', 'A', 'B', 'C', 'D', 'E', 'F'),
+    ('G#', 'Mixolydian'): ('G#', 'A#', 'B#', 'C#', 'D#', 'E#', 'F#'),
+    ('Gb', 'Mixolydian'): ('Gb', 'Ab', 'Bb', 'Cb', 'Db', 'Eb', 'Fb'),
+    ('A', 'Aeolian'): ('A', 'B', 'C', 'D', 'E', 'F', 'G'),
+    ('A#', 'Aeolian'): ('A#', 'B#', 'C#', 'D#', 'E#', 'F#', 'G#'),
+    ('Ab', 'Aeolian'): ('Ab', 'Bb', 'Cb', 'Db', 'Eb', 'Fb', 'Gb'),
+    ('B', 'Aeolian'): ('B', 'C#', 'D', 'E', 'F#', 'G', 'A'),
+    ('B#', 'Aeolian'): ('B#', 'C##', 'D#', 'E#', 'F##', 'G#', 'A#'),
+    ('Bb', 'Aeolian'): ('Bb', 'C', 'Db', 'Eb', 'F', 'Gb', 'Ab'),
+    ('C', 'Aeolian'): ('C', 'D', 'Eb', 'F', 'G', 'Ab', 'Bb'),
+    ('C#', 'Aeolian'): ('C#', 'D#', 'E', 'F#', 'G#', 'A', 'B'),
+    ('Cb', 'Aeolian'): ('Cb', 'Db', 'Ebb', 'Fb', 'Gb', 'Abb', 'Bbb'),
+    ('D', 'Aeolian'): ('D', 'E', 'F', 'G', 'A', 'Bb', 'C'),
+    ('D#', 'Aeolian'): ('D#', 'E#', 'F#', 'G#', 'A#', 'B', 'C#'),
+    ('Db', 'Aeolian'): ('Db', 'Eb', 'Fb', 'Gb', 'Ab', 'Bbb', 'Cb'),
+    ('E', 'Aeolian'): ('E', 'F#', 'G', 'A', 'B', 'C', 'D'),
+    ('E#', 'Aeolian'): ('E#', 'F##', 'G#', 'A#', 'B#', 'C#', 'D#'),
+    ('Eb', 'Aeolian'): ('Eb', 'F', 'Gb', 'Ab', 'Bb', 'Cb', 'Db'),
+    ('F', 'Aeolian'): ('F', 'G', 'Ab', 'Bb', 'C', 'Db', 'Eb'),
+    ('F#', 'Aeolian'): ('F#', 'G#', 'A', 'B', 'C#', 'D', 'E'),
+    ('Fb', 'Aeolian'): ('Fb', 'Gb', 'Abb', 'Bbb', 'Cb', 'Dbb', 'Ebb'),
+    ('G', 'Aeolian'): ('G', 'A', 'Bb', 'C', 'D', 'Eb', 'F'),
+    ('G#', 'Aeolian'): ('G#', 'A#', 'B', 'C#', 'D#', 'E', 'F#'),
+    ('Gb', 'Aeolian'): ('Gb', 'Ab', 'Bbb', 'Cb', 'Db', 'Ebb', 'Fb'),
+    ('A', 'Locrian'): ('A', 'Bb', 'C', 'D', 'Eb', 'F', 'G'),
+    ('A#', 'Locrian'): ('A#', 'B', 'C#', 'D#', 'E', 'F#', 'G#'),
+    ('Ab', 'Locrian'): ('Ab', 'Bbb', 'Cb', 'Db', 'Ebb', 'Fb', 'Gb'),
+    ('B', 'Locrian'): ('B', 'C', 'D', 'E', 'F', 'G', 'A'),
+    ('B#', 'Locrian'): ('B#', 'C#', 'D#', 'E#', 'F#', 'G#', 'A#'),
+    ('Bb', 'Locrian'): ('Bb', 'Cb', 'Db', 'Eb', 'Fb', 'Gb', 'Ab'),
+    ('C', 'Locrian'): ('C', 'Db', 'Eb', 'F', 'Gb', 'Ab', 'Bb'),
+    ('C#', 'Locrian'): ('C#', 'D', 'E', 'F#', 'G', 'A', 'B'),
+    ('Cb', 'Locrian'): ('Cb', 'Dbb', 'Ebb', 'Fb', 'Gbb', 'Abb', 'Bbb'),
+    ('D', 'Locrian'): ('D', 'Eb', 'F', 'G', 'Ab', 'Bb', 'C'),
+    ('D#', 'Locrian'): ('D#', 'E', 'F#', 'G#', 'A', 'B', 'C#'),
+    ('Db', 'Locrian'): ('Db', 'Ebb', 'Fb', 'Gb', 'Abb', 'Bbb', 'Cb'),
+    ('E', 'Locrian'): ('E', 'F', 'G', 'A', 'Bb', 'C', 'D'),
+    ('E#', 'Locrian'): ('E#', 'F#', 'G#', 'A#', 'B', 'C#', 'D#'),
+    ('Eb', 'Locrian'): ('Eb', 'Fb', 'Gb', 'Ab', 'Bbb', 'Cb', 'Db'),
+    ('F', 'Locrian'): ('F', 'Gb', 'Ab', 'Bb', 'Cb', 'Db', 'Eb'),
+    ('F#', 'Locrian'): ('F#', 'G', 'A', 'B', 'C', 'D', 'E'),
+    ('Fb', 'Locrian'): ('Fb', 'Gbb', 'Abb', 'Bbb', 'Cbb', 'Dbb', 'Ebb'),
+    ('G', 'Locrian'): ('G', 'Ab', 'Bb', 'C', 'Db', 'Eb', 'F'),
+    ('G#', 'Locrian'): ('G#', 'A', 'B', 'C#', 'D', 'E', 'F#'),
+    ('Gb', 'Locrian'): ('Gb', 'Abb', 'Bbb', 'Cb', 'Dbb', 'Ebb', 'Fb'),
+}
+
+RELATIVE_KEYS = {
+    'C': 'Am',
+    'G': 'Em',
+    'D': 'Bm',
+    'A': 'F#m',
+    'E': 'C#m',
+    'B': 'G#m',
+    'F#': 'D#m',
+    'C#': 'A#m',
+    'F': 'Dm',
+    'Bb': 'Gm',
+    'Eb': 'Cm',
+    'Ab': 'Fm',
+    'Db': 'Bbm',
+    'Gb': 'Ebm',
+    'Cb': 'Abm',
+    'Am': 'C',
+    'Em': 'G',
+    'Bm': 'D',
+    'F#m': 'A',
+    'C#m': 'E',
+    'G#m': 'B',
+    'D#m': 'F#',
+    'A#m': 'C#',
+    'Dm': 'F',
+    'Gm': 'Bb',
+    'Cm': 'Eb',
+    'Fm': 'Ab',
+    'Bbm': 'Db',
+    'Ebm': 'Gb',
+    'Abm': 'Cb',
+}
+
+PARALLEL_KEYS = {
+    'C': 'Cm',
+    'G': 'Gm',
+    'D': 'Dm',
+    'A': 'Am',
+    'E': 'Em',
+    'B': 'Bm',
+    'F#': 'F#m',
+    'C#': 'C#m',
+    'F': 'Fm',
+    'Bb': 'Bbm',
+    'Eb': 'Ebm',
+    'Ab': 'Abm',
+    'Db': 'Dbm',
+    'Gb': 'Gbm',
+    'Cb': 'Cbm',
+    'Am': 'A',
+    'Em': 'E',
+    'Bm': 'B',
+    'F#m': 'F#',
+    'C#m': 'C#',
+    'G#m': 'G#',
+    'D#m': 'D#',
+    'A#m': 'A#',
+    'Dm': 'D',
+    'Gm': 'G',
+    'Cm': 'C',
+    'Fm': 'F',
+    'Bbm': 'Bb',
+    'Ebm': 'Eb',
+    'Abm': 'Ab',
+}